@@ -0,0 +1,72 @@
+import queue
+import threading
+from typing import Callable, Optional
+
+
+class AsynchronousOutputWriter:
+    """
+    Writer thread which executes output write tasks in the background, such that the time loop is not blocked by
+    encoding the output and writing it to disk. The tasks are executed in the order in which they are submitted. The
+    queue of pending tasks is bounded, submitting a task blocks while the queue is full.
+
+    Attributes:
+        - __queue (queue.Queue): queue of pending write tasks
+        - __exception (Optional[Exception]): the first exception raised by a write task
+        - __thread (threading.Thread): the writer thread
+    """
+
+    def __init__(self, queue_size: int):
+        """
+        Constructor of the AsynchronousOutputWriter, the writer thread is started directly.
+
+        Args:
+            - queue_size (int): maximum number of pending write tasks
+        """
+        if queue_size < 1:
+            raise ValueError(f"The queue size of the asynchronous output writer should be at least 1, "
+                             f"but is: {queue_size}")
+
+        self.__queue = queue.Queue(maxsize=queue_size)
+        self.__exception: Optional[Exception] = None
+        self.__thread = threading.Thread(target=self.__run, daemon=True)
+        self.__thread.start()
+
+    def submit(self, task: Callable[[], None]):
+        """
+        Submits a write task to the writer thread. This blocks while the queue of pending tasks is full.
+
+        Args:
+            - task (Callable[[], None]): the write task
+        """
+        self.__raise_exception()
+        self.__queue.put(task)
+
+    def close(self):
+        """
+        Executes all pending write tasks and stops the writer thread.
+        """
+        self.__queue.put(None)
+        self.__thread.join()
+        self.__raise_exception()
+
+    def __run(self):
+        """
+        Executes the write tasks until the writer is closed. After a failed task, the remaining tasks are skipped.
+        """
+        while True:
+            task = self.__queue.get()
+            if task is None:
+                return
+            if self.__exception is not None:
+                continue
+            try:
+                task()
+            except Exception as exception:
+                self.__exception = exception
+
+    def __raise_exception(self):
+        """
+        Raises the exception of a failed write task in the calling thread.
+        """
+        if self.__exception is not None:
+            raise RuntimeError("Writing the output in the background failed") from self.__exception
@@ -0,0 +1,229 @@
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import orjson
+
+# available binary output formats
+BINARY_OUTPUT_FORMATS = ["npy", "npz"]
+
+# available floating point precisions of the binary output
+BINARY_OUTPUT_PRECISIONS = {"float64": np.float64, "float32": np.float32}
+
+# separator between the entity group and the series name in the binary array names, e.g. "NODE.VELOCITY_X"
+SEPARATOR = "."
+
+# key of the output times of decimated series, which are written less often than the other series
+VARIABLE_TIME = "VARIABLE_TIME"
+
+
+def get_binary_output_path(output_file_name: str, output_format: str) -> Path:
+    """
+    Returns the path of the binary output, based on the name of the json output file. The npz format is written to a
+    single file with the ".npz" suffix, the npy format is written to a directory with the name of the output file
+    without suffix.
+
+    Args:
+        - output_file_name (str): name of the json output file
+        - output_format (str): binary output format, "npy" or "npz"
+
+    Returns:
+        - Path: path of the binary output
+    """
+    if output_format == "npz":
+        return Path(output_file_name).with_suffix(".npz")
+    elif output_format == "npy":
+        return Path(output_file_name).with_suffix("")
+    else:
+        raise ValueError(f"Output format: {output_format} is not a binary output format, available formats are: "
+                         f"{BINARY_OUTPUT_FORMATS}")
+
+
+def get_entity_group(entity_key: str) -> str:
+    """
+    Returns the group of an entity in the output data, i.e. "NODE" for "NODE_1", "ELEMENT" for "ELEMENT_1" and
+    "PROBE" for "PROBE_1". Other entities, e.g. "RESULTANT", form their own group.
+
+    Args:
+        - entity_key (str): key of the entity in the output data
+
+    Returns:
+        - str: group of the entity
+    """
+    for group in ["NODE", "ELEMENT", "PROBE"]:
+        if entity_key.startswith(group + "_"):
+            return group
+    return entity_key
+
+
+def convert_output_data_to_arrays(data: dict, dtype: type = np.float64) -> Dict[str, np.ndarray]:
+    """
+    Converts the output data, in the layout of the json output, to contiguous numeric arrays. Per entity group and
+    series, one array is created with the entities as first dimension. Nodal series have the shape
+    (n_entities, n_time), gauss point series have the shape (n_entities, n_gauss_points, n_time). Series which contain
+    a list per output step get an extra last dimension. The keys of the entities are stored in "<GROUP>.KEYS" and the
+    names of the gauss point series in "<GROUP>.GAUSS_POINT_SERIES". The output times of decimated series are stored
+    in "VARIABLE_TIME.<SERIES>".
+
+    Args:
+        - data (dict): output data in the layout of the json output
+        - dtype (type): floating point type of the arrays
+
+    Returns:
+        - Dict[str, np.ndarray]: dictionary of arrays
+    """
+
+    arrays = {"TIME": np.asarray(data["TIME"], dtype=dtype)}
+    for series_name, time in data.get(VARIABLE_TIME, {}).items():
+        arrays[VARIABLE_TIME + SEPARATOR + series_name] = np.asarray(time, dtype=dtype)
+
+    # collect the entities and series per group
+    group_keys: Dict[str, List[str]] = {}
+    group_series: Dict[str, Dict[str, list]] = {}
+    group_gauss_point_series: Dict[str, List[str]] = {}
+    for entity_key, entity_data in data.items():
+        if entity_key in ["TIME", VARIABLE_TIME]:
+            continue
+        group = get_entity_group(entity_key)
+        group_keys.setdefault(group, []).append(entity_key)
+        gauss_point_series = group_gauss_point_series.setdefault(group, [])
+
+        series = group_series.setdefault(group, {})
+        for series_name, values in entity_data.items():
+            if isinstance(values, dict):
+                # gauss point values are stored per integration point
+                values = [values[gp] for gp in sorted(values.keys(), key=int)]
+                if series_name not in gauss_point_series:
+                    gauss_point_series.append(series_name)
+            series.setdefault(series_name, []).append(values)
+
+    for group, keys in group_keys.items():
+        arrays[group + SEPARATOR + "KEYS"] = np.asarray(keys, dtype=str)
+        arrays[group + SEPARATOR + "GAUSS_POINT_SERIES"] = np.asarray(group_gauss_point_series[group], dtype=str)
+        for series_name, values in group_series[group].items():
+            try:
+                arrays[group + SEPARATOR + series_name] = np.asarray(values, dtype=dtype)
+            except ValueError as error:
+                raise ValueError(f"Series: {series_name} of group: {group} cannot be written as a numeric array, "
+                                 f"all entities require the same number of integration points and components") \
+                    from error
+
+    return arrays
+
+
+def convert_arrays_to_output_data(arrays: Dict[str, np.ndarray]) -> dict:
+    """
+    Converts the numeric arrays of the binary output back to the layout of the json output.
+
+    Args:
+        - arrays (Dict[str, np.ndarray]): dictionary of arrays, as created by :func:`convert_output_data_to_arrays`
+
+    Returns:
+        - dict: output data in the layout of the json output
+    """
+    data = {"TIME": np.asarray(arrays["TIME"]).tolist()}
+
+    variable_time_names = [name for name in arrays.keys() if name.startswith(VARIABLE_TIME + SEPARATOR)]
+    if len(variable_time_names) > 0:
+        data[VARIABLE_TIME] = {name.split(SEPARATOR, 1)[1]: np.asarray(arrays[name]).tolist()
+                               for name in variable_time_names}
+
+    groups = [name[:-len(SEPARATOR + "KEYS")] for name in arrays.keys() if name.endswith(SEPARATOR + "KEYS")]
+    for group in groups:
+        keys = np.asarray(arrays[group + SEPARATOR + "KEYS"]).tolist()
+        gauss_point_series = np.asarray(arrays[group + SEPARATOR + "GAUSS_POINT_SERIES"]).tolist()
+        for key in keys:
+            data[key] = {}
+
+        metadata_names = [group + SEPARATOR + "KEYS", group + SEPARATOR + "GAUSS_POINT_SERIES"]
+        series_names = [name.split(SEPARATOR, 1)[1] for name in arrays.keys()
+                        if name.startswith(group + SEPARATOR) and name not in metadata_names]
+        for series_name in series_names:
+            values = np.asarray(arrays[group + SEPARATOR + series_name])
+            for entity_index, key in enumerate(keys):
+                if series_name in gauss_point_series:
+                    data[key][series_name] = {str(gp): gp_values.tolist()
+                                              for gp, gp_values in enumerate(values[entity_index])}
+                else:
+                    data[key][series_name] = values[entity_index].tolist()
+
+    return data
+
+
+def write_binary_output(output_path: Path, data: dict, output_format: str, precision: str = "float64"):
+    """
+    Writes the output data as contiguous numeric arrays, see :func:`write_binary_arrays`.
+
+    Args:
+        - output_path (Path): path of the binary output, see :func:`get_binary_output_path`
+        - data (dict): output data in the layout of the json output
+        - output_format (str): binary output format, "npy" or "npz"
+        - precision (str): floating point precision of the output, "float64" or "float32"
+    """
+    write_binary_arrays(output_path, convert_output_data_to_arrays(data), output_format, precision)
+
+
+def write_binary_arrays(output_path: Path, arrays: Dict[str, np.ndarray], output_format: str,
+                        precision: str = "float64"):
+    """
+    Writes numeric output arrays. The npz format writes all arrays to a single bundle, the npy format writes each
+    array to a separate .npy file in the output directory, such that the arrays can be memory mapped while reading.
+
+    Args:
+        - output_path (Path): path of the binary output, see :func:`get_binary_output_path`
+        - arrays (Dict[str, np.ndarray]): output arrays, as created by :func:`convert_output_data_to_arrays`
+        - output_format (str): binary output format, "npy" or "npz"
+        - precision (str): floating point precision of the output, "float64" or "float32"
+    """
+    if precision not in BINARY_OUTPUT_PRECISIONS:
+        raise ValueError(f"Precision: {precision} is not supported, available precisions are: "
+                         f"{list(BINARY_OUTPUT_PRECISIONS.keys())}")
+
+    dtype = BINARY_OUTPUT_PRECISIONS[precision]
+    arrays = {name: values.astype(dtype) if values.dtype.kind == "f" else values for name, values in arrays.items()}
+
+    if output_format == "npz":
+        np.savez(output_path, **arrays)
+    elif output_format == "npy":
+        os.makedirs(output_path, exist_ok=True)
+        for name, values in arrays.items():
+            np.save(Path(output_path) / (name + ".npy"), values)
+    else:
+        raise ValueError(f"Output format: {output_format} is not a binary output format, available formats are: "
+                         f"{BINARY_OUTPUT_FORMATS}")
+
+
+def read_binary_output(output_path: Path, mmap_mode: Optional[str] = None) -> Dict[str, np.ndarray]:
+    """
+    Reads the numeric arrays of a binary output. The format is derived from the path, a directory is read as npy
+    output, a file as npz output.
+
+    Args:
+        - output_path (Path): path of the binary output
+        - mmap_mode (str): memory map mode used for reading npy files, None reads the arrays into memory
+
+    Returns:
+        - Dict[str, np.ndarray]: dictionary of arrays
+    """
+    output_path = Path(output_path)
+    if output_path.is_dir():
+        return {file.stem: np.load(file, mmap_mode=mmap_mode) for file in sorted(output_path.glob("*.npy"))}
+
+    with np.load(output_path) as bundle:
+        return {name: bundle[name] for name in bundle.files}
+
+
+def convert_binary_output_to_json(output_path: Path, json_file_name: str):
+    """
+    Converts a binary output to a json file with the layout of the json output, such that existing tooling can be
+    used.
+
+    Args:
+        - output_path (Path): path of the binary output
+        - json_file_name (str): name of the json file to be written
+    """
+    data = convert_arrays_to_output_data(read_binary_output(output_path))
+
+    with open(json_file_name, 'wb') as outfile:
+        outfile.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
@@ -0,0 +1,308 @@
+import io
+import lzma
+import struct
+import zlib
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+import numpy as np
+import orjson
+
+from KratosMultiphysics.StemApplication.binary_output_utilities import (BINARY_OUTPUT_PRECISIONS, SEPARATOR,
+                                                                        VARIABLE_TIME, convert_arrays_to_output_data)
+
+# output format of the compressed, chunked container
+CHUNKED_OUTPUT_FORMAT = "chunked"
+
+# available compressions of the chunks, with their identifier in the file header
+CHUNK_COMPRESSIONS = {"zlib": 1, "lzma": 2}
+
+# identification of the container at the start of the file, version 2 stores the output times of each chunk
+# uncompressed after the chunk header
+CONTAINER_MAGIC = b"STEMCHUNKS"
+CONTAINER_VERSION = 2
+
+# file header: magic, version and compression identifier
+FILE_HEADER = struct.Struct("<10sBB")
+
+# chunk header: first output time, last output time, number of output steps and size of the compressed chunk. The
+# header is followed by the output times of the chunk and the compressed chunk
+CHUNK_HEADER = struct.Struct("<ddIQ")
+
+# data type of the uncompressed output times of a chunk
+CHUNK_TIME_DTYPE = np.dtype("<f8")
+
+
+class ChunkIndexEntry(NamedTuple):
+    """
+    Location and time range of a chunk in a compressed output container.
+
+    Attributes:
+        - start_time (float): first output time in the chunk
+        - end_time (float): last output time in the chunk
+        - n_steps (int): number of output steps in the chunk
+        - time_offset (int): position of the uncompressed output times of the chunk in the file
+        - offset (int): position of the compressed chunk in the file
+        - size (int): size of the compressed chunk in bytes
+    """
+    start_time: float
+    end_time: float
+    n_steps: int
+    time_offset: int
+    offset: int
+    size: int
+
+
+def get_chunked_output_path(output_file_name: str) -> Path:
+    """
+    Returns the path of the compressed output container, based on the name of the json output file.
+
+    Args:
+        - output_file_name (str): name of the json output file
+
+    Returns:
+        - Path: path of the compressed output container
+    """
+    return Path(output_file_name).with_suffix(".chunks")
+
+
+def create_compressed_output(output_path: Path, compression: str):
+    """
+    Creates an empty compressed output container, an existing container is overwritten.
+
+    Args:
+        - output_path (Path): path of the container
+        - compression (str): compression of the chunks, "zlib" or "lzma"
+    """
+    if compression not in CHUNK_COMPRESSIONS:
+        raise ValueError(f"Compression: {compression} is not supported, available compressions are: "
+                         f"{list(CHUNK_COMPRESSIONS.keys())}")
+
+    with open(output_path, "wb") as container:
+        container.write(FILE_HEADER.pack(CONTAINER_MAGIC, CONTAINER_VERSION, CHUNK_COMPRESSIONS[compression]))
+
+
+def append_compressed_chunk(output_path: Path, arrays: Dict[str, np.ndarray], compression_level: int = 6,
+                            precision: str = "float64"):
+    """
+    Compresses the output arrays of a number of output steps and appends them as a chunk to the container. The output
+    times are also stored uncompressed, such that they can be read without decompressing the chunk. The previously
+    written chunks are not touched.
+
+    Args:
+        - output_path (Path): path of the container, see :func:`create_compressed_output`
+        - arrays (Dict[str, np.ndarray]): output arrays of the output steps in the chunk, in the layout of the binary
+          output
+        - compression_level (int): compression level, from 0 to 9
+        - precision (str): floating point precision of the output, "float64" or "float32"
+    """
+    if precision not in BINARY_OUTPUT_PRECISIONS:
+        raise ValueError(f"Precision: {precision} is not supported, available precisions are: "
+                         f"{list(BINARY_OUTPUT_PRECISIONS.keys())}")
+
+    time = np.asarray(arrays["TIME"])
+    if len(time) == 0:
+        return
+
+    dtype = BINARY_OUTPUT_PRECISIONS[precision]
+    buffer = io.BytesIO()
+    np.savez(buffer, **{name: values.astype(dtype) if values.dtype.kind == "f" else values
+                        for name, values in arrays.items()})
+
+    with open(output_path, "r+b") as container:
+        compression = _read_compression(container, output_path)
+        if compression == "zlib":
+            chunk = zlib.compress(buffer.getvalue(), compression_level)
+        else:
+            chunk = lzma.compress(buffer.getvalue(), preset=compression_level)
+
+        container.seek(0, io.SEEK_END)
+        container.write(CHUNK_HEADER.pack(time[0], time[-1], len(time), len(chunk)))
+        # the times are stored with the precision of the output, such that they equal the times in the chunk
+        container.write(time.astype(dtype).astype(CHUNK_TIME_DTYPE).tobytes())
+        container.write(chunk)
+
+
+def read_chunk_index(output_path: Path) -> List[ChunkIndexEntry]:
+    """
+    Reads the index of the chunks in a compressed output container, only the chunk headers are read. An incomplete
+    last chunk, e.g. of an interrupted calculation, is ignored.
+
+    Args:
+        - output_path (Path): path of the container
+
+    Returns:
+        - List[ChunkIndexEntry]: the chunks in the container
+    """
+    index = []
+    with open(output_path, "rb") as container:
+        _read_compression(container, output_path)
+        file_size = container.seek(0, io.SEEK_END)
+        offset = FILE_HEADER.size
+
+        while offset + CHUNK_HEADER.size <= file_size:
+            container.seek(offset)
+            start_time, end_time, n_steps, size = CHUNK_HEADER.unpack(container.read(CHUNK_HEADER.size))
+            time_offset = offset + CHUNK_HEADER.size
+            offset = time_offset + n_steps * CHUNK_TIME_DTYPE.itemsize
+            if offset + size > file_size:
+                break
+            index.append(ChunkIndexEntry(start_time, end_time, n_steps, time_offset, offset, size))
+            offset += size
+
+    return index
+
+
+def read_compressed_output_time(output_path: Path) -> np.ndarray:
+    """
+    Reads the output times of a compressed output container. Only the uncompressed times of the chunks are read, no
+    chunk is decompressed.
+
+    Args:
+        - output_path (Path): path of the container
+
+    Returns:
+        - np.ndarray: the output times
+    """
+    index = read_chunk_index(output_path)
+    with open(output_path, "rb") as container:
+        times = []
+        for entry in index:
+            container.seek(entry.time_offset)
+            times.append(np.frombuffer(container.read(entry.n_steps * CHUNK_TIME_DTYPE.itemsize),
+                                       dtype=CHUNK_TIME_DTYPE))
+
+    return np.concatenate(times) if len(times) > 0 else np.empty(0)
+
+
+def read_compressed_output(output_path: Path, start_time: Optional[float] = None,
+                           end_time: Optional[float] = None) -> Dict[str, np.ndarray]:
+    """
+    Reads the output arrays of a compressed output container. Only the chunks which overlap the requested time range
+    are decompressed.
+
+    Args:
+        - output_path (Path): path of the container
+        - start_time (Optional[float]): first output time to be read, None reads from the start
+        - end_time (Optional[float]): last output time to be read, None reads until the end
+
+    Returns:
+        - Dict[str, np.ndarray]: the output arrays within the time range, in the layout of the binary output
+    """
+    lower = -np.inf if start_time is None else start_time
+    upper = np.inf if end_time is None else end_time
+
+    chunks = []
+    with open(output_path, "rb") as container:
+        compression = _read_compression(container, output_path)
+        for entry in read_chunk_index(output_path):
+            if entry.end_time < lower or entry.start_time > upper:
+                continue
+            container.seek(entry.offset)
+            chunk = container.read(entry.size)
+            data = zlib.decompress(chunk) if compression == "zlib" else lzma.decompress(chunk)
+            with np.load(io.BytesIO(data)) as bundle:
+                chunks.append({name: bundle[name] for name in bundle.files})
+
+    if len(chunks) == 0:
+        return {"TIME": np.empty(0)}
+
+    arrays = _concatenate_chunks(chunks)
+
+    # select the output steps within the time range, decimated series are selected on their own output times
+    is_in_range = (arrays["TIME"] >= lower) & (arrays["TIME"] <= upper)
+    arrays["TIME"] = arrays["TIME"][is_in_range]
+    for name in list(arrays.keys()):
+        group, _, series_name = name.partition(SEPARATOR)
+        if group in ["TIME", VARIABLE_TIME] or series_name in ["KEYS", "GAUSS_POINT_SERIES"]:
+            continue
+
+        variable_time_name = VARIABLE_TIME + SEPARATOR + series_name
+        if variable_time_name in arrays:
+            variable_time = arrays[variable_time_name]
+            is_series_in_range = (variable_time >= lower) & (variable_time <= upper)
+        else:
+            is_series_in_range = is_in_range
+
+        time_axis = 2 if series_name in arrays[group + SEPARATOR + "GAUSS_POINT_SERIES"] else 1
+        arrays[name] = np.compress(is_series_in_range, arrays[name], axis=time_axis)
+
+    for name in [name for name in arrays.keys() if name.startswith(VARIABLE_TIME + SEPARATOR)]:
+        arrays[name] = arrays[name][(arrays[name] >= lower) & (arrays[name] <= upper)]
+
+    return arrays
+
+
+def convert_compressed_output_to_json(output_path: Path, json_file_name: str, start_time: Optional[float] = None,
+                                      end_time: Optional[float] = None):
+    """
+    Converts (a time range of) a compressed output container to a json file with the layout of the json output, such
+    that existing tooling can be used.
+
+    Args:
+        - output_path (Path): path of the container
+        - json_file_name (str): name of the json file to be written
+        - start_time (Optional[float]): first output time to be converted, None converts from the start
+        - end_time (Optional[float]): last output time to be converted, None converts until the end
+    """
+    data = convert_arrays_to_output_data(read_compressed_output(output_path, start_time, end_time))
+
+    with open(json_file_name, 'wb') as outfile:
+        outfile.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+
+def _concatenate_chunks(chunks: List[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+    """
+    Concatenates the output arrays of consecutive chunks along the time axis. The keys of the entities and the names
+    of the gauss point series are taken from the first chunk.
+
+    Args:
+        - chunks (List[Dict[str, np.ndarray]]): the output arrays per chunk
+
+    Returns:
+        - Dict[str, np.ndarray]: the concatenated output arrays
+    """
+    arrays = {}
+    for name, values in chunks[0].items():
+        group, _, series_name = name.partition(SEPARATOR)
+        if group in ["TIME", VARIABLE_TIME]:
+            time_axis = 0
+        elif series_name in ["KEYS", "GAUSS_POINT_SERIES"]:
+            arrays[name] = values
+            continue
+        else:
+            time_axis = 2 if series_name in chunks[0][group + SEPARATOR + "GAUSS_POINT_SERIES"] else 1
+
+        arrays[name] = np.concatenate([chunk[name] for chunk in chunks], axis=time_axis)
+
+    return arrays
+
+
+def _read_compression(container, output_path: Path) -> str:
+    """
+    Reads the file header of a compressed output container and returns the compression of the chunks.
+
+    Args:
+        - container (BinaryIO): the opened container
+        - output_path (Path): path of the container, used in the error message
+
+    Returns:
+        - str: compression of the chunks, "zlib" or "lzma"
+    """
+    container.seek(0)
+    header = container.read(FILE_HEADER.size)
+    if len(header) < FILE_HEADER.size:
+        raise ValueError(f"File: {output_path} is not a compressed output container")
+
+    magic, version, compression_id = FILE_HEADER.unpack(header)
+    if magic != CONTAINER_MAGIC:
+        raise ValueError(f"File: {output_path} is not a compressed output container")
+    if version != CONTAINER_VERSION:
+        raise ValueError(f"Version: {version} of compressed output container: {output_path} is not supported, "
+                         f"expected version: {CONTAINER_VERSION}")
+
+    for compression, identifier in CHUNK_COMPRESSIONS.items():
+        if identifier == compression_id:
+            return compression
+
+    raise ValueError(f"Compression identifier: {compression_id} of file: {output_path} is not supported")
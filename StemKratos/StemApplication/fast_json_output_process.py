@@ -1,8 +1,33 @@
+import os
+import warnings
+from array import array
+from functools import partial
+from typing import Dict, List, Optional, Tuple
+
 from KratosMultiphysics.json_output_process import JsonOutputProcess
 import KratosMultiphysics
-
+from KratosMultiphysics.StemApplication.binary_output_utilities import (BINARY_OUTPUT_FORMATS, SEPARATOR,
+                                                                        VARIABLE_TIME,
+                                                                        get_binary_output_path,
+                                                                        convert_arrays_to_output_data,
+                                                                        write_binary_arrays)
+from KratosMultiphysics.StemApplication.asynchronous_output_writer import AsynchronousOutputWriter
+from KratosMultiphysics.StemApplication.moving_load_output_trigger import MovingLoadOutputTrigger
+from KratosMultiphysics.StemApplication.output_reader import StemOutputReader
+from KratosMultiphysics.StemApplication.compressed_output_container import (CHUNKED_OUTPUT_FORMAT,
+                                                                            get_chunked_output_path,
+                                                                            create_compressed_output,
+                                                                            append_compressed_chunk)
+
+import numpy as np
 import orjson
 
+# kinds of series in the output data
+SCALAR_SERIES = 0  # a single float per output step
+COMPONENT_SERIES = 1  # an X, Y and Z series of a single float per output step
+LIST_SERIES = 2  # a list of floats per output step
+SUMMED_LIST_SERIES = 3  # the sum of a list of floats per output step, used for resultants
+
 
 def fast_read_external_json(file_name: str):
     """
@@ -16,16 +41,71 @@ def fast_read_external_json(file_name: str):
 
     return data
 
+def fast_read_selection(output_path: str, node_ids: Optional[List[int]] = None,
+                        element_ids: Optional[List[int]] = None, variables: Optional[List[str]] = None,
+                        start_time: Optional[float] = None, end_time: Optional[float] = None) -> dict:
+    """
+    Reads only the requested nodes, elements, variables and time range of an output file, without loading the whole
+    file. See :class:`KratosMultiphysics.StemApplication.output_reader.StemOutputReader`.
+
+    Args:
+        - output_path (str): path of the json, npz or chunked output file, or of the npy output directory
+        - node_ids (Optional[List[int]]): ids of the nodes to be read
+        - element_ids (Optional[List[int]]): ids of the elements to be read
+        - variables (Optional[List[str]]): names of the variables to be read, None reads all variables
+        - start_time (Optional[float]): first output time to be read, None reads from the start
+        - end_time (Optional[float]): last output time to be read, None reads until the end
+
+    Returns:
+        - dict: the selected output in the layout of the json output, where the series are numpy arrays
+    """
+    with StemOutputReader(output_path) as reader:
+        return reader.read(node_ids, element_ids, variables, start_time, end_time)
+
 def fast_write_external_json(file_name: str, data: dict):
     """
-    Writes data to a JSON file using orjson for faster performance.
+    Writes data to a JSON file using orjson for faster performance. Array-backed columns are written as regular
+    JSON lists.
 
     Args:
         - file_name (str): The name of the output JSON file.
         - data (dict): The data to write to the JSON file.
     """
     with open(file_name, 'wb') as outfile:
-        outfile.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        outfile.write(orjson.dumps(data, default=_serialise_column, option=orjson.OPT_INDENT_2))
+
+def select_output_nodes(process: JsonOutputProcess) -> Tuple[List[str], Optional[np.ndarray]]:
+    """
+    Selects the output nodes of a json output process, i.e. the nodes of its sub model part which have the flag to be
+    checked.
+
+    Args:
+        - process (JsonOutputProcess): the initialised json output process
+
+    Returns:
+        - Tuple[List[str], Optional[np.ndarray]]: the keys of the output nodes in the output data and the indices of
+          the output nodes within the sub model part, the indices are None if all nodes are output nodes
+    """
+    is_output_node = [process._JsonOutputProcess__check_flag(node) for node in process.sub_model_part.Nodes]
+    node_keys = ["NODE_" + process._JsonOutputProcess__get_node_identifier(node)
+                 for node, is_output in zip(process.sub_model_part.Nodes, is_output_node) if is_output]
+    node_indices = None if all(is_output_node) else np.flatnonzero(is_output_node)
+
+    return node_keys, node_indices
+
+def _serialise_column(column: array) -> list:
+    """
+    Converts an array-backed column to a list, such that it can be serialised by orjson.
+
+    Args:
+        - column (array): The array-backed column.
+
+    Returns:
+        - list: The values of the column.
+    """
+    if isinstance(column, array):
+        return column.tolist()
+    raise TypeError(f"Type {type(column).__name__} is not JSON serialisable")
 
 class FastJsonOutputProcess(JsonOutputProcess):
     """
@@ -36,9 +116,75 @@ class FastJsonOutputProcess(JsonOutputProcess):
     for reading and writing the json file. This is significantly faster than the
     standard JsonOutputProcess, especially for large models or frequent output.
 
+    The results are accumulated in memory, such that the output file does not have to be read each output step. The
+    output file is only written every "flush_interval" output steps and at the end of the stage. The layout of the
+    output file is equal to the layout of the standard JsonOutputProcess.
+
+    By default, the output file is only written at the end of the stage. Each flush rewrites the complete json, npy or
+    npz output, such that frequent flushing makes the total amount of written data grow quadratically with the number
+    of output steps. A positive "flush_interval" keeps intermediate results on disk in case the calculation is
+    interrupted, at the cost of these rewrites. The chunked output only appends the new output steps each flush, and
+    removes them from memory, such that a flush interval bounds the memory use without rewriting the output.
+
+    Before the solution loop, an output plan is compiled, which contains the entities to be written and the kinds of
+    the series. Each output step, the values of a variable are gathered in bulk for all nodes or all integration
+    points of all elements in a single call, and stored as one array per variable. Resultants are computed as array
+    reductions.
+
+    Instead of json, the output can be written as contiguous numeric arrays, either as separate .npy files, which can
+    be memory mapped, or as an .npz bundle. See :mod:`KratosMultiphysics.StemApplication.binary_output_utilities`.
+
+    For long time histories, the output can be written to a compressed, chunked container. Each flush, the output
+    steps since the previous flush are compressed and appended as a chunk, after which they are removed from memory.
+    See :mod:`KratosMultiphysics.StemApplication.compressed_output_container`.
+
+    By default, the output is written with the time frequency of the JsonOutputProcess. Alternatively, the output is
+    written every "step_frequency" solution steps, based on the step index, such that the schedule does not drift
+    during long calculations. Per variable, the output can be decimated, i.e. a variable is only written every n-th
+    output step. The output times of decimated series are written to "VARIABLE_TIME". Furthermore, the output can be
+    restricted to the steps in which a moving load is within a given distance of the output nodes, see
+    :class:`KratosMultiphysics.StemApplication.moving_load_output_trigger.MovingLoadOutputTrigger`.
+
+    Optionally, the output is written asynchronously. A snapshot of the accumulated output is handed to a writer
+    thread, which encodes the output and writes it to disk, such that the time loop is not blocked by slow file
+    systems.
+
     - Inheritance:
         :class:`KratosMultiphysics.JsonOutputProcess`
 
+    Attributes:
+        - flush_interval (int): number of output steps between writing the output file, 0 means that the output file
+            is only written at the end of the stage.
+        - output_format (str): format of the output, "json", "npy", "npz" or "chunked"
+        - precision (str): floating point precision of the binary output, "float64" or "float32"
+        - asynchronous_writing (bool): whether the output is written by a background writer thread
+        - step_frequency (int): number of solution steps between output steps, 0 means that the time frequency is
+            used
+        - decimation (Dict[str, int]): per variable name, the number of output steps between writing the variable
+        - __trigger (Optional[MovingLoadOutputTrigger]): trigger which restricts the output to the steps in which a
+            moving load is near the output nodes, None if the output is not restricted
+        - __n_output_steps (int): number of written output steps
+        - __n_flushed_steps (int): number of output steps which are removed from memory after being appended to the
+            chunked output
+        - __writer (Optional[AsynchronousOutputWriter]): the background writer, None for synchronous writing
+        - __time (array): the output times
+        - __node_keys (list): keys of the output nodes, or the resultant, in the output data
+        - __node_indices (np.ndarray): indices of the output nodes within the sub model part, None if all nodes are
+            written
+        - __nodal_expression (KratosMultiphysics.Expression.NodalExpression): expression used to gather the nodal
+            values in bulk
+        - __nodal_series (list): per variable, the kind of series, the decimation, the gathered values per output
+            step and an empty array with the shape of the series
+        - __element_keys (list): keys of the output elements, or the resultant, in the output data
+        - __element_indices (np.ndarray): indices of the output elements within the sub model part, None if all
+            elements are written
+        - __element_expression (KratosMultiphysics.Expression.ElementExpression): expression used to evaluate the
+            gauss point values in bulk
+        - __gauss_point_series (list): per variable, the kind of series, the decimation, the evaluated values per
+            output step, with the shape (n_elements, n_gauss_points, n_components), and an empty array with the shape
+            of the series
+        - __n_unflushed_steps (int): number of output steps which are not yet written to the output file
+
     """
 
     def __init__(self, model: KratosMultiphysics.Model, params: KratosMultiphysics.Parameters):
@@ -52,171 +198,485 @@ class FastJsonOutputProcess(JsonOutputProcess):
                 - "output_file_name": Name of the output json file.
                 - "output_variables": List of variables to output.
                 - "gauss_points_output_variables": List of gauss point variables to output.
-                - "frequency": Frequency of output in seconds.
+                - "time_frequency": Time between output steps in seconds.
                 - "historical_value": Whether to output historical values or not.
                 - "resultant_solution": Whether to compute a resultant solution or not.
+                - "flush_interval": Number of output steps between writing the output file, 0 means that the
+                  output file is only written at the end of the stage.
+                - "output_format": Format of the output, "json", "npy", "npz" or "chunked".
+                - "precision": Floating point precision of the binary output, "float64" or "float32".
+                - "compression": Compression of the chunked output, "zlib" or "lzma".
+                - "compression_level": Compression level of the chunked output, from 0 to 9.
+                - "asynchronous_writing": Whether the output is written by a background writer thread.
+                - "writer_queue_size": Maximum number of pending writes of the background writer, the time loop
+                  waits when the queue is full.
+                - "step_frequency": Number of solution steps between output steps, 0 means that the time frequency
+                  is used.
+                - "decimation": Per variable name, the number of output steps between writing the variable.
+                - "moving_load_trigger": Restricts the output to the steps in which a moving load is near the
+                  output nodes, containing:
+                    - "model_part_names": Names of the model parts of the moving loads, the output is not restricted
+                      if empty.
+                    - "distance": Maximum distance between a moving load and the output nodes.
         """
 
+        # settings which are not known by the JsonOutputProcess are removed before the base class validates them
+        self.fast_output_settings = self.__extract_fast_output_settings(params)
+        self.flush_interval = self.fast_output_settings["flush_interval"].GetInt()
+        self.output_format = self.fast_output_settings["output_format"].GetString().lower()
+        self.precision = self.fast_output_settings["precision"].GetString().lower()
+        self.asynchronous_writing = self.fast_output_settings["asynchronous_writing"].GetBool()
+        self.step_frequency = self.fast_output_settings["step_frequency"].GetInt()
+        self.decimation = {variable_name: self.fast_output_settings["decimation"][variable_name].GetInt()
+                           for variable_name in self.fast_output_settings["decimation"].keys()}
+
+        if self.step_frequency < 0:
+            raise ValueError(f"The step frequency should be positive, but is: {self.step_frequency}")
+
+        available_formats = ["json"] + BINARY_OUTPUT_FORMATS + [CHUNKED_OUTPUT_FORMAT]
+        if self.output_format not in available_formats:
+            raise ValueError(f"Output format: {self.output_format} is not supported, available formats are: "
+                             f"{available_formats}")
+
+        output_variable_names = []
+        for key in ["output_variables", "gauss_points_output_variables"]:
+            if params.Has(key):
+                output_variable_names.extend(params[key].GetStringArray())
+        for variable_name, decimation in self.decimation.items():
+            if variable_name not in output_variable_names:
+                raise ValueError(f"Decimation is given for variable: {variable_name}, which is not an output "
+                                 f"variable")
+            if decimation < 1:
+                raise ValueError(f"The decimation of variable: {variable_name} should be at least 1, but is: "
+                                 f"{decimation}")
+
         super().__init__(model, params)
 
+        self.__trigger = None
+        self.__n_output_steps = 0
+        self.__n_flushed_steps = 0
+        self.__time = array("d")
+        self.__node_keys = []
+        self.__node_indices = None
+        self.__nodal_expression = None
+        self.__nodal_series = []
+        self.__element_keys = []
+        self.__element_indices = None
+        self.__element_expression = None
+        self.__gauss_point_series = []
+        self.__n_unflushed_steps = 0
+        self.__writer = None
+
+    @staticmethod
+    def __extract_fast_output_settings(params: KratosMultiphysics.Parameters) -> KratosMultiphysics.Parameters:
+        """
+        Extracts the settings which are specific to the FastJsonOutputProcess from the process parameters. The
+        extracted settings are removed from the process parameters.
+
+        Args:
+            - params (KratosMultiphysics.Parameters): The parameters for the process.
+
+        Returns:
+            - KratosMultiphysics.Parameters: The settings specific to the FastJsonOutputProcess.
+        """
+        default_settings = KratosMultiphysics.Parameters("""{
+            "flush_interval" : 0,
+            "output_format"  : "json",
+            "precision"      : "float64",
+            "compression"    : "zlib",
+            "compression_level" : 6,
+            "asynchronous_writing" : false,
+            "writer_queue_size"    : 2,
+            "step_frequency" : 0,
+            "decimation"     : {},
+            "moving_load_trigger" : {
+                "model_part_names" : [],
+                "distance"         : 0.0
+            }
+        }""")
+
+        fast_output_settings = KratosMultiphysics.Parameters("{}")
+        for key in default_settings.keys():
+            if params.Has(key):
+                fast_output_settings.AddValue(key, params[key])
+                params.RemoveValue(key)
+
+        fast_output_settings.ValidateAndAssignDefaults(default_settings)
+        fast_output_settings["moving_load_trigger"].ValidateAndAssignDefaults(default_settings["moving_load_trigger"])
+
+        return fast_output_settings
+
+    def ExecuteBeforeSolutionLoop(self):
+        """
+        Generates the structure of the output data and compiles the output plan. The types of the variables, the keys
+        in the output data and the flags of the entities are resolved once, such that each output step only the
+        values have to be retrieved.
+        """
+        self.__time = array("d")
+        self.__node_keys = []
+        self.__node_indices = None
+        self.__nodal_series = []
+        self.__element_keys = []
+        self.__element_indices = None
+        self.__gauss_point_series = []
+        self.__n_output_steps = 0
+        self.__n_flushed_steps = 0
+
+        if self.output_variables:
+            self.__compile_nodal_plan()
+
+        if self.gauss_points_output_variables:
+            self.__compile_gauss_point_plan()
+
+        self.__trigger = self.__create_trigger()
+
+        # binary output is written to a separate path
+        if self.output_format != "json" and os.path.isfile(self.output_file_name):
+            os.remove(self.output_file_name)
+
+        if self.output_format == CHUNKED_OUTPUT_FORMAT:
+            create_compressed_output(get_chunked_output_path(self.output_file_name),
+                                     self.fast_output_settings["compression"].GetString().lower())
+
+        if self.asynchronous_writing and self.__writer is None:
+            self.__writer = AsynchronousOutputWriter(self.fast_output_settings["writer_queue_size"].GetInt())
+
+        # write the structure of the output
+        self.flush()
+
+    def __compile_nodal_plan(self):
+        """
+        Compiles the output plan of the nodal variables. The nodal values are gathered in bulk for the whole
+        sub model part, the plan contains the indices of the output nodes within the sub model part and per variable
+        the kind of series and the list in which the gathered values are stored per output step.
+        """
+        # the flag is checked once, the output structure is fixed during the stage
+        node_keys, self.__node_indices = select_output_nodes(self)
+        if len(node_keys) == 0:
+            return
+
+        self.__node_keys = ["RESULTANT"] if self.resultant_solution else node_keys
+
+        self.__nodal_expression = KratosMultiphysics.Expression.NodalExpression(self.sub_model_part)
+
+        for variable in self.output_variables:
+            kind = self.__get_series_kind(variable)
+            if kind is not None:
+                # the shape of the values per output step is used to write the structure before the first step
+                value_shape = self.__gather_nodal_values(variable, kind).shape
+                empty_values = np.empty(value_shape[:1] + (0,) + value_shape[1:])
+                self.__nodal_series.append((variable, kind, self.decimation.get(variable.Name(), 1), [],
+                                            empty_values))
+
+    def __compile_gauss_point_plan(self):
+        """
+        Compiles the output plan of the gauss point variables. The gauss point values are evaluated in bulk for all
+        elements of the sub model part, the plan contains the indices of the output elements within the sub model
+        part and per variable the kind of series and the list in which the evaluated values are stored per output
+        step. All output elements require the same number of integration points.
+        """
+        # the flag is checked once, the output structure is fixed during the stage
+        is_output_element = [self._JsonOutputProcess__check_flag(elem) for elem in self.sub_model_part.Elements]
+        if not any(is_output_element):
+            return
+
+        if not all(is_output_element):
+            self.__element_indices = np.flatnonzero(is_output_element)
+
+        if self.resultant_solution:
+            self.__element_keys = ["RESULTANT"]
+        else:
+            self.__element_keys = ["ELEMENT_" + str(elem.Id)
+                                   for elem, is_output in zip(self.sub_model_part.Elements, is_output_element)
+                                   if is_output]
+
+        self.__element_expression = KratosMultiphysics.Expression.ElementExpression(self.sub_model_part)
+
+        for variable in self.gauss_points_output_variables:
+            kind = self.__get_series_kind(variable)
+            if kind is not None:
+                # the shape of the values per output step is used to write the structure before the first step
+                value_shape = self.__evaluate_gauss_point_values(variable, kind).shape
+                empty_values = np.empty(value_shape[:2] + (0,) + value_shape[2:])
+                self.__gauss_point_series.append((variable, kind, self.decimation.get(variable.Name(), 1), [],
+                                                  empty_values))
+
+    def __create_trigger(self) -> Optional[MovingLoadOutputTrigger]:
+        """
+        Creates the trigger which restricts the output to the steps in which a moving load is near the output nodes.
+
+        Returns:
+            - Optional[MovingLoadOutputTrigger]: the trigger, None if the output is not restricted
+        """
+        trigger_settings = self.fast_output_settings["moving_load_trigger"]
+        model_part_names = trigger_settings["model_part_names"].GetStringArray()
+        if len(model_part_names) == 0:
+            return None
+
+        output_coordinates = [[node.X0, node.Y0, node.Z0] for node in self.sub_model_part.Nodes
+                              if self._JsonOutputProcess__check_flag(node)]
+
+        return MovingLoadOutputTrigger([self.model.GetModelPart(name) for name in model_part_names],
+                                       np.asarray(output_coordinates, dtype=float),
+                                       trigger_settings["distance"].GetDouble())
+
+    def __get_series_kind(self, variable: KratosMultiphysics.VariableData) -> Optional[int]:
+        """
+        Returns the kind of series in which the values of a variable are stored.
+
+        Args:
+            - variable (KratosMultiphysics.VariableData): the output variable
+
+        Returns:
+            - Optional[int]: the kind of series, None if the variable type is not supported
+        """
+        variable_name = variable.Name()
+        variable_type = KratosMultiphysics.KratosGlobals.GetVariableType(variable_name)
+
+        if variable_type == "Double":
+            return SCALAR_SERIES
+        elif variable_type == "Array":
+            if (KratosMultiphysics.KratosGlobals.HasVariable(variable_name + "_X") and
+                    KratosMultiphysics.KratosGlobals.GetVariableType(variable_name + "_X") == "Double"):
+                return COMPONENT_SERIES
+            # the resultant of an array without components is the sum of all its components
+            return SUMMED_LIST_SERIES if self.resultant_solution else LIST_SERIES
+        elif variable_type == "Vector":
+            return LIST_SERIES
+
+        warnings.warn(f"Variable: {variable_name} of type: {variable_type} is not supported by the "
+                      f"FastJsonOutputProcess and is not written to the output.")
+        return None
+
+    def __gather_nodal_values(self, variable: KratosMultiphysics.VariableData, kind: int) -> np.ndarray:
+        """
+        Gathers the values of a variable at all output nodes in a single call. In case of a resultant solution, the
+        values are reduced to the resultant.
+
+        Args:
+            - variable (KratosMultiphysics.VariableData): the output variable
+            - kind (int): the kind of series
+
+        Returns:
+            - np.ndarray: the values with the output nodes, or the resultant, as first dimension
+        """
+        KratosMultiphysics.Expression.VariableExpressionIO.Read(self.__nodal_expression, variable,
+                                                                self.historical_value)
+        return self.__select_and_reduce(self.__nodal_expression.Evaluate(), self.__node_indices, kind)
+
+    def __evaluate_gauss_point_values(self, variable: KratosMultiphysics.VariableData, kind: int) -> np.ndarray:
+        """
+        Evaluates the values of a variable at the integration points of all output elements in a single call. In
+        case of a resultant solution, the values are reduced to the resultant per integration point.
+
+        Args:
+            - variable (KratosMultiphysics.VariableData): the output variable
+            - kind (int): the kind of series
+
+        Returns:
+            - np.ndarray: the values with the shape (n_elements, n_gauss_points, n_components), where the first
+              dimension is 1 for the resultant. The last dimension is omitted for scalar variables.
+        """
+        KratosMultiphysics.Expression.IntegrationPointExpressionIO.Read(self.__element_expression, variable)
+        return self.__select_and_reduce(self.__element_expression.Evaluate(), self.__element_indices, kind)
+
+    def __select_and_reduce(self, values: np.ndarray, indices: Optional[np.ndarray], kind: int) -> np.ndarray:
+        """
+        Selects the values of the output entities and, in case of a resultant solution, reduces them to the
+        resultant.
+
+        Args:
+            - values (np.ndarray): the values of all entities, with the entities as first dimension
+            - indices (Optional[np.ndarray]): indices of the output entities, None if all entities are written
+            - kind (int): the kind of series
+
+        Returns:
+            - np.ndarray: the values with the output entities, or the resultant, as first dimension
+        """
+        if indices is not None:
+            values = values[indices]
+
+        if self.resultant_solution:
+            values = values.sum(axis=0)
+            if kind == SUMMED_LIST_SERIES:
+                values = values.sum(axis=-1)
+            return values[np.newaxis]
+
+        return values
+
+    @staticmethod
+    def __add_series_arrays(arrays: Dict[str, np.ndarray], group: str, keys: List[str], series: list,
+                            time: np.ndarray, first_step: int, time_axis: int, is_gauss_point_series: bool):
+        """
+        Adds the accumulated series of a group of entities to the output arrays, in the layout of the binary output.
+        Array variables with components are split into an X, Y and Z series. The output times of decimated series
+        are added as "VARIABLE_TIME.<SERIES>".
+
+        Args:
+            - arrays (Dict[str, np.ndarray]): the output arrays
+            - group (str): the group of the entities, i.e. "NODE", "ELEMENT" or "RESULTANT"
+            - keys (List[str]): keys of the entities
+            - series (list): the accumulated series
+            - time (np.ndarray): the output times
+            - first_step (int): index of the first output step in the output times
+            - time_axis (int): axis along which the output steps are stacked
+            - is_gauss_point_series (bool): whether the series are gauss point series
+        """
+        if len(keys) == 0:
+            return
+
+        arrays[group + SEPARATOR + "KEYS"] = np.asarray(keys, dtype=str)
+        gauss_point_series_names = arrays.get(group + SEPARATOR + "GAUSS_POINT_SERIES", np.asarray([])).tolist()
+
+        for variable, kind, decimation, steps, empty_values in series:
+            values = np.stack(steps, axis=time_axis) if len(steps) > 0 else empty_values
+            if kind == COMPONENT_SERIES:
+                names_and_values = [(variable.Name() + component, values[..., index])
+                                    for index, component in enumerate(["_X", "_Y", "_Z"])]
+            else:
+                names_and_values = [(variable.Name(), values)]
+
+            for name, series_values in names_and_values:
+                arrays[group + SEPARATOR + name] = series_values
+                if decimation > 1:
+                    arrays[VARIABLE_TIME + SEPARATOR + name] = time[(-first_step) % decimation::decimation]
+                if is_gauss_point_series:
+                    gauss_point_series_names.append(name)
+
+        arrays[group + SEPARATOR + "GAUSS_POINT_SERIES"] = np.asarray(gauss_point_series_names, dtype=str)
+
+    def __get_output_arrays(self, time: array, nodal_series: list, gauss_point_series: list,
+                            first_step: int) -> Dict[str, np.ndarray]:
+        """
+        Returns the accumulated output as numeric arrays, in the layout of the binary output.
+
+        Args:
+            - time (array): the output times
+            - nodal_series (list): the accumulated nodal series
+            - gauss_point_series (list): the accumulated gauss point series
+            - first_step (int): index of the first output step in the output times
+
+        Returns:
+            - Dict[str, np.ndarray]: the output arrays
+        """
+        time = np.frombuffer(time, dtype=np.float64)
+        arrays = {"TIME": time}
+
+        self.__add_series_arrays(arrays, "RESULTANT" if self.resultant_solution else "NODE", self.__node_keys,
+                                 nodal_series, time, first_step, 1, False)
+        self.__add_series_arrays(arrays, "RESULTANT" if self.resultant_solution else "ELEMENT",
+                                 self.__element_keys, gauss_point_series, time, first_step, 2, True)
+
+        return arrays
+
+    def flush(self):
+        """
+        Writes the accumulated output data to the output file. In case of asynchronous writing, a snapshot of the
+        output data is handed to the background writer. In case of chunked output, only the output steps since the
+        previous flush are written, after which they are removed from memory.
+        """
+        if self.__writer is None:
+            self.__write(self.__time, self.__nodal_series, self.__gauss_point_series, self.__n_flushed_steps)
+        else:
+            # the stored values of an output step are not modified, only the lists of output steps are copied
+            time = array("d", self.__time)
+            nodal_series = [(variable, kind, decimation, list(steps), empty_values)
+                            for variable, kind, decimation, steps, empty_values in self.__nodal_series]
+            gauss_point_series = [(variable, kind, decimation, list(steps), empty_values)
+                                  for variable, kind, decimation, steps, empty_values in self.__gauss_point_series]
+            self.__writer.submit(partial(self.__write, time, nodal_series, gauss_point_series,
+                                         self.__n_flushed_steps))
+
+        if self.output_format == CHUNKED_OUTPUT_FORMAT:
+            self.__n_flushed_steps += len(self.__time)
+            self.__time = array("d")
+            for _, _, _, steps, _ in self.__nodal_series + self.__gauss_point_series:
+                steps.clear()
+
+        self.__n_unflushed_steps = 0
+
+    def __write(self, time: array, nodal_series: list, gauss_point_series: list, first_step: int):
+        """
+        Encodes the output and writes it to the output file.
+
+        Args:
+            - time (array): the output times
+            - nodal_series (list): the accumulated nodal series
+            - gauss_point_series (list): the accumulated gauss point series
+            - first_step (int): index of the first output step in the output times
+        """
+        arrays = self.__get_output_arrays(time, nodal_series, gauss_point_series, first_step)
+
+        if self.output_format == "json":
+            fast_write_external_json(self.output_file_name, convert_arrays_to_output_data(arrays))
+        elif self.output_format == CHUNKED_OUTPUT_FORMAT:
+            append_compressed_chunk(get_chunked_output_path(self.output_file_name), arrays,
+                                    self.fast_output_settings["compression_level"].GetInt(), self.precision)
+        else:
+            write_binary_arrays(get_binary_output_path(self.output_file_name, self.output_format), arrays,
+                                self.output_format, self.precision)
+
     def ExecuteFinalizeSolutionStep(self):
         """
-        Finalize the solution step by writing the output to a json file.
+        Finalize the solution step by adding the output values to the output data, following the compiled output
+        plan. Decimated variables are only added every n-th output step. The output data is written to the output
+        file every flush interval.
         """
+        if not self.__is_output_step():
+            return
+
+        # the output is restricted to the steps in which a moving load is near the output nodes
+        if self.__trigger is not None and not self.__trigger.is_active():
+            return
 
         time = self.sub_model_part.ProcessInfo.GetValue(KratosMultiphysics.TIME)
+        self.__time.append(time)
+
+        # Nodal values
+        for variable, kind, decimation, steps, _ in self.__nodal_series:
+            if self.__n_output_steps % decimation == 0:
+                steps.append(self.__gather_nodal_values(variable, kind))
+
+        # Gauss points values
+        for variable, kind, decimation, steps, _ in self.__gauss_point_series:
+            if self.__n_output_steps % decimation == 0:
+                steps.append(self.__evaluate_gauss_point_values(variable, kind))
+
+        self.__n_output_steps += 1
+        self.__n_unflushed_steps += 1
+        if self.flush_interval > 0 and self.__n_unflushed_steps >= self.flush_interval:
+            self.flush()
+
+    def __is_output_step(self) -> bool:
+        """
+        Checks whether the current solution step is an output step. With a step frequency, the step index is used,
+        otherwise the time frequency of the JsonOutputProcess is used.
+
+        Returns:
+            - bool: True if the current solution step is an output step
+        """
+        if self.step_frequency > 0:
+            step = self.sub_model_part.ProcessInfo.GetValue(KratosMultiphysics.STEP)
+            return step % self.step_frequency == 0
+
         dt = self.sub_model_part.ProcessInfo.GetValue(KratosMultiphysics.DELTA_TIME)
         self.time_counter += dt
         if self.time_counter > self.frequency:
+            self.time_counter = 0.0
+            return True
+        return False
 
-            data = fast_read_external_json(self.output_file_name)
+    def ExecuteFinalize(self):
+        """
+        Writes the output data which is not yet written to the output file. In case of asynchronous writing, all
+        pending writes are completed.
+        """
+        if self.__n_unflushed_steps > 0:
+            self.flush()
 
-            self.time_counter = 0.0
-            data["TIME"].append(time)
-
-            # Nodal values
-            if self.output_variables:
-                count = 0
-                for node in self.sub_model_part.Nodes:
-                    compute = self._JsonOutputProcess__check_flag(node)
-
-                    if compute:
-                        node_identifier = "NODE_" + self._JsonOutputProcess__get_node_identifier(node)
-
-                        for variable in self.output_variables:
-                            variable_name = variable.Name()
-                            variable_type = KratosMultiphysics.KratosGlobals.GetVariableType(variable_name)
-                            if self.historical_value:
-                                value = node.GetSolutionStepValue(variable, 0)
-                            else:
-                                value = node.GetValue(variable)
-
-                            if variable_type == "Double":
-                                if not self.resultant_solution:
-                                    data[node_identifier][variable_name].append(value)
-                                else:
-                                    if count == 0:
-                                        data["RESULTANT"][variable_name].append(value)
-                                    else:
-                                        data["RESULTANT"][variable_name][-1] += value
-                            elif variable_type == "Array":
-                                if KratosMultiphysics.KratosGlobals.GetVariableType(variable_name + "_X") == "Double":
-                                    if not self.resultant_solution:
-                                        data[node_identifier][variable_name + "_X"].append(value[0])
-                                        data[node_identifier][variable_name + "_Y"].append(value[1])
-                                        data[node_identifier][variable_name + "_Z"].append(value[2])
-                                    else:
-                                        if count == 0:
-                                            data["RESULTANT"][variable_name + "_X"].append(value[0])
-                                            data["RESULTANT"][variable_name + "_Y"].append(value[1])
-                                            data["RESULTANT"][variable_name + "_Z"].append(value[2])
-                                        else:
-                                            data["RESULTANT"][variable_name + "_X"][-1] += value[0]
-                                            data["RESULTANT"][variable_name + "_Y"][-1] += value[1]
-                                            data["RESULTANT"][variable_name + "_Z"][-1] += value[2]
-                                else:
-                                    if not self.resultant_solution:
-                                        list = self._JsonOutputProcess__kratos_vector_to__python_list(value)
-                                        data[node_identifier][variable_name].append(list)
-                                    else:
-                                        aux = 0.0
-                                        for index in range(len(value)):
-                                            aux += value[index]
-                                        if count == 0:
-                                            data["RESULTANT"][variable_name].append(aux)
-                                        else:
-                                            data["RESULTANT"][variable_name][-1] += aux
-                            elif variable_type == "Vector":
-                                if not self.resultant_solution:
-                                    data[node_identifier][variable_name].append(value)
-                                else:
-                                    if count == 0:
-                                        data["RESULTANT"][variable_name].append(value)
-                                    else:
-                                        data["RESULTANT"][variable_name][-1] += value
-
-                            # TODO: Add pending classes
-                        count += 1
-
-            count = 0
-            # Gauss points values
-            if self.gauss_points_output_variables:
-                for elem in self.sub_model_part.Elements:
-                    compute = self._JsonOutputProcess__check_flag(elem)
-
-                    if compute:
-                        for variable in self.gauss_points_output_variables:
-                            variable_name = variable.Name()
-                            variable_type = KratosMultiphysics.KratosGlobals.GetVariableType(variable_name)
-                            value = elem.CalculateOnIntegrationPoints(variable, self.sub_model_part.ProcessInfo)
-
-                            gauss_point_number = len(value)
-
-                            if variable_type == "Double":
-                                if not self.resultant_solution:
-                                    for gp in range(gauss_point_number):
-                                        data["ELEMENT_" + str(elem.Id)][variable_name][str(gp)].append(value[gp])
-                                else:
-                                    if count == 0:
-                                        for gp in range(gauss_point_number):
-                                            data["RESULTANT"][variable_name][str(gp)].append(value[gp])
-                                    else:
-                                        for gp in range(gauss_point_number):
-                                            data["RESULTANT"][variable_name][str(gp)][-1] += value[gp]
-                            elif variable_type == "Array":
-                                if KratosMultiphysics.KratosGlobals.GetVariableType(variable_name + "_X") == "Double":
-                                    if not self.resultant_solution:
-                                        for gp in range(gauss_point_number):
-                                            data["ELEMENT_" + str(elem.Id)][variable_name + "_X"][str(gp)].append(
-                                                value[gp][0])
-                                            data["ELEMENT_" + str(elem.Id)][variable_name + "_Y"][str(gp)].append(
-                                                value[gp][1])
-                                            data["ELEMENT_" + str(elem.Id)][variable_name + "_Z"][str(gp)].append(
-                                                value[gp][2])
-                                    else:
-                                        if count == 0:
-                                            for gp in range(gauss_point_number):
-                                                data["RESULTANT"][variable_name + "_X"][str(gp)].append(value[gp][0])
-                                                data["RESULTANT"][variable_name + "_Y"][str(gp)].append(value[gp][1])
-                                                data["RESULTANT"][variable_name + "_Z"][str(gp)].append(value[gp][2])
-                                        else:
-                                            for gp in range(gauss_point_number):
-                                                data["RESULTANT"][variable_name + "_X"][str(gp)][-1] += value[gp][0]
-                                                data["RESULTANT"][variable_name + "_Y"][str(gp)][-1] += value[gp][1]
-                                                data["RESULTANT"][variable_name + "_Z"][str(gp)][-1] += value[gp][2]
-                                else:
-                                    if not self.resultant_solution:
-                                        list = self._JsonOutputProcess__kratos_vector_to__python_list(value)
-                                        for gp in range(gauss_point_number):
-                                            data["ELEMENT_" + str(elem.Id)][variable_name][str(gp)].append(list)
-                                    else:
-                                        if count == 0:
-                                            for gp in range(gauss_point_number):
-                                                aux = 0.0
-                                                for index in range(len(value[gp])):
-                                                    aux += value[index]
-                                                data["RESULTANT"][variable_name][str(gp)].append(aux)
-                                        else:
-                                            for gp in range(gauss_point_number):
-                                                aux = 0.0
-                                                for index in range(len(value[gp])):
-                                                    aux += value[index]
-                                                data["RESULTANT"][variable_name][str(gp)][-1] += aux
-                            elif variable_type == "Vector":
-                                if not self.resultant_solution:
-                                    for gp in range(gauss_point_number):
-                                        list = self._JsonOutputProcess__kratos_vector_to__python_list(value[gp])
-                                        data["ELEMENT_" + str(elem.Id)][variable_name][str(gp)].append(list)
-                                else:
-                                    if count == 0:
-                                        for gp in range(gauss_point_number):
-                                            list = self._JsonOutputProcess__kratos_vector_to__python_list(value[gp])
-                                            data["RESULTANT"][variable_name][str(gp)][-1] += list
-
-                                # TODO: Add pending classes
-                    count += 1
-
-            fast_write_external_json(self.output_file_name, data)
+        if self.__writer is not None:
+            self.__writer.close()
+            self.__writer = None
 
 
 def Factory(settings: KratosMultiphysics.Parameters, Model: KratosMultiphysics.Model):
@@ -45,9 +45,22 @@ class UPwUvecSolver(UPwGeoSolver):
             "uvec_path"              :     "",
             "uvec_method"		     :     "",
             "uvec_model_part"		 :	   "",
+            "uvec_interface"         :     "json",
+            "uvec_cache"             :     false,
+            "uvec_cache_tolerance"   :     0.0,
+            "uvec_timing_output"     :     "",
+            "uvec_serialize_state"   :     false,
+            "uvec_trace_file"        :     "",
+            "uvec_acceleration"      :     {"type": "none"},
+            "uvec_predictor"         :     {"type": "none"},
+            "uvec_implicit_coupling" :     {"active": false},
+            "uvec_convergence_criterion" : {"active": false},
             "uvec_data"				 :     {"parameters":{}, "state":{}}
             }"""))
 
+        # multiple independent uvec models, each with the parameters of "uvec", replace the single uvec model
+        this_defaults.AddEmptyArray("uvecs")
+
         # add default time stepping parameters
         this_defaults.AddValue("time_stepping", KratosMultiphysics.Parameters("""{
             "time_step"     : 0.0,
@@ -79,6 +92,22 @@ class UPwUvecSolver(UPwGeoSolver):
             self.__reset_derivatives_to_zero()
 
 
+    def __get_uvec_settings(self) -> KratosMultiphysics.Parameters:
+        """
+        This function gets the settings of the UVEC model. If multiple UVEC models are defined in "uvecs", the list of
+        settings is returned, in which missing parameters are added from the defaults of "uvec".
+
+        Returns:
+            - KratosMultiphysics.Parameters: The UVEC settings, or the list of UVEC settings.
+        """
+        if self.settings["uvecs"].size() == 0:
+            return self.settings["uvec"]
+
+        default_uvec_settings = self.GetDefaultParameters()["uvec"]
+        for uvec_settings in self.settings["uvecs"].values():
+            uvec_settings.AddMissingParameters(default_uvec_settings)
+        return self.settings["uvecs"]
+
     def __reset_derivatives_to_zero(self):
         """
         This function sets the first and second derivative of the displacement and rotation to zero for all nodes in
@@ -129,7 +158,7 @@ class UPwUvecSolver(UPwGeoSolver):
             compute_reactions = self.settings["compute_reactions"].GetBool()
             reform_step_dofs = self.settings["reform_dofs_at_each_step"].GetBool()
             move_mesh_flag = self.settings["move_mesh_flag"].GetBool()
-            uvec_data = self.settings["uvec"]
+            uvec_data = self.__get_uvec_settings()
 
             self.strategy_params = KratosMultiphysics.Parameters("{}")
             solving_strategy = StemGeoMechanicsNewtonRaphsonStrategy(self.computing_model_part,
@@ -152,7 +181,7 @@ class UPwUvecSolver(UPwGeoSolver):
             max_iters = self.settings["max_iterations"].GetInt()
             compute_reactions = self.settings["compute_reactions"].GetBool()
             move_mesh_flag = self.settings["move_mesh_flag"].GetBool()
-            uvec_data = self.settings["uvec"]
+            uvec_data = self.__get_uvec_settings()
 
             # check if the solver_type, solution_type and scheme_type are set to the correct values
             if ((self.settings["solver_type"].GetString().lower() != "u_pw")
@@ -200,6 +229,19 @@ class UPwUvecSolver(UPwGeoSolver):
         else:
             return super()._create_solving_strategy(builder_and_solver, strategy_type)
 
+    def Finalize(self):
+        """
+        This function finalizes the solver. If a UVEC strategy is used, the UVEC controller is finalised and the
+        recorded coupling times are exported. The name of the function is kept the same as in the base class, such
+        that the function is overwritten. Thus, the name cannot be changed.
+        """
+        super().Finalize()
+
+        solving_strategy = self._GetSolutionStrategy()
+        if isinstance(solving_strategy, (StemGeoMechanicsNewtonRaphsonStrategy,
+                                         StemGeoMechanicsNewtonRaphsonLinearElasticStrategyUvec)):
+            solving_strategy.uvec_controller.finalise()
+
     def KeepAdvancingSolutionLoop(self, end_time: float) -> bool:
         """
         This function checks if the time step should be continued. The name of the function is kept the same as in the
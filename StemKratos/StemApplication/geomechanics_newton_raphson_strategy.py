@@ -3,7 +3,8 @@ from typing import Union
 import KratosMultiphysics as Kratos
 from KratosMultiphysics.GeoMechanicsApplication import (GeoMechanicsNewtonRaphsonStrategy,
                                                         GeoMechanicNewtonRaphsonStrategyLinearElasticDynamic)
-from KratosMultiphysics.StemApplication.uvec_controller import StemUvecController
+from KratosMultiphysics.StemApplication.uvec_controller import create_uvec_controller
+from KratosMultiphysics.StemApplication.uvec_coupling_recorder import log_coupling_detail
 
 
 class StemGeoMechanicsNewtonRaphsonLinearElasticStrategyUvec(GeoMechanicNewtonRaphsonStrategyLinearElasticDynamic):
@@ -19,9 +20,11 @@ class StemGeoMechanicsNewtonRaphsonLinearElasticStrategyUvec(GeoMechanicNewtonRa
     Attributes:
         - model_part (Kratos.ModelPart): The model part of the strategy.
         - max_iters (int): The maximum number of non-linear iterations.
-        - uvec_data (dict): The UVEC data.
-        - uvec_controller (:class:`KratosMultiphysics.StemApplication.uvec_controller.StemUvecController````): The
-            UVEC controller.
+        - uvec_data (Union[Kratos.Parameters, dict, list]): The UVEC data, in the form of the UVEC interface, or a
+            list with the UVEC data per UVEC model.
+        - uvec_controller (Union[:class:`KratosMultiphysics.StemApplication.uvec_controller.StemUvecController`,
+            :class:`KratosMultiphysics.StemApplication.uvec_controller.StemMultipleUvecController`]): The UVEC
+            controller.
 
     """
     def __init__(self,
@@ -32,7 +35,7 @@ class StemGeoMechanicsNewtonRaphsonLinearElasticStrategyUvec(GeoMechanicNewtonRa
                  max_iters: int,
                  compute_reactions: bool,
                  move_mesh_flag: bool,
-                 uvec_data: dict):
+                 uvec_data: Kratos.Parameters):
         """
         Initialize the Stem GeoMechanics NewtonRaphson Strategy with a linear elastic solver.
 
@@ -44,15 +47,18 @@ class StemGeoMechanicsNewtonRaphsonLinearElasticStrategyUvec(GeoMechanicNewtonRa
             - max_iters (int): The maximum number of non-linear iterations.
             - compute_reactions (bool): True if the reactions should be computed, False otherwise.
             - move_mesh_flag (bool): True if the mesh should be moved, False otherwise.
-            - uvec_data (dict): The UVEC data.
+            - uvec_data (Kratos.Parameters): The UVEC settings, or a list of UVEC settings for multiple UVEC models.
         """
         super().__init__(model_part, scheme,  convergence_criterion, builder_and_solver,
                          0, compute_reactions, move_mesh_flag)
         self.model_part = model_part
         self.max_iters = max_iters
-        self.uvec_data = uvec_data["uvec_data"]
+        self.uvec_controller, self.uvec_data = create_uvec_controller(uvec_data, model_part)
 
-        self.uvec_controller = StemUvecController(uvec_data, model_part)
+        # the system matrix is only built once, such that the moving contact stiffness cannot be taken into account
+        if self.uvec_controller.is_implicit_coupling:
+            raise ValueError("Implicit UVEC coupling is not supported with the linear elastic strategy, use the "
+                             "newton_raphson_with_uvec strategy instead")
 
 
     def Initialize(self):
@@ -79,7 +85,8 @@ class StemGeoMechanicsNewtonRaphsonStrategy(GeoMechanicsNewtonRaphsonStrategy):
     """
     Class containing the STEM Geomechanics NewtonRaphson Strategy. Which performs a non-linear iteration, and calls
     the uvec model each iteration. The uvec model is used to update the Kratos model. The Kratos model is then solved
-    using the regular NewtonRaphson strategy.
+    using the regular NewtonRaphson strategy. With implicit UVEC coupling, the contact stiffness and damping of the
+    uvec model are part of the system matrices, which are rebuilt each iteration.
     """
 
     def __init__(self,
@@ -97,8 +104,7 @@ class StemGeoMechanicsNewtonRaphsonStrategy(GeoMechanicsNewtonRaphsonStrategy):
                          strategy_params, 0, compute_reactions, reform_step_dofs, move_mesh_flag)
         self.model_part = model_part
         self.max_iters = max_iters
-        self.uvec_data = uvec_data["uvec_data"]
-        self.uvec_controller = StemUvecController(uvec_data, model_part)
+        self.uvec_controller, self.uvec_data = create_uvec_controller(uvec_data, model_part)
 
     def SolveSolutionStep(self) -> bool:
         """
@@ -117,7 +123,13 @@ def solve_uvec_solution_step(instance: Union[StemGeoMechanicsNewtonRaphsonLinear
 
     this function calls the uvec model each iteration and updates the kratos condition with the result. Furthermore,
     each non-linear iteration, 1 regular newton-raphson iteration is performed, in order to solve the Kratos
-    problem.
+    problem. If a coupling acceleration is set in the UVEC settings, the UVEC controller applies the accelerated loads
+    to Kratos. If an interface convergence criterion is set, the solution step is only converged if both Kratos and
+    the loads and displacements at the axles have converged. The time spent in the UVEC model, the (de)serialisation
+    and the Kratos solve, and the number of iterations are recorded by the recorder of the UVEC controller. If the
+    UVEC result is cached and the displacements at the axles did not change since the previous iteration, the UVEC
+    model is not called. If Kratos converged in the previous iteration, the step is then finished without solving
+    Kratos again, otherwise Kratos continues to iterate with the unchanged loads.
 
     Args:
         - instance (Union[:class:`StemGeoMechanicsNewtonRaphsonLinearElasticStrategyUvec`,
@@ -127,29 +139,40 @@ def solve_uvec_solution_step(instance: Union[StemGeoMechanicsNewtonRaphsonLinear
         - bool: True if the solution converged, False otherwise
 
     """
-    print("Info: Stem SolverSolutionStep")
+    log_coupling_detail("Stem SolverSolutionStep")
+
+    recorder = instance.uvec_controller.recorder
+    recorder.start_step(instance.model_part.ProcessInfo[Kratos.STEP], instance.model_part.ProcessInfo[Kratos.TIME])
 
     # update dt in uvec json string
     instance.uvec_controller.initialise_solution_step(instance.uvec_data)
 
+    is_converged = False
     for iter_no in range(instance.max_iters):
 
-        print("Info: Stem Non_Linear Iteration: ", iter_no + 1)
+        log_coupling_detail(f"Stem Non_Linear Iteration: {iter_no + 1}")
+        recorder.add_iteration()
 
         # update UVEC json string from Kratos
-        print("Info: Updating UVEC json string from Kratos")
+        log_coupling_detail("Updating UVEC json string from Kratos")
         instance.uvec_controller.update_uvec_from_kratos(instance.uvec_data)
 
         # call UVEC dll and update kratos data
-        print("Info: Executing UVEC and updating Kratos with result")
+        log_coupling_detail("Executing UVEC and updating Kratos with result")
         instance.uvec_data = instance.uvec_controller.execute_uvec_update_kratos(instance.uvec_data)
 
+        # the axle displacements did not change since the last UVEC call, so the loads are unchanged. The step is
+        # only finished if Kratos converged with these loads, otherwise Kratos continues to iterate
+        if instance.uvec_controller.is_coupling_converged and is_converged:
+            return True
+
         # call Kratos solver
-        is_converged = super(type(instance), instance).SolveSolutionStep()
+        with recorder.record("KRATOS_SOLVE"):
+            is_converged = super(type(instance), instance).SolveSolutionStep()
 
-        # If Kratos has converged, return True
-        if is_converged:
+        # If Kratos and the interface between Kratos and the UVEC have converged, return True
+        if is_converged and instance.uvec_controller.is_interface_converged:
             return True
 
     # If Kratos has not converged, return False
-    return False
\ No newline at end of file
+    return False
@@ -0,0 +1,86 @@
+from typing import List
+
+import numpy as np
+
+import KratosMultiphysics
+import KratosMultiphysics.StructuralMechanicsApplication as KSM
+
+
+class MovingLoadOutputTrigger:
+    """
+    Output trigger which is active while a moving load is within a given distance of the output nodes. The current
+    location of a moving load is given by the conditions with a non-zero point load, as set by the moving load
+    process and the UVEC controller. The distance is measured between the nodes of the loaded conditions and the
+    output nodes.
+
+    Attributes:
+        - distance (float): maximum distance between the moving load and the output nodes
+        - __output_coordinates (np.ndarray): coordinates of the output nodes, shape (n_nodes, 3)
+        - __load_expressions (List[KratosMultiphysics.Expression.ConditionExpression]): expressions used to read the
+            point loads of all conditions of a load model part in a single call
+        - __condition_coordinates (List[np.ndarray]): per load model part, the coordinates of the condition nodes,
+            shape (n_points, 3)
+        - __point_conditions (List[np.ndarray]): per load model part, the index of the condition of each point
+        - __precision (float): loads with an absolute value below this precision are considered zero
+    """
+
+    def __init__(self, load_model_parts: List[KratosMultiphysics.ModelPart], output_coordinates: np.ndarray,
+                 distance: float, precision: float = 1e-12):
+        """
+        Constructor of the MovingLoadOutputTrigger. The coordinates of the condition nodes are collected once.
+
+        Args:
+            - load_model_parts (List[KratosMultiphysics.ModelPart]): model parts containing the moving load conditions
+            - output_coordinates (np.ndarray): coordinates of the output nodes, shape (n_nodes, 3)
+            - distance (float): maximum distance between the moving load and the output nodes
+            - precision (float): loads with an absolute value below this precision are considered zero
+        """
+        if distance < 0:
+            raise ValueError(f"The distance of the moving load trigger should be positive, but is: {distance}")
+
+        self.distance = distance
+        self.__output_coordinates = np.asarray(output_coordinates, dtype=float).reshape(-1, 3)
+        self.__precision = precision
+
+        self.__load_expressions = []
+        self.__condition_coordinates = []
+        self.__point_conditions = []
+        for model_part in load_model_parts:
+            self.__load_expressions.append(KratosMultiphysics.Expression.ConditionExpression(model_part))
+
+            coordinates = []
+            point_conditions = []
+            for condition_index, condition in enumerate(model_part.Conditions):
+                for node in condition.GetGeometry():
+                    coordinates.append([node.X0, node.Y0, node.Z0])
+                    point_conditions.append(condition_index)
+
+            self.__condition_coordinates.append(np.asarray(coordinates, dtype=float).reshape(-1, 3))
+            self.__point_conditions.append(np.asarray(point_conditions, dtype=int))
+
+    def is_active(self) -> bool:
+        """
+        Checks whether a moving load is within the trigger distance of any of the output nodes.
+
+        Returns:
+            - bool: True if a moving load is within the trigger distance
+        """
+        if len(self.__output_coordinates) == 0:
+            return False
+
+        for expression, coordinates, point_conditions in zip(self.__load_expressions, self.__condition_coordinates,
+                                                             self.__point_conditions):
+            KratosMultiphysics.Expression.VariableExpressionIO.Read(expression, KSM.POINT_LOAD)
+            is_loaded = np.any(np.abs(expression.Evaluate()) >= self.__precision, axis=1)
+
+            # a moving load is located at a few conditions, only their nodes are compared with the output nodes
+            loaded_coordinates = coordinates[is_loaded[point_conditions]]
+            if len(loaded_coordinates) == 0:
+                continue
+
+            squared_distances = np.sum((loaded_coordinates[:, np.newaxis, :] -
+                                        self.__output_coordinates[np.newaxis, :, :]) ** 2, axis=2)
+            if np.min(squared_distances) <= self.distance ** 2:
+                return True
+
+        return False
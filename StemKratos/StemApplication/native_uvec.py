@@ -0,0 +1,115 @@
+import ctypes
+import json
+from typing import Any, Dict
+
+import numpy as np
+
+# pointer to a double buffer in the C ABI
+DOUBLE_POINTER = ctypes.POINTER(ctypes.c_double)
+
+# suffix of the optional initialisation function of a native UVEC model
+INITIALISE_SUFFIX = "_initialise"
+
+
+class NativeUvecModel:
+    """
+    UVEC model in a compiled shared library (.so, .dll or .dylib), which is called through ctypes. The native model is
+    called with the python UVEC interface, i.e. with a dictionary in which "u", "theta" and "loads" contain one row
+    per axle. The displacements, rotations and loads are exchanged through preallocated, contiguous double buffers.
+
+    The shared library exports the UVEC function with the following C ABI:
+
+    .. code-block:: c
+
+        int uvec_method(int n_axles, double t, double dt, int time_index,
+                        const double* u, const double* theta, double* loads);
+
+    where "u", "theta" and "loads" are row major buffers of n_axles x 3 doubles. The function writes the loads on the
+    axles and returns 0 on success. The native model keeps its own state. Optionally, the library exports:
+
+    .. code-block:: c
+
+        int uvec_method_initialise(int n_axles, const char* parameters_json);
+
+    which is called once with the "parameters" of the UVEC data as json string, and returns 0 on success.
+
+    Attributes:
+        - library_path (str): path to the shared library
+        - function_name (str): name of the UVEC function in the shared library
+        - n_axles (int): number of axles
+        - u (np.ndarray): buffer of the displacements at the axles, shape (n_axles, 3)
+        - theta (np.ndarray): buffer of the rotations at the axles, shape (n_axles, 3)
+        - loads (np.ndarray): buffer of the loads on the axles, shape (n_axles, 3)
+        - __library (ctypes.CDLL): the loaded shared library
+        - __function (ctypes._CFuncPtr): the UVEC function
+    """
+
+    def __init__(self, library_path: str, function_name: str, n_axles: int):
+        """
+        Constructor of the NativeUvecModel, the shared library is loaded and the buffers are allocated.
+
+        Args:
+            - library_path (str): path to the shared library
+            - function_name (str): name of the UVEC function in the shared library
+            - n_axles (int): number of axles
+        """
+        self.library_path = library_path
+        self.function_name = function_name
+        self.n_axles = n_axles
+
+        self.__library = ctypes.CDLL(library_path)
+        if not hasattr(self.__library, function_name):
+            raise ValueError(f"Function: {function_name} is not exported by UVEC library: {library_path}")
+
+        self.__function = getattr(self.__library, function_name)
+        self.__function.argtypes = [ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_int,
+                                    DOUBLE_POINTER, DOUBLE_POINTER, DOUBLE_POINTER]
+        self.__function.restype = ctypes.c_int
+
+        self.u = np.zeros((n_axles, 3))
+        self.theta = np.zeros((n_axles, 3))
+        self.loads = np.zeros((n_axles, 3))
+
+    def initialise(self, parameters: Dict[str, Any]):
+        """
+        Calls the optional initialisation function of the native model with the UVEC parameters.
+
+        Args:
+            - parameters (Dict[str, Any]): the parameters of the UVEC data
+        """
+        initialise_name = self.function_name + INITIALISE_SUFFIX
+        if not hasattr(self.__library, initialise_name):
+            return
+
+        initialise_function = getattr(self.__library, initialise_name)
+        initialise_function.argtypes = [ctypes.c_int, ctypes.c_char_p]
+        initialise_function.restype = ctypes.c_int
+
+        status = initialise_function(self.n_axles, json.dumps(parameters).encode())
+        if status != 0:
+            raise RuntimeError(f"Initialising UVEC function: {self.function_name} of library: {self.library_path} "
+                               f"failed with status: {status}")
+
+    def __call__(self, uvec_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Calls the native UVEC function. The displacements and rotations are copied to the buffers, the loads are
+        returned in the load buffer.
+
+        Args:
+            - uvec_data (Dict[str, Any]): input data for the uvec model, in the form of the python interface
+
+        Returns:
+            - Dict[str, Any]: the uvec data, containing the loads
+        """
+        np.copyto(self.u, uvec_data["u"])
+        np.copyto(self.theta, uvec_data["theta"])
+
+        status = self.__function(self.n_axles, uvec_data["t"], uvec_data["dt"], uvec_data["time_index"],
+                                 self.u.ctypes.data_as(DOUBLE_POINTER), self.theta.ctypes.data_as(DOUBLE_POINTER),
+                                 self.loads.ctypes.data_as(DOUBLE_POINTER))
+        if status != 0:
+            raise RuntimeError(f"UVEC function: {self.function_name} of library: {self.library_path} failed with "
+                               f"status: {status}")
+
+        uvec_data["loads"] = self.loads
+        return uvec_data
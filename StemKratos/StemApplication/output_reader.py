@@ -0,0 +1,409 @@
+import mmap
+import os
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import orjson
+
+from KratosMultiphysics.StemApplication.binary_output_utilities import SEPARATOR, VARIABLE_TIME, read_binary_output
+from KratosMultiphysics.StemApplication.compressed_output_container import (read_chunk_index, read_compressed_output,
+                                                                            read_compressed_output_time)
+
+# structural characters of the json output which are tracked while building the index
+_JSON_TOKEN = re.compile(rb'[{}\[\]"]')
+
+# version of the json index file, an index file with another version is rebuilt
+_JSON_INDEX_VERSION = 1
+
+
+class StemOutputReader:
+    """
+    Lazy, selective reader of the output of the FastJsonOutputProcess. Only the requested entities, variables and
+    time range are read. The format is derived from the path: a ".json" file, a ".npz" bundle, a ".chunks"
+    container or a directory with ".npy" files.
+
+    The npy files are memory mapped and the arrays of an npz bundle are only loaded when accessed. Of a chunked
+    container, only the chunks which overlap the time range are decompressed, and the output times are read without
+    decompressing any chunk. Of a json file, an index with the byte ranges of all series is built on first access,
+    such that only the requested series are parsed. The index is stored next to the json file and reused as long as
+    the json file is not modified.
+
+    Attributes:
+        - output_path (Path): path of the output
+        - output_format (str): format of the output, "json", "npy", "npz" or "chunked"
+        - use_index_file (bool): whether the index of a json file is stored in and read from an index file
+        - __arrays (Optional[dict]): lazily loaded output arrays of a binary output
+        - __json_file (Optional[BinaryIO]): opened json file
+        - __json_buffer (Optional[mmap.mmap]): memory mapped json file
+        - __json_index (Optional[Dict[str, dict]]): per top level key of the json file, the byte range of its value
+            and of the values of its series
+        - __time (Optional[np.ndarray]): the output times
+    """
+
+    def __init__(self, output_path: str, use_index_file: bool = True):
+        """
+        Constructor of the StemOutputReader, the output is not read until it is accessed.
+
+        Args:
+            - output_path (str): path of the output
+            - use_index_file (bool): whether the index of a json file is stored in and read from an index file
+        """
+        self.output_path = Path(output_path)
+        self.use_index_file = use_index_file
+
+        if self.output_path.is_dir():
+            self.output_format = "npy"
+        elif self.output_path.suffix in [".json", ".npz", ".chunks"]:
+            self.output_format = {".json": "json", ".npz": "npz", ".chunks": "chunked"}[self.output_path.suffix]
+        else:
+            raise ValueError(f"Format of output: {self.output_path} cannot be derived, expected a .json, .npz or "
+                             f".chunks file or a directory with .npy files")
+
+        self.__arrays = None
+        self.__json_buffer = None
+        self.__json_file = None
+        self.__json_index = None
+        self.__time = None
+
+    def __enter__(self) -> "StemOutputReader":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Closes the memory mapped and opened files.
+        """
+        if self.__json_buffer is not None:
+            self.__json_buffer.close()
+            self.__json_file.close()
+            self.__json_buffer = None
+            self.__json_file = None
+
+        if self.__arrays is not None and hasattr(self.__arrays, "close"):
+            self.__arrays.close()
+        self.__arrays = None
+
+    @property
+    def time(self) -> np.ndarray:
+        """
+        Returns the output times.
+
+        Returns:
+            - np.ndarray: the output times
+        """
+        if self.__time is None:
+            if self.output_format == "json":
+                self.__time = np.asarray(self.__read_json_value("TIME"), dtype=float)
+            elif self.output_format == "chunked":
+                self.__time = read_compressed_output_time(self.output_path)
+            else:
+                self.__time = np.asarray(self.__get_arrays()["TIME"])
+        return self.__time
+
+    @property
+    def keys(self) -> List[str]:
+        """
+        Returns the keys of the entities in the output, e.g. "NODE_1", "ELEMENT_1" or "RESULTANT".
+
+        Returns:
+            - List[str]: the keys of the entities
+        """
+        if self.output_format == "json":
+            return [key for key in self.__get_json_index().keys() if key not in ["TIME", VARIABLE_TIME]]
+
+        if self.output_format == "chunked":
+            # the keys are stored in every chunk, only the first chunk is read
+            chunk_index = read_chunk_index(self.output_path)
+            if len(chunk_index) == 0:
+                return []
+            arrays = read_compressed_output(self.output_path, chunk_index[0].start_time, chunk_index[0].start_time)
+        else:
+            arrays = self.__get_arrays()
+        return [key for name in arrays.keys() if name.endswith(SEPARATOR + "KEYS")
+                for key in np.asarray(arrays[name]).tolist()]
+
+    def read(self, node_ids: Optional[List[int]] = None, element_ids: Optional[List[int]] = None,
+             variables: Optional[List[str]] = None, start_time: Optional[float] = None,
+             end_time: Optional[float] = None) -> dict:
+        """
+        Reads a selection of the output. If neither node ids nor element ids are given, all entities are read,
+        including the resultant.
+
+        Args:
+            - node_ids (Optional[List[int]]): ids of the nodes to be read
+            - element_ids (Optional[List[int]]): ids of the elements to be read
+            - variables (Optional[List[str]]): names of the variables to be read, e.g. "DISPLACEMENT" or
+              "DISPLACEMENT_X", None reads all variables
+            - start_time (Optional[float]): first output time to be read, None reads from the start
+            - end_time (Optional[float]): last output time to be read, None reads until the end
+
+        Returns:
+            - dict: the selected output in the layout of the json output, where the series are numpy arrays
+        """
+        lower = -np.inf if start_time is None else start_time
+        upper = np.inf if end_time is None else end_time
+
+        if node_ids is None and element_ids is None:
+            entity_keys = self.keys
+        else:
+            entity_keys = ([f"NODE_{node_id}" for node_id in node_ids or []] +
+                           [f"ELEMENT_{element_id}" for element_id in element_ids or []])
+            missing_keys = sorted(set(entity_keys) - set(self.keys))
+            if len(missing_keys) > 0:
+                raise ValueError(f"Entities: {missing_keys} are not in output: {self.output_path}")
+
+        if self.output_format == "json":
+            return self.__read_json(entity_keys, variables, lower, upper)
+
+        if self.output_format == "chunked":
+            arrays = read_compressed_output(self.output_path, start_time, end_time)
+        else:
+            arrays = self.__get_arrays()
+        return self.__read_arrays(arrays, entity_keys, variables, lower, upper)
+
+    @staticmethod
+    def __is_selected_series(series_name: str, variables: Optional[List[str]]) -> bool:
+        """
+        Checks whether a series belongs to the selected variables, the X, Y and Z series belong to their variable.
+
+        Args:
+            - series_name (str): name of the series
+            - variables (Optional[List[str]]): names of the selected variables, None selects all variables
+
+        Returns:
+            - bool: True if the series is selected
+        """
+        if variables is None:
+            return True
+        return any(series_name == variable or series_name in [variable + "_X", variable + "_Y", variable + "_Z"]
+                   for variable in variables)
+
+    @staticmethod
+    def __get_time_slice(time: np.ndarray, lower: float, upper: float) -> slice:
+        """
+        Returns the slice of the output steps within the time range, the output times are increasing.
+
+        Args:
+            - time (np.ndarray): the output times
+            - lower (float): first output time of the range
+            - upper (float): last output time of the range
+
+        Returns:
+            - slice: the slice of the output steps
+        """
+        return slice(int(np.searchsorted(time, lower, side="left")), int(np.searchsorted(time, upper, side="right")))
+
+    def __get_arrays(self):
+        """
+        Opens the arrays of a binary output. Npy files are memory mapped, the arrays of an npz bundle are loaded when
+        accessed.
+
+        Returns:
+            - the output arrays
+        """
+        if self.__arrays is None:
+            if self.output_format == "npz":
+                self.__arrays = np.load(self.output_path)
+            else:
+                self.__arrays = read_binary_output(self.output_path, mmap_mode="r")
+        return self.__arrays
+
+    def __read_arrays(self, arrays, entity_keys: List[str], variables: Optional[List[str]], lower: float,
+                      upper: float) -> dict:
+        """
+        Reads a selection of the output arrays of a binary output.
+
+        Args:
+            - arrays: the output arrays, in the layout of the binary output
+            - entity_keys (List[str]): keys of the entities to be read
+            - variables (Optional[List[str]]): names of the variables to be read, None reads all variables
+            - lower (float): first output time to be read
+            - upper (float): last output time to be read
+
+        Returns:
+            - dict: the selected output in the layout of the json output
+        """
+        names = list(arrays.keys())
+        time = np.asarray(arrays["TIME"])
+        time_slice = self.__get_time_slice(time, lower, upper)
+        data = {"TIME": time[time_slice]}
+
+        variable_time_slices = {}
+        for name in names:
+            if name.startswith(VARIABLE_TIME + SEPARATOR):
+                series_name = name.split(SEPARATOR, 1)[1]
+                if self.__is_selected_series(series_name, variables):
+                    variable_time = np.asarray(arrays[name])
+                    variable_time_slices[series_name] = self.__get_time_slice(variable_time, lower, upper)
+                    data.setdefault(VARIABLE_TIME, {})[series_name] = \
+                        variable_time[variable_time_slices[series_name]]
+
+        for keys_name in [name for name in names if name.endswith(SEPARATOR + "KEYS")]:
+            group = keys_name[:-len(SEPARATOR + "KEYS")]
+            group_keys = np.asarray(arrays[keys_name]).tolist()
+            gauss_point_series = np.asarray(arrays[group + SEPARATOR + "GAUSS_POINT_SERIES"]).tolist()
+
+            selected = [(index, key) for index, key in enumerate(group_keys) if key in entity_keys]
+            if len(selected) == 0:
+                continue
+            indices = [index for index, _ in selected]
+            for _, key in selected:
+                data[key] = {}
+
+            for name in names:
+                series_name = name[len(group + SEPARATOR):]
+                if (not name.startswith(group + SEPARATOR) or series_name in ["KEYS", "GAUSS_POINT_SERIES"] or
+                        not self.__is_selected_series(series_name, variables)):
+                    continue
+
+                series_time_slice = variable_time_slices.get(series_name, time_slice)
+                # only the selected rows and output steps are read from a memory mapped array
+                values = np.asarray(arrays[name])[indices]
+                for (_, key), entity_values in zip(selected, values):
+                    if series_name in gauss_point_series:
+                        data[key][series_name] = {str(gp): np.array(gp_values[series_time_slice])
+                                                  for gp, gp_values in enumerate(entity_values)}
+                    else:
+                        data[key][series_name] = np.array(entity_values[series_time_slice])
+
+        return data
+
+    def __read_json(self, entity_keys: List[str], variables: Optional[List[str]], lower: float,
+                    upper: float) -> dict:
+        """
+        Reads a selection of a json output, only the selected series are parsed.
+
+        Args:
+            - entity_keys (List[str]): keys of the entities to be read
+            - variables (Optional[List[str]]): names of the variables to be read, None reads all variables
+            - lower (float): first output time to be read
+            - upper (float): last output time to be read
+
+        Returns:
+            - dict: the selected output in the layout of the json output
+        """
+        index = self.__get_json_index()
+        time_slice = self.__get_time_slice(self.time, lower, upper)
+        data = {"TIME": self.time[time_slice]}
+
+        variable_time_slices = {}
+        for series_name in index.get(VARIABLE_TIME, {}).get("series", {}).keys():
+            if self.__is_selected_series(series_name, variables):
+                variable_time = np.asarray(self.__read_json_value(VARIABLE_TIME, series_name), dtype=float)
+                variable_time_slices[series_name] = self.__get_time_slice(variable_time, lower, upper)
+                data.setdefault(VARIABLE_TIME, {})[series_name] = variable_time[variable_time_slices[series_name]]
+
+        for key in entity_keys:
+            data[key] = {}
+            for series_name in index[key]["series"].keys():
+                if not self.__is_selected_series(series_name, variables):
+                    continue
+
+                series_time_slice = variable_time_slices.get(series_name, time_slice)
+                values = self.__read_json_value(key, series_name)
+                if isinstance(values, dict):
+                    data[key][series_name] = {gp: np.asarray(gp_values[series_time_slice], dtype=float)
+                                              for gp, gp_values in values.items()}
+                else:
+                    data[key][series_name] = np.asarray(values[series_time_slice], dtype=float)
+
+        return data
+
+    def __read_json_value(self, key: str, series_name: Optional[str] = None):
+        """
+        Parses a single value of the json output, using the byte ranges of the index.
+
+        Args:
+            - key (str): top level key of the value
+            - series_name (Optional[str]): name of the series within the top level value, None parses the top
+              level value
+
+        Returns:
+            - the parsed value
+        """
+        entry = self.__get_json_index()[key]
+        start, end = entry["span"] if series_name is None else entry["series"][series_name]
+        return orjson.loads(self.__json_buffer[start:end])
+
+    def __get_json_index(self) -> Dict[str, dict]:
+        """
+        Returns the index of the json output. The index is read from the index file if it belongs to the current
+        json file, otherwise it is built and stored.
+
+        Returns:
+            - Dict[str, dict]: per top level key, the byte range of its value and of the values of its series
+        """
+        if self.__json_index is not None:
+            return self.__json_index
+
+        self.__json_file = open(self.output_path, "rb")
+        self.__json_buffer = mmap.mmap(self.__json_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        stat = os.stat(self.output_path)
+        file_signature = [_JSON_INDEX_VERSION, stat.st_size, stat.st_mtime_ns]
+        index_path = self.output_path.with_suffix(self.output_path.suffix + ".index")
+
+        if self.use_index_file and index_path.is_file():
+            with open(index_path, "rb") as index_file:
+                stored_index = orjson.loads(index_file.read())
+            if stored_index["signature"] == file_signature:
+                self.__json_index = stored_index["index"]
+                return self.__json_index
+
+        self.__json_index = build_json_index(self.__json_buffer)
+
+        if self.use_index_file:
+            with open(index_path, "wb") as index_file:
+                index_file.write(orjson.dumps({"signature": file_signature, "index": self.__json_index}))
+
+        return self.__json_index
+
+
+def build_json_index(buffer) -> Dict[str, dict]:
+    """
+    Builds the index of a json output, containing per top level key the byte range of its value and of the values of
+    its series. Only the structural characters of the file are visited, the numbers are skipped. The keys of the json
+    output do not contain escaped quotes.
+
+    Args:
+        - buffer: the contents of the json file, e.g. a memory mapped file
+
+    Returns:
+        - Dict[str, dict]: per top level key, {"span": (start, end), "series": {series_name: (start, end)}}
+    """
+    index: Dict[str, dict] = {}
+
+    # per open container: its start position and the keys under which it is stored, None for deeper containers
+    stack: List[Tuple[int, Optional[Tuple[str, ...]]]] = []
+    current_keys: List[Optional[str]] = [None, None]
+
+    position = 0
+    while True:
+        match = _JSON_TOKEN.search(buffer, position)
+        if match is None:
+            break
+        token = match.group()
+        position = match.end()
+
+        if token == b'"':
+            end = buffer.find(b'"', position)
+            # only the top level keys and the series names are tracked, deeper keys are gauss point indices
+            if 1 <= len(stack) <= 2:
+                current_keys[len(stack) - 1] = buffer[position:end].decode()
+            position = end + 1
+        elif token in [b"{", b"["]:
+            stack.append((match.start(), tuple(current_keys[:len(stack)]) if len(stack) <= 2 else None))
+        else:
+            start, keys = stack.pop()
+            if keys is None:
+                continue
+            if len(keys) == 1:
+                index.setdefault(keys[0], {"series": {}})["span"] = (start, match.end())
+            elif len(keys) == 2:
+                index.setdefault(keys[0], {"series": {}})["series"][keys[1]] = (start, match.end())
+
+    return index
@@ -0,0 +1,287 @@
+import os
+import warnings
+from array import array
+from typing import Dict, List
+
+import numpy as np
+
+import KratosMultiphysics
+from KratosMultiphysics.StemApplication.binary_output_utilities import (BINARY_OUTPUT_FORMATS, SEPARATOR,
+                                                                        get_binary_output_path,
+                                                                        convert_arrays_to_output_data,
+                                                                        write_binary_arrays)
+from KratosMultiphysics.StemApplication.fast_json_output_process import fast_write_external_json
+
+
+class ProbeOutputProcess(KratosMultiphysics.Process):
+    """
+    This process writes the nodal solution at arbitrary coordinates, e.g. sensor positions, which do not have to
+    coincide with the nodes of the mesh. The element containing each probe and the shape function values of the probe
+    within that element are found once before the solution loop, using a bin based spatial search. Each output step,
+    the values of the nodes of these elements are gathered and interpolated with a single weighted sum.
+
+    The output has the layout of the FastJsonOutputProcess, where the probes are stored as "PROBE_<number>", numbered
+    in the order of the given coordinates. Next to json, the output can be written as npy or npz arrays.
+
+    By default, the output file is only written at the end of the stage, since each flush rewrites the complete output
+    file. A positive "flush_interval" keeps intermediate results on disk in case the calculation is interrupted.
+
+    Inheritance:
+        - :class:`KratosMultiphysics.Process`
+
+    Attributes:
+        - model_part (KratosMultiphysics.ModelPart): model part in which the probes are located
+        - settings (KratosMultiphysics.Parameters): settings of the process
+        - output_file_name (str): name of the output json file
+        - output_format (str): format of the output, "json", "npy" or "npz"
+        - precision (str): floating point precision of the binary output, "float64" or "float32"
+        - flush_interval (int): number of output steps between writing the output file, 0 means that the output file
+            is only written at the end of the stage
+        - step_frequency (int): number of solution steps between output steps, 0 means that the time frequency is
+            used
+        - frequency (float): time between output steps, read from "time_frequency" as in the JsonOutputProcess
+        - probe_coordinates (np.ndarray): coordinates of the probes, shape (n_probes, 3)
+        - __nodes (List[KratosMultiphysics.Node]): the nodes of the elements containing the probes
+        - __weights (np.ndarray): interpolation weights of the nodes per probe, shape (n_probes, n_nodes)
+        - __series (list): per variable, whether the variable has components and the interpolated values per output
+            step
+        - __time (array): the output times
+        - __time_counter (float): time since the last output step
+        - __n_unflushed_steps (int): number of output steps which are not yet written to the output file
+    """
+
+    def __init__(self, model: KratosMultiphysics.Model, settings: KratosMultiphysics.Parameters):
+        """
+        Constructor of the ProbeOutputProcess.
+
+        Args:
+            - model (KratosMultiphysics.Model): the model containing the model part
+            - settings (KratosMultiphysics.Parameters): settings of the process, including:
+                - "model_part_name": Name of the model part in which the probes are located.
+                - "output_file_name": Name of the output json file.
+                - "output_variables": List of nodal variables to output.
+                - "probe_coordinates": List of coordinates of the probes.
+                - "historical_value": Whether to output historical values or not.
+                - "time_frequency": Time between output steps.
+                - "step_frequency": Number of solution steps between output steps, 0 means that the time
+                  frequency is used.
+                - "flush_interval": Number of output steps between writing the output file, 0 means that the
+                  output file is only written at the end of the stage.
+                - "output_format": Format of the output, "json", "npy" or "npz".
+                - "precision": Floating point precision of the binary output, "float64" or "float32".
+        """
+        KratosMultiphysics.Process.__init__(self)
+
+        default_settings = KratosMultiphysics.Parameters("""{
+            "help"              : "This process writes the nodal solution at arbitrary coordinates",
+            "model_part_name"   : "",
+            "output_file_name"  : "",
+            "output_variables"  : [],
+            "probe_coordinates" : [],
+            "historical_value"  : true,
+            "time_frequency"    : 1.0,
+            "step_frequency"    : 0,
+            "flush_interval"    : 0,
+            "output_format"     : "json",
+            "precision"         : "float64"
+        }""")
+        settings.ValidateAndAssignDefaults(default_settings)
+        self.settings = settings
+
+        self.model_part = model.GetModelPart(settings["model_part_name"].GetString())
+        self.output_file_name = settings["output_file_name"].GetString()
+        self.output_format = settings["output_format"].GetString().lower()
+        self.precision = settings["precision"].GetString().lower()
+        self.flush_interval = settings["flush_interval"].GetInt()
+        self.step_frequency = settings["step_frequency"].GetInt()
+        self.frequency = settings["time_frequency"].GetDouble()
+
+        if self.output_format != "json" and self.output_format not in BINARY_OUTPUT_FORMATS:
+            raise ValueError(f"Output format: {self.output_format} is not supported, available formats are: "
+                             f"{['json'] + BINARY_OUTPUT_FORMATS}")
+
+        self.probe_coordinates = np.asarray([settings["probe_coordinates"][i].GetVector()
+                                             for i in range(settings["probe_coordinates"].size())], dtype=float)
+        if self.probe_coordinates.ndim != 2 or self.probe_coordinates.shape[1] != 3:
+            raise ValueError("The probe coordinates should be a list of coordinates with 3 values")
+
+        self.__nodes = []
+        self.__weights = np.empty((0, 0))
+        self.__series = []
+        self.__time = array("d")
+        self.__time_counter = 0.0
+        self.__n_unflushed_steps = 0
+
+    def ExecuteBeforeSolutionLoop(self):
+        """
+        Locates the probes in the mesh and computes the interpolation weights. This function name cannot be changed.
+        This name is recognised by Kratos.
+        """
+        self.__locate_probes()
+
+        self.__series = []
+        for variable_name in self.settings["output_variables"].GetStringArray():
+            variable = KratosMultiphysics.KratosGlobals.GetVariable(variable_name)
+            variable_type = KratosMultiphysics.KratosGlobals.GetVariableType(variable_name)
+            if variable_type == "Double":
+                self.__series.append((variable, False, []))
+            elif variable_type == "Array":
+                self.__series.append((variable, True, []))
+            else:
+                warnings.warn(f"Variable: {variable_name} of type: {variable_type} is not supported by the "
+                              f"ProbeOutputProcess and is not written to the output.")
+
+        self.__time = array("d")
+        self.__time_counter = 0.0
+
+        # binary output is written to a separate path
+        if self.output_format != "json" and os.path.isfile(self.output_file_name):
+            os.remove(self.output_file_name)
+
+        # write the structure of the output
+        self.flush()
+
+    def __locate_probes(self):
+        """
+        Finds the element containing each probe with a bin based point locator and stores the shape function values
+        of the probes as weights of the element nodes.
+        """
+        if self.model_part.ProcessInfo[KratosMultiphysics.DOMAIN_SIZE] == 3:
+            locator = KratosMultiphysics.BinBasedFastPointLocator3D(self.model_part)
+        else:
+            locator = KratosMultiphysics.BinBasedFastPointLocator2D(self.model_part)
+        locator.UpdateSearchDatabase()
+
+        node_indices: Dict[int, int] = {}
+        self.__nodes = []
+        entries = []
+        missing_probes = []
+        for probe_index, coordinates in enumerate(self.probe_coordinates):
+            is_found, shape_function_values, element = locator.FindPointOnMesh(
+                KratosMultiphysics.Array3(list(coordinates)))
+            if not is_found:
+                missing_probes.append(coordinates.tolist())
+                continue
+
+            for node, weight in zip(element.GetGeometry(), shape_function_values):
+                if node.Id not in node_indices:
+                    node_indices[node.Id] = len(self.__nodes)
+                    self.__nodes.append(node)
+                entries.append((probe_index, node_indices[node.Id], weight))
+
+        if len(missing_probes) > 0:
+            raise ValueError(f"Probes at coordinates: {missing_probes} are not located within an element of model "
+                             f"part: {self.model_part.Name}")
+
+        self.__weights = np.zeros((len(self.probe_coordinates), len(self.__nodes)))
+        for probe_index, node_index, weight in entries:
+            self.__weights[probe_index, node_index] += weight
+
+    def __interpolate(self, variable: KratosMultiphysics.VariableData) -> np.ndarray:
+        """
+        Interpolates the nodal values of a variable to the probes.
+
+        Args:
+            - variable (KratosMultiphysics.VariableData): the output variable
+
+        Returns:
+            - np.ndarray: the values at the probes, with the probes as first dimension
+        """
+        if self.settings["historical_value"].GetBool():
+            nodal_values = [node.GetSolutionStepValue(variable) for node in self.__nodes]
+        else:
+            nodal_values = [node.GetValue(variable) for node in self.__nodes]
+
+        return self.__weights @ np.asarray(nodal_values, dtype=float)
+
+    def __is_output_step(self) -> bool:
+        """
+        Checks whether the current solution step is an output step. With a step frequency, the step index is used,
+        otherwise the time frequency is used.
+
+        Returns:
+            - bool: True if the current solution step is an output step
+        """
+        if self.step_frequency > 0:
+            return self.model_part.ProcessInfo[KratosMultiphysics.STEP] % self.step_frequency == 0
+
+        self.__time_counter += self.model_part.ProcessInfo[KratosMultiphysics.DELTA_TIME]
+        if self.__time_counter > self.frequency:
+            self.__time_counter = 0.0
+            return True
+        return False
+
+    def ExecuteFinalizeSolutionStep(self):
+        """
+        Interpolates the output variables to the probes and adds them to the output data. The output data is written
+        to the output file every flush interval. This function name cannot be changed. This name is recognised by
+        Kratos.
+        """
+        if not self.__is_output_step():
+            return
+
+        self.__time.append(self.model_part.ProcessInfo[KratosMultiphysics.TIME])
+        for variable, _, steps in self.__series:
+            steps.append(self.__interpolate(variable))
+
+        self.__n_unflushed_steps += 1
+        if self.flush_interval > 0 and self.__n_unflushed_steps >= self.flush_interval:
+            self.flush()
+
+    def ExecuteFinalize(self):
+        """
+        Writes the output data which is not yet written to the output file. This function name cannot be changed.
+        This name is recognised by Kratos.
+        """
+        if self.__n_unflushed_steps > 0:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes the accumulated output data to the output file.
+        """
+        n_probes = len(self.probe_coordinates)
+        arrays = {"TIME": np.frombuffer(self.__time, dtype=np.float64),
+                  "PROBE" + SEPARATOR + "KEYS": np.asarray([f"PROBE_{i + 1}" for i in range(n_probes)], dtype=str),
+                  "PROBE" + SEPARATOR + "GAUSS_POINT_SERIES": np.asarray([], dtype=str)}
+
+        for variable, has_components, steps in self.__series:
+            if len(steps) > 0:
+                values = np.stack(steps, axis=1)
+            else:
+                values = np.empty((n_probes, 0, 3) if has_components else (n_probes, 0))
+
+            if has_components:
+                for index, component in enumerate(["_X", "_Y", "_Z"]):
+                    arrays["PROBE" + SEPARATOR + variable.Name() + component] = values[..., index]
+            else:
+                arrays["PROBE" + SEPARATOR + variable.Name()] = values
+
+        if self.output_format == "json":
+            fast_write_external_json(self.output_file_name, convert_arrays_to_output_data(arrays))
+        else:
+            write_binary_arrays(get_binary_output_path(self.output_file_name, self.output_format), arrays,
+                                self.output_format, self.precision)
+
+        self.__n_unflushed_steps = 0
+
+
+def Factory(settings: KratosMultiphysics.Parameters, model: KratosMultiphysics.Model) -> ProbeOutputProcess:
+    """
+    This function creates a process writing the nodal solution at arbitrary coordinates. This function name cannot be
+    changed. This name is recognised by Kratos.
+
+    Args:
+        - settings (KratosMultiphysics.Parameters): settings of the process
+        - model (KratosMultiphysics.Model): Kratos model containing the model part
+
+    raises:
+        - Exception: if the settings are not correct
+
+    returns:
+        - :class:`ProbeOutputProcess`: process writing the nodal solution at the probes
+    """
+    if not isinstance(settings, KratosMultiphysics.Parameters):
+        raise Exception("expected input shall be a Parameters object, encapsulating a json string")
+
+    return ProbeOutputProcess(model, settings["Parameters"])
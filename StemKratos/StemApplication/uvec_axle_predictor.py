@@ -0,0 +1,123 @@
+from collections import deque
+from typing import Deque, Optional, Tuple
+
+import numpy as np
+
+import KratosMultiphysics
+
+# available predictors of the axle data at the start of a time step, with the order of the extrapolation
+AXLE_PREDICTOR_ORDERS = {"none": None, "linear": 1, "quadratic": 2}
+
+
+class UvecAxlePredictor:
+    """
+    Predictor of the displacements at and the loads on the axles at the start of a time step, extrapolated in time
+    from the converged values of the previous time steps. The values are extrapolated with a Lagrange polynomial
+    through the last order + 1 time steps, such that a varying time step is accounted for. As long as fewer time steps
+    are stored, the order of the extrapolation is reduced.
+
+    Attributes:
+        - order (int): order of the extrapolation, 1 for linear and 2 for quadratic extrapolation
+        - __times (Deque[float]): times of the stored time steps, newest first
+        - __u (Deque[np.ndarray]): displacements at the axles of the stored time steps, shape (n_axles, 3)
+        - __loads (Deque[np.ndarray]): loads on the axles of the stored time steps, shape (n_axles, 3)
+    """
+
+    def __init__(self, order: int):
+        """
+        Constructor of the UvecAxlePredictor.
+
+        Args:
+            - order (int): order of the extrapolation, 1 for linear and 2 for quadratic extrapolation
+        """
+        if order < 1:
+            raise ValueError(f"The order of the axle predictor should be at least 1, but is: {order}")
+
+        self.order = order
+        self.__times: Deque[float] = deque(maxlen=order + 1)
+        self.__u: Deque[np.ndarray] = deque(maxlen=order + 1)
+        self.__loads: Deque[np.ndarray] = deque(maxlen=order + 1)
+
+    def add_step(self, time: float, u: np.ndarray, loads: np.ndarray):
+        """
+        Stores the converged displacements and loads of a time step. If the time equals the time of the last stored
+        time step, the values of that time step are replaced.
+
+        Args:
+            - time (float): the time of the time step
+            - u (np.ndarray): the displacements at the axles, shape (n_axles, 3)
+            - loads (np.ndarray): the loads on the axles, shape (n_axles, 3)
+        """
+        if len(self.__times) > 0 and np.isclose(time, self.__times[0]):
+            self.__times.popleft()
+            self.__u.popleft()
+            self.__loads.popleft()
+
+        self.__times.appendleft(time)
+        self.__u.appendleft(np.array(u, dtype=float).reshape(-1, 3))
+        self.__loads.appendleft(np.array(loads, dtype=float).reshape(-1, 3))
+
+    def predict(self, time: float) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Extrapolates the displacements and loads of the stored time steps to the time of the new time step.
+
+        Args:
+            - time (float): the time of the new time step
+
+        Returns:
+            - Optional[Tuple[np.ndarray, np.ndarray]]: the predicted displacements and loads, shape (n_axles, 3),
+              None if no time step is stored
+        """
+        if len(self.__times) == 0:
+            return None
+
+        weights = self.__get_extrapolation_weights(time, np.array(self.__times))
+        u = sum(weight * u_step for weight, u_step in zip(weights, self.__u))
+        loads = sum(weight * loads_step for weight, loads_step in zip(weights, self.__loads))
+        return u, loads
+
+    @staticmethod
+    def __get_extrapolation_weights(time: float, times: np.ndarray) -> np.ndarray:
+        """
+        Gets the weights of the Lagrange polynomial through the stored time steps, evaluated at the new time.
+
+        Args:
+            - time (float): the time of the new time step
+            - times (np.ndarray): the times of the stored time steps
+
+        Returns:
+            - np.ndarray: the weight of each stored time step
+        """
+        weights = np.ones(len(times))
+        for i, time_i in enumerate(times):
+            for j, time_j in enumerate(times):
+                if i != j:
+                    weights[i] *= (time - time_j) / (time_i - time_j)
+        return weights
+
+
+def create_axle_predictor(settings: KratosMultiphysics.Parameters) -> Optional[UvecAxlePredictor]:
+    """
+    Creates the predictor of the axle data at the start of a time step.
+
+    Args:
+        - settings (KratosMultiphysics.Parameters): settings of the predictor, including:
+            - "type": Type of the predictor, "none", "linear" or "quadratic".
+
+    Returns:
+        - Optional[UvecAxlePredictor]: the predictor, None if the values of the previous time step are used
+    """
+    default_settings = KratosMultiphysics.Parameters("""{
+        "type" : "none"
+    }""")
+    settings.ValidateAndAssignDefaults(default_settings)
+
+    predictor_type = settings["type"].GetString().lower()
+    if predictor_type not in AXLE_PREDICTOR_ORDERS:
+        raise ValueError(f"UVEC axle predictor: {predictor_type} is not supported, available types are: "
+                         f"{list(AXLE_PREDICTOR_ORDERS)}")
+
+    order = AXLE_PREDICTOR_ORDERS[predictor_type]
+    if order is None:
+        return None
+    return UvecAxlePredictor(order)
@@ -0,0 +1,210 @@
+from typing import Dict, List, Optional
+
+import numpy as np
+
+import KratosMultiphysics
+import KratosMultiphysics.StructuralMechanicsApplication as KSM
+
+
+class UvecContactElements:
+    """
+    Nodal spring and damper elements which add the contact stiffness and damping of a UVEC model to the system
+    matrices of Kratos. A nodal element is created on each node of the moving load conditions. The stiffness and
+    damping of each axle are lumped to the end nodes of the condition carrying the moving load, weighted with the
+    linear shape functions at the location of the moving load, i.e. at the "MOVING_LOAD_LOCAL_DISTANCE" from the
+    first node of the condition. The elements of all other nodes have a zero stiffness and damping.
+
+    The UVEC model supplies the derivative of its loads with respect to the contact displacement and velocity, the
+    nodal elements get the opposite sign, such that the linearised load is moved from the right hand side to the
+    left hand side of the system. A nodal element with stiffness k and damping c adds the force -k u - c v to its node.
+    A nodal point load condition on each node adds k u0 + c v0, with the nodal displacement u0 and velocity v0 at the
+    call of the UVEC model. The contact elements thus only add -k (u - u0) - c (v - v0), which vanishes once the
+    coupling has converged, such that the converged solution equals the solution of the explicit coupling.
+
+    Attributes:
+        - model_part (KratosMultiphysics.ModelPart): model part of the contact elements and conditions
+        - use_damping (bool): whether the contact damping is added next to the contact stiffness
+        - __elements (Dict[int, KratosMultiphysics.Element]): the contact element per node id
+        - __conditions (Dict[int, KratosMultiphysics.Condition]): the point load condition per node id, which
+            cancels the force of the contact element at the converged state
+        - __contact_node_ids (List[int]): ids of the nodes with a non-zero contact stiffness or damping
+    """
+
+    def __init__(self, model_part: KratosMultiphysics.ModelPart, axle_model_parts: List[KratosMultiphysics.ModelPart],
+                 model_part_name: str, use_damping: bool):
+        """
+        Constructor of the UvecContactElements, the contact elements and conditions are created on the nodes of the
+        axle conditions, in a sub model part of the computational model part. A sub model part of a previous stage
+        which was not removed is replaced.
+
+        Args:
+            - model_part (KratosMultiphysics.ModelPart): the computational model part
+            - axle_model_parts (List[KratosMultiphysics.ModelPart]): model parts of the axles
+            - model_part_name (str): name of the sub model part of the contact elements
+            - use_damping (bool): whether the contact damping is added next to the contact stiffness
+        """
+        self.use_damping = use_damping
+
+        domain_size = model_part.ProcessInfo[KratosMultiphysics.DOMAIN_SIZE]
+        if domain_size not in [2, 3]:
+            raise ValueError(f"The contact elements of the UVEC model require a domain size of 2 or 3, but the domain "
+                             f"size is: {domain_size}")
+        element_type = "NodalConcentratedDampedElement" if use_damping else "NodalConcentratedElement"
+        element_name = f"{element_type}{domain_size}D1N"
+        condition_name = f"PointLoadCondition{domain_size}D1N"
+
+        if model_part.HasSubModelPart(model_part_name):
+            self.__remove_model_part(model_part.GetSubModelPart(model_part_name))
+
+        root_model_part = model_part.GetRootModelPart()
+        self.model_part = model_part.CreateSubModelPart(model_part_name)
+        properties = root_model_part.CreateNewProperties(
+            max((properties.Id for properties in root_model_part.Properties), default=0) + 1)
+        self.model_part.AddProperties(properties)
+        element_id = max((element.Id for element in root_model_part.Elements), default=0)
+        condition_id = max((condition.Id for condition in root_model_part.Conditions), default=0)
+
+        node_ids = sorted({node.Id for axle in axle_model_parts for condition in axle.Conditions
+                           for node in condition.GetGeometry()})
+        self.model_part.AddNodes(node_ids)
+
+        self.__elements: Dict[int, KratosMultiphysics.Element] = {}
+        self.__conditions: Dict[int, KratosMultiphysics.Condition] = {}
+        for node_id in node_ids:
+            element_id += 1
+            element = self.model_part.CreateNewElement(element_name, element_id, [node_id], properties)
+            # the values have to exist when the elements are initialised, such that the stiffness and damping are used
+            element.SetValue(KSM.NODAL_DISPLACEMENT_STIFFNESS, [0.0, 0.0, 0.0])
+            if use_damping:
+                element.SetValue(KSM.NODAL_DAMPING_RATIO, [0.0, 0.0, 0.0])
+            self.__elements[node_id] = element
+
+            condition_id += 1
+            condition = self.model_part.CreateNewCondition(condition_name, condition_id, [node_id], properties)
+            condition.SetValue(KSM.POINT_LOAD, [0.0, 0.0, 0.0])
+            self.__conditions[node_id] = condition
+
+        self.__contact_node_ids: List[int] = []
+
+    def update(self, conditions: List[Optional[KratosMultiphysics.Condition]], stiffness: np.ndarray,
+               damping: Optional[np.ndarray]):
+        """
+        Sets the contact stiffness and damping of the axles on the nodes of the conditions carrying the moving loads,
+        and the point loads which cancel the contact forces at the current nodal displacements and velocities. The
+        values of the previous update are cleared.
+
+        Args:
+            - conditions (List[Optional[KratosMultiphysics.Condition]]): condition carrying the moving load per axle,
+              None if the location of the moving load is not known
+            - stiffness (np.ndarray): derivative of the load with respect to the contact displacement per axle,
+              shape (n_axles, 3)
+            - damping (Optional[np.ndarray]): derivative of the load with respect to the contact velocity per axle,
+              shape (n_axles, 3)
+        """
+        nodal_stiffness = {node_id: np.zeros(3) for node_id in self.__contact_node_ids}
+        nodal_damping = {node_id: np.zeros(3) for node_id in self.__contact_node_ids}
+
+        for axle_index, condition in enumerate(conditions):
+            if condition is None:
+                continue
+            for node_id, weight in self.get_shape_function_weights(condition).items():
+                nodal_stiffness.setdefault(node_id, np.zeros(3))
+                nodal_damping.setdefault(node_id, np.zeros(3))
+                nodal_stiffness[node_id] -= weight * stiffness[axle_index]
+                if damping is not None:
+                    nodal_damping[node_id] -= weight * damping[axle_index]
+
+        for node_id, node_stiffness in nodal_stiffness.items():
+            node = self.model_part.GetNode(node_id)
+            point_load = node_stiffness * np.array(node.GetSolutionStepValue(KratosMultiphysics.DISPLACEMENT))
+
+            element = self.__elements[node_id]
+            element.SetValue(KSM.NODAL_DISPLACEMENT_STIFFNESS, KratosMultiphysics.Vector(node_stiffness))
+            if self.use_damping:
+                element.SetValue(KSM.NODAL_DAMPING_RATIO, KratosMultiphysics.Vector(nodal_damping[node_id]))
+                point_load += nodal_damping[node_id] * np.array(
+                    node.GetSolutionStepValue(KratosMultiphysics.VELOCITY))
+
+            self.__conditions[node_id].SetValue(KSM.POINT_LOAD, KratosMultiphysics.Vector(point_load))
+
+        self.__contact_node_ids = [node_id for node_id in nodal_stiffness
+                                   if np.any(nodal_stiffness[node_id] != 0) or np.any(nodal_damping[node_id] != 0)]
+
+    def remove(self):
+        """
+        Removes the contact elements and conditions from the model, such that they are not part of the system of a
+        following stage.
+        """
+        self.__remove_model_part(self.model_part)
+        self.__elements = {}
+        self.__conditions = {}
+        self.__contact_node_ids = []
+
+    @staticmethod
+    def __remove_model_part(model_part: KratosMultiphysics.ModelPart):
+        """
+        Removes the elements and conditions of a contact model part from all levels of the model, and removes the
+        contact model part itself.
+
+        Args:
+            - model_part (KratosMultiphysics.ModelPart): the contact model part
+        """
+        for element in model_part.Elements:
+            element.Set(KratosMultiphysics.TO_ERASE, True)
+        for condition in model_part.Conditions:
+            condition.Set(KratosMultiphysics.TO_ERASE, True)
+
+        root_model_part = model_part.GetRootModelPart()
+        root_model_part.RemoveElementsFromAllLevels(KratosMultiphysics.TO_ERASE)
+        root_model_part.RemoveConditionsFromAllLevels(KratosMultiphysics.TO_ERASE)
+        for properties in model_part.Properties:
+            root_model_part.RemovePropertiesFromAllLevels(properties)
+        model_part.GetParentModelPart().RemoveSubModelPart(model_part.Name)
+
+    @staticmethod
+    def get_shape_function_weights(condition: KratosMultiphysics.Condition) -> Dict[int, float]:
+        """
+        Gets the weights of the end nodes of a condition at the location of the moving load, using linear shape
+        functions along the condition.
+
+        Args:
+            - condition (KratosMultiphysics.Condition): the condition carrying the moving load
+
+        Returns:
+            - Dict[int, float]: the weight per node id
+        """
+        geometry = condition.GetGeometry()
+        first_node, last_node = geometry[0], geometry[1]
+        length = np.linalg.norm([last_node.X0 - first_node.X0, last_node.Y0 - first_node.Y0,
+                                 last_node.Z0 - first_node.Z0])
+        local_distance = condition.GetValue(KSM.MOVING_LOAD_LOCAL_DISTANCE)
+        ratio = float(np.clip(local_distance / length, 0.0, 1.0)) if length > 0 else 0.0
+        return {first_node.Id: 1.0 - ratio, last_node.Id: ratio}
+
+
+def create_contact_elements(settings: KratosMultiphysics.Parameters, model_part: KratosMultiphysics.ModelPart,
+                            axle_model_parts: List[KratosMultiphysics.ModelPart], model_part_name: str) \
+        -> Optional[UvecContactElements]:
+    """
+    Creates the contact elements of the implicit coupling between Kratos and the UVEC model.
+
+    Args:
+        - settings (KratosMultiphysics.Parameters): settings of the implicit coupling, including:
+            - "active": Whether the contact stiffness of the UVEC model is added to the system matrix.
+            - "use_damping": Whether the contact damping of the UVEC model is added to the damping matrix.
+        - model_part (KratosMultiphysics.ModelPart): the computational model part
+        - axle_model_parts (List[KratosMultiphysics.ModelPart]): model parts of the axles
+        - model_part_name (str): name of the sub model part of the contact elements
+
+    Returns:
+        - Optional[UvecContactElements]: the contact elements, None if the coupling is not implicit
+    """
+    default_settings = KratosMultiphysics.Parameters("""{
+        "active"      : false,
+        "use_damping" : false
+    }""")
+    settings.ValidateAndAssignDefaults(default_settings)
+
+    if not settings["active"].GetBool():
+        return None
+    return UvecContactElements(model_part, axle_model_parts, model_part_name, settings["use_damping"].GetBool())
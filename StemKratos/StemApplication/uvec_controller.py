@@ -1,20 +1,220 @@
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple, Union
 
 import json
 import os
 import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 
 import KratosMultiphysics
 import KratosMultiphysics.StructuralMechanicsApplication as KSM
 
+from KratosMultiphysics.StemApplication.native_uvec import NativeUvecModel
+from KratosMultiphysics.StemApplication.uvec_axle_predictor import create_axle_predictor
+from KratosMultiphysics.StemApplication.uvec_contact_elements import create_contact_elements
+from KratosMultiphysics.StemApplication.uvec_coupling_acceleration import create_coupling_accelerator
+from KratosMultiphysics.StemApplication.uvec_convergence_criterion import create_interface_convergence_criterion
+from KratosMultiphysics.StemApplication.uvec_coupling_recorder import UvecCouplingRecorder
+from KratosMultiphysics.StemApplication.uvec_state_store import UvecStateStore
+from KratosMultiphysics.StemApplication.uvec_trace import UvecReplayModel, UvecTraceWriter
+from KratosMultiphysics.StemApplication.uvec_worker import UvecWorkerModel
+
+# available interfaces between STEM and the UVEC model
+UVEC_INTERFACES = ["json", "python", "native", "replay", "worker"]
+
+# variables of the UVEC model which contain a vector per axle
+AXLE_VARIABLES = ["u", "theta", "loads"]
+
+# precision of the zero check of the load, to find the current location of the moving load
+LOAD_PRECISION = 1e-12
+
 
 class StemUvecController:
+    """
+    Controller which couples a UVEC model to Kratos. The UVEC model is called with the displacement and rotation at
+    the contact points of the axles and returns the loads on the axles.
+
+    With the "json" interface, the UVEC model is called with a json string and returns a json string. With the
+    "python" interface, the UVEC model is called with a dictionary, in which "u", "theta" and "loads" are numpy
+    arrays with one row per axle, in the order of "axle_numbers", and returns a dictionary. The python interface
+    avoids serialising the UVEC data each non-linear iteration. With the "native" interface, the UVEC model is a
+    function in a compiled shared library, see :class:`NativeUvecModel`, which is called with the data of the python
+    interface. With the "replay" interface, the UVEC model is not called, but the loads of a UVEC trace are replayed,
+    see :class:`UvecReplayModel`. With the "worker" interface, the UVEC model with the python interface runs in a
+    separate process, see :class:`UvecWorkerModel`, and the axle data is exchanged through shared memory.
+
+    The fixed point iteration between Kratos and the UVEC model can be accelerated with "uvec_acceleration", in which
+    case the accelerated loads are applied to Kratos, instead of the loads computed by the UVEC model.
+
+    With "uvec_predictor", the displacements at and the loads on the axles at the start of each time step are
+    extrapolated from the previous time steps. The first call of the UVEC model within a time step then receives the
+    predicted displacements instead of the displacements of the previous time step, and the predicted loads are the
+    starting point of the coupling acceleration and of the interface convergence criterion. The predicted loads are not
+    applied to Kratos directly, since the loads of the first call of the UVEC model are applied before Kratos is
+    solved.
+
+    With "uvec_implicit_coupling", the UVEC model may return the derivatives of the loads with respect to the contact
+    displacements and velocities, as "contact_stiffness" and "contact_damping" per axle. These are added to the system
+    matrices at the nodes of the active conditions by :class:`UvecContactElements`, such that Kratos solves the
+    linearised interaction between the vehicle and the track within each iteration. The contact elements only act on
+    the change of the nodal displacements and velocities since the UVEC call, such that the converged solution equals
+    the solution of the explicit coupling.
+
+    With "uvec_convergence_criterion", the coupling is only converged if the change of the loads and displacements at
+    the axles between consecutive calls is within the tolerances, next to the convergence of Kratos. The first call of
+    a time step is compared with the loads applied at the start of the time step.
+
+    If a "uvec_trace_file" is given, each call of the UVEC model is recorded to a binary trace, per step and
+    non-linear iteration, which can be replayed with the "replay" interface.
+
+    The condition which carries the moving load of each axle is tracked by its index in the conditions of the axle.
+    Each solution step, the index is updated by searching outward from the previous index, such that the exchange of
+    the axle data each non-linear iteration does not loop over all conditions of the track.
+
+    Optionally, the result of the UVEC model is cached within a time step: if the displacements and rotations at the
+    axles did not change more than the cache tolerance since the previous call, the UVEC model is not called and the
+    previous loads are kept on the conditions. In that case, the coupling between Kratos and the UVEC model is
+    converged.
+
+    With the python interface, large state arrays of the UVEC model are kept in a :class:`UvecStateStore`, which is
+    available as "state_arrays" in the UVEC data. These arrays are never serialised to json. If "uvec_serialize_state"
+    is set, the store is saved to a binary file at the end of the stage, and loaded at the start of a following stage.
+
+    Attributes:
+        - uvec_path (str): path to the UVEC model
+        - uvec_method (str): name of the UVEC function
+        - uvec_base_model_part (str): name of the model part of the moving load
+        - uvec_interface (str): interface between STEM and the UVEC model, "json", "python", "native", "replay" or
+            "worker"
+        - callback_function (Callable): the UVEC function
+        - axle_model_parts (List[KratosMultiphysics.ModelPart]): model parts of the axles
+        - axle_numbers (List[str]): numbers of the axles, in the order of the axle model parts
+        - use_cache (bool): whether the result of the UVEC model is reused if the displacements and rotations at the
+            axles did not change
+        - cache_tolerance (float): maximum absolute change of the displacements and rotations at the axles for which
+            the result of the UVEC model is reused
+        - is_coupling_converged (bool): whether the previous result of the UVEC model is reused in the last call,
+            i.e. the displacements and rotations at the axles did not change
+        - recorder (:class:`UvecCouplingRecorder`): recorder of the time spent in the coupling phases, exported to
+            the "uvec_timing_output" file
+        - state_store (:class:`UvecStateStore`): the state arrays of the UVEC model
+        - serialize_state (bool): whether the state store is saved between stages
+        - state_file_name (str): name of the binary file of the state store
+        - accelerator (Optional[Union[:class:`AitkenRelaxation`, :class:`IqnIlsAccelerator`]]): accelerator of the
+            coupling loads, None if the loads computed by the UVEC model are applied directly
+        - applied_loads (Optional[np.ndarray]): the loads which are applied to the axles, shape (n_axles, 3), None
+            before the first call of the UVEC model
+        - predictor (Optional[:class:`UvecAxlePredictor`]): predictor of the displacements and loads at the axles at
+            the start of a time step, None if the values of the previous time step are used
+        - contact_elements (Optional[:class:`UvecContactElements`]): elements which add the contact stiffness and
+            damping of the UVEC model to the system matrices, None if the coupling is not implicit
+        - is_implicit_coupling (bool): whether the contact stiffness of the UVEC model is added to the system matrix
+        - convergence_criterion (Optional[:class:`UvecInterfaceConvergenceCriterion`]): convergence criterion on the
+            change of the loads and displacements at the axles, None if only the Kratos criterion is used
+        - is_interface_converged (bool): whether the loads and displacements at the axles converged in the last call,
+            always True if no interface convergence criterion is used
+        - trace_writer (Optional[:class:`UvecTraceWriter`]): writer of the UVEC trace, None if no trace is recorded
+        - __worker_data (Optional[Dict[str, Any]]): the UVEC data of the worker interface, which receives the final
+            state of the worker
+        - __n_step_calls (int): number of calls of the UVEC model within the current time step
+        - __step_time (Optional[float]): time of the current time step, None before the first time step
+        - __predicted_u (Optional[np.ndarray]): predicted displacements at the axles, which are sent to the UVEC model
+            in the first call of the time step, shape (n_axles, 3)
+        - __process_info (KratosMultiphysics.ProcessInfo): process info of the model part
+        - __cached_axle_state (Optional[np.ndarray]): displacements and rotations at the axles of the last UVEC call
+            within the current time step, shape (n_axles, 6)
+        - __axle_conditions (List[List[KratosMultiphysics.Condition]]): conditions per axle
+        - __axle_indices (Dict[str, int]): index of each axle model part, by name of the axle model part
+        - __active_indices (List[Optional[int]]): index of the condition carrying the moving load per axle, None if
+            the location of the moving load is not known
+    """
 
     def __init__(self, uvec_data, model_part):
 
         self.uvec_path = uvec_data["uvec_path"].GetString()
         self.uvec_method = uvec_data["uvec_method"].GetString()
         self.uvec_base_model_part = uvec_data["uvec_model_part"].GetString()
+        self.uvec_interface = uvec_data["uvec_interface"].GetString().lower() if uvec_data.Has("uvec_interface") \
+            else "json"
+
+        if self.uvec_interface not in UVEC_INTERFACES:
+            raise ValueError(f"UVEC interface: {self.uvec_interface} is not supported, available interfaces are: "
+                             f"{UVEC_INTERFACES}")
+
+        self.use_cache = uvec_data["uvec_cache"].GetBool() if uvec_data.Has("uvec_cache") else False
+        self.cache_tolerance = uvec_data["uvec_cache_tolerance"].GetDouble() \
+            if uvec_data.Has("uvec_cache_tolerance") else 0.0
+        if self.cache_tolerance < 0:
+            raise ValueError(f"The UVEC cache tolerance should be positive or zero, but is: {self.cache_tolerance}")
+
+        self.is_coupling_converged = False
+        self.__cached_axle_state: Optional[np.ndarray] = None
+
+        self.recorder = UvecCouplingRecorder(uvec_data["uvec_timing_output"].GetString()
+                                             if uvec_data.Has("uvec_timing_output") else "")
+
+        self.state_store = UvecStateStore()
+        self.serialize_state = uvec_data["uvec_serialize_state"].GetBool() \
+            if uvec_data.Has("uvec_serialize_state") else False
+        self.state_file_name = f"uvec_state_{self.uvec_base_model_part}.npz"
+        self.__process_info = model_part.ProcessInfo
+
+        self.accelerator = create_coupling_accelerator(uvec_data["uvec_acceleration"]) \
+            if uvec_data.Has("uvec_acceleration") else None
+        self.applied_loads: Optional[np.ndarray] = None
+
+        self.predictor = create_axle_predictor(uvec_data["uvec_predictor"]) \
+            if uvec_data.Has("uvec_predictor") else None
+        self.__step_time: Optional[float] = None
+        self.__predicted_u: Optional[np.ndarray] = None
+
+        self.convergence_criterion = create_interface_convergence_criterion(uvec_data["uvec_convergence_criterion"]) \
+            if uvec_data.Has("uvec_convergence_criterion") else None
+        self.is_interface_converged = self.convergence_criterion is None
+
+        # get correct conditions
+        self.axle_model_parts = []
+        for part in model_part.SubModelParts:
+            if (self.uvec_base_model_part + "_cloned_") in part.Name:
+                self.axle_model_parts.append(model_part.GetSubModelPart(part.Name))
+        self.axle_numbers = [axle.Name.split("_")[-1] for axle in self.axle_model_parts]
+
+        self.__axle_conditions = [list(axle.Conditions) for axle in self.axle_model_parts]
+        self.__axle_indices = {axle.Name: index for index, axle in enumerate(self.axle_model_parts)}
+        self.__active_indices: List[Optional[int]] = [None] * len(self.axle_model_parts)
+
+        # elements which add the contact stiffness and damping of the uvec model to the system matrices
+        self.contact_elements = create_contact_elements(uvec_data["uvec_implicit_coupling"], model_part,
+                                                        self.axle_model_parts, f"{self.uvec_base_model_part}_contact") \
+            if uvec_data.Has("uvec_implicit_coupling") else None
+        self.is_implicit_coupling = self.contact_elements is not None
+
+        # record the calls of the uvec model, a trace of a previous stage is continued
+        trace_file = uvec_data["uvec_trace_file"].GetString() if uvec_data.Has("uvec_trace_file") else ""
+        self.trace_writer = None
+        if trace_file != "":
+            self.trace_writer = UvecTraceWriter(trace_file, self.axle_numbers,
+                                                append=self.__process_info[KratosMultiphysics.STEP] > 0)
+        self.__n_step_calls = 0
+
+        # the uvec data of the worker interface, set in create_uvec_data
+        self.__worker_data: Optional[Dict[str, Any]] = None
+
+        if self.uvec_interface == "native":
+            # the uvec path refers to a shared library, the buffers are allocated for all axles
+            self.callback_function = NativeUvecModel(self.uvec_path, self.uvec_method, len(self.axle_numbers))
+            return
+
+        if self.uvec_interface == "replay":
+            # the uvec path refers to a recorded uvec trace
+            self.callback_function = UvecReplayModel(self.uvec_path, self.axle_numbers)
+            return
+
+        if self.uvec_interface == "worker":
+            # the uvec model is loaded in the worker process
+            self.callback_function = UvecWorkerModel(self.uvec_path, self.uvec_method, self.axle_numbers)
+            return
 
         # Create a spec object for the module
         module_name = os.path.basename(self.uvec_path).split(".")[0]
@@ -27,21 +227,132 @@ class StemUvecController:
         spec.loader.exec_module(uvec)
         self.callback_function = getattr(uvec, self.uvec_method)
 
-        # get correct conditions
-        self.axle_model_parts = []
-        for part in model_part.SubModelParts:
-            if (self.uvec_base_model_part + "_cloned_") in part.Name:
-                self.axle_model_parts.append(model_part.GetSubModelPart(part.Name))
+    def create_uvec_data(self, uvec_data: KratosMultiphysics.Parameters) -> Union[KratosMultiphysics.Parameters,
+                                                                                   Dict[str, Any]]:
+        """
+        Creates the UVEC data in the form of the UVEC interface. With the json interface, the parameters are used
+        directly. With the python and native interface, the parameters are converted once to a dictionary, in which
+        "u", "theta" and "loads" are numpy arrays with one row per axle. The python UVEC model gets the state store as
+        "state_arrays". The native UVEC model is initialised with the "parameters" of the UVEC data.
+
+        If the state is serialized and the simulation is further than the first step, the state store is loaded from
+        the file of the previous stage.
 
-    def initialise_solution_step(self, json_data: KratosMultiphysics.Parameters):
+        Args:
+            - uvec_data (KratosMultiphysics.Parameters): the UVEC data from the solver settings
+
+        Returns:
+            - Union[KratosMultiphysics.Parameters, Dict[str, Any]]: the UVEC data
+        """
+        # load the state arrays if the simulation is restarted
+        if self.serialize_state and self.__process_info[KratosMultiphysics.STEP] > 0 and \
+                os.path.isfile(self.state_file_name):
+            self.state_store.load(self.state_file_name)
+
+        if self.uvec_interface == "json":
+            return uvec_data
+
+        uvec_dict = json.loads(uvec_data.WriteJsonString())
+        uvec_dict["axle_numbers"] = list(self.axle_numbers)
+
+        if self.uvec_interface == "worker":
+            # the worker keeps its own copy of the uvec data, only the axle data is exchanged each call
+            self.callback_function.start(dict(uvec_dict))
+            self.__worker_data = uvec_dict
+        for variable in AXLE_VARIABLES:
+            uvec_dict[variable] = self.__get_axle_array(uvec_dict.get(variable, {}))
+
+        if self.uvec_interface == "native":
+            self.callback_function.initialise(uvec_dict.get("parameters", {}))
+        elif self.uvec_interface != "worker":
+            uvec_dict["state_arrays"] = self.state_store
+
+        return uvec_dict
+
+    def __get_axle_array(self, axle_values: Union[Dict[str, Any], list, np.ndarray]) -> np.ndarray:
+        """
+        Converts the values per axle to an array with one row per axle. The values are either given per axle number
+        or as rows in the order of the axle numbers. Missing axles get zero values.
+
+        Args:
+            - axle_values (Union[Dict[str, Any], list, np.ndarray]): the values per axle
+
+        Returns:
+            - np.ndarray: the values with shape (n_axles, 3)
+        """
+        if isinstance(axle_values, dict):
+            values = np.zeros((len(self.axle_numbers), 3))
+            for row, axle_number in enumerate(self.axle_numbers):
+                axle_value = axle_values.get(axle_number, axle_values.get(int(axle_number), []))
+                if len(axle_value) > 0:
+                    values[row] = axle_value
+            return values
+
+        values = np.asarray(axle_values, dtype=float)
+        if values.shape != (len(self.axle_numbers), 3):
+            raise ValueError(f"The UVEC values should have one row with 3 values per axle, i.e. shape: "
+                             f"{(len(self.axle_numbers), 3)}, but have shape: {values.shape}")
+        return values
+
+    def finalise(self):
+        """
+        Finalises the controller at the end of the stage, the recorded coupling times are exported, the UVEC trace is
+        closed, the UVEC worker is stopped, the contact elements are removed from the model and, if the state is
+        serialized, the state store is saved for the next stage.
         """
-        This function initialises the solution step in case a UVEC model is used.
+        self.recorder.export()
+
+        if self.serialize_state:
+            self.state_store.save(self.state_file_name)
+
+        if self.trace_writer is not None:
+            self.trace_writer.close()
+
+        if self.__worker_data is not None:
+            self.__worker_data["state"] = self.callback_function.stop()
+
+        if self.contact_elements is not None:
+            self.contact_elements.remove()
+
+    def initialise_solution_step(self, json_data: Union[KratosMultiphysics.Parameters, Dict[str, Any]]):
+        """
+        This function initialises the solution step in case a UVEC model is used. The time data of the UVEC model
+        and the active condition of each axle are updated, and the cached UVEC result of the previous time step is
+        cleared. If a predictor is used, the displacements and loads at the axles are extrapolated to the new time
+        step.
 
         Args:
-            - json_data (KratosMultiphysics.Parameters): input data for the UVEC model
+            - json_data (Union[KratosMultiphysics.Parameters, Dict[str, Any]]): input data for the UVEC model
         """
+        if self.predictor is not None:
+            self.__update_predictor()
+
+        self.update_active_conditions()
+
+        if self.predictor is not None:
+            self.__predict_axle_data()
+
+        self.__cached_axle_state = None
+        self.is_coupling_converged = False
+        self.__n_step_calls = 0
 
-        if len(self.axle_model_parts) > 0:
+        if self.accelerator is not None:
+            self.accelerator.initialise_solution_step()
+
+        if self.convergence_criterion is not None:
+            # the first call of the time step is compared with the displacements it receives and with the loads which
+            # are applied at the start of the time step
+            start_u = self.__get_axle_displacements() if self.__predicted_u is None else self.__predicted_u
+            self.convergence_criterion.initialise_solution_step(start_u, self.applied_loads)
+            self.is_interface_converged = False
+
+        if len(self.axle_model_parts) > 0 and isinstance(json_data, dict):
+            process_info = self.axle_model_parts[0].ProcessInfo
+            json_data["dt"] = process_info[KratosMultiphysics.DELTA_TIME]
+            json_data["t"] = process_info[KratosMultiphysics.TIME]
+            json_data["time_index"] = process_info[KratosMultiphysics.STEP] - 1
+
+        elif len(self.axle_model_parts) > 0:
 
             if not json_data.Has("dt"):
                 json_data.AddEmptyValue("dt")
@@ -55,17 +366,30 @@ class StemUvecController:
                 json_data.AddEmptyValue("time_index")
             json_data.AddInt("time_index", self.axle_model_parts[0].ProcessInfo[KratosMultiphysics.STEP] - 1)
 
-    def execute_uvec_update_kratos(self, json_data: KratosMultiphysics.Parameters) -> KratosMultiphysics.Parameters:
+    def execute_uvec_update_kratos(self, json_data: Union[KratosMultiphysics.Parameters, Dict[str, Any]]) \
+            -> Union[KratosMultiphysics.Parameters, Dict[str, Any]]:
         """
         This function calls the uvec model and updates the Kratos model with the result.
 
         Args:
-            - json_data (KratosMultiphysics.Parameters): input data for the uvec model
+            - json_data (Union[KratosMultiphysics.Parameters, Dict[str, Any]]): input data for the uvec model
 
         Returns:
-            - KratosMultiphysics.Parameters: output data from the uvec model
+            - Union[KratosMultiphysics.Parameters, Dict[str, Any]]: output data from the uvec model
 
         """
+        if self.use_cache:
+            axle_state = self.__get_axle_state(json_data)
+            self.is_coupling_converged = self.__cached_axle_state is not None and \
+                np.max(np.abs(axle_state - self.__cached_axle_state), initial=0.0) <= self.cache_tolerance
+            if self.is_coupling_converged:
+                # the input data contains the loads of the previous call, which are still applied on the conditions
+                self.is_interface_converged = True
+                return json_data
+            self.__cached_axle_state = axle_state
+
+        if isinstance(json_data, dict):
+            return self.__execute_python_uvec_update_kratos(json_data)
 
         # add empty variables to uvec input data
         # make sure all axles have required empty data structure
@@ -76,21 +400,241 @@ class StemUvecController:
                 self.add_empty_variable_to_parameters(json_data, axle_number, variable_json)
 
         # call uvec function
-        uvec_json = KratosMultiphysics.Parameters(self.callback_function(json_data.WriteJsonString()))
+        with self.recorder.record("SERIALISATION"):
+            json_string = json_data.WriteJsonString()
+        with self.recorder.record("UVEC"):
+            json_string = self.callback_function(json_string)
+        with self.recorder.record("SERIALISATION"):
+            uvec_json = KratosMultiphysics.Parameters(json_string)
+
+        computed_loads = np.array([uvec_json["loads"][axle_number].GetVector()
+                                   for axle_number in self.axle_numbers]).reshape(-1, 3)
+        axle_state = self.__get_axle_state(json_data)
+        if self.trace_writer is not None:
+            self.__write_trace(axle_state[:, :3], axle_state[:, 3:], computed_loads)
+        self.__update_interface_convergence(axle_state[:, :3], computed_loads)
+        self.__update_contact(uvec_json)
 
         # add loads from uvec to the model
-        for axle in self.axle_model_parts:
-            axle_number = (axle.Name.split("_")[-1])
+        self.__apply_loads(computed_loads)
 
-            # set value on model part
-            axle.SetValue(KSM.POINT_LOAD, uvec_json["loads"][axle_number].GetVector())
+        return uvec_json
 
-            # transfer load from model part to conditions
-            self.__transfer_load_from_model_part_to_conditions(axle)
+    def __execute_python_uvec_update_kratos(self, uvec_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        This function calls the uvec model with the python interface and updates the Kratos model with the result.
 
-        return uvec_json
+        Args:
+            - uvec_data (Dict[str, Any]): input data for the uvec model
+
+        Returns:
+            - Dict[str, Any]: output data from the uvec model, with the loads as an array with one row per axle
+        """
+        u, theta = uvec_data["u"], uvec_data["theta"]
+        with self.recorder.record("UVEC"):
+            uvec_result = self.callback_function(uvec_data)
+        uvec_result["loads"] = self.__get_axle_array(uvec_result["loads"])
+
+        if self.trace_writer is not None:
+            self.__write_trace(u, theta, uvec_result["loads"])
+        self.__update_interface_convergence(u, uvec_result["loads"])
+        self.__update_contact(uvec_result)
+
+        self.__apply_loads(uvec_result["loads"])
+
+        return uvec_result
+
+    def __update_predictor(self):
+        """
+        Stores the displacements at and the loads on the axles of the finished time step in the predictor. The
+        displacements are taken at the active conditions of the finished time step. The predictor is not updated if
+        the time step is initialised again, or if no loads are applied yet.
+        """
+        time = self.__process_info[KratosMultiphysics.TIME]
+        if self.__step_time is not None and self.applied_loads is not None and time > self.__step_time:
+            self.predictor.add_step(self.__step_time, self.__get_axle_displacements(), self.applied_loads)
+        self.__step_time = time
+
+    def __predict_axle_data(self):
+        """
+        Predicts the displacements at and the loads on the axles at the start of the time step. The predicted
+        displacements are kept for the first call of the UVEC model. The predicted loads replace the applied loads of
+        the previous time step, from which the first call of the UVEC model is accelerated. They are not set on the
+        conditions, since the loads of the first call of the UVEC model are applied before Kratos is solved.
+        """
+        prediction = self.predictor.predict(self.__step_time)
+        if prediction is None:
+            self.__predicted_u = None
+            return
+
+        self.__predicted_u, self.applied_loads = prediction
+
+    def __update_interface_convergence(self, u: np.ndarray, computed_loads: np.ndarray):
+        """
+        Checks the interface convergence criterion with the displacements at the axles and the loads computed by the
+        UVEC model.
+
+        Args:
+            - u (np.ndarray): the displacements at the axles, shape (n_axles, 3)
+            - computed_loads (np.ndarray): the loads computed by the UVEC model, shape (n_axles, 3)
+        """
+        if self.convergence_criterion is not None:
+            self.is_interface_converged = self.convergence_criterion.is_converged(u, computed_loads)
+
+    def __update_contact(self, uvec_result: Union[KratosMultiphysics.Parameters, Dict[str, Any]]):
+        """
+        Updates the contact stiffness and damping in the system matrices with the derivatives returned by the UVEC
+        model, at the current location of the moving loads.
+
+        Args:
+            - uvec_result (Union[KratosMultiphysics.Parameters, Dict[str, Any]]): output data from the uvec model
+        """
+        if self.contact_elements is None:
+            return
+
+        conditions = [self.__get_active_condition(axle) for axle in self.axle_model_parts]
+        stiffness = self.__get_contact_derivative(uvec_result, "contact_stiffness")
+        damping = self.__get_contact_derivative(uvec_result, "contact_damping") \
+            if self.contact_elements.use_damping else None
+        self.contact_elements.update(conditions, stiffness, damping)
+
+    def __get_contact_derivative(self, uvec_result: Union[KratosMultiphysics.Parameters, Dict[str, Any]],
+                                 name: str) -> np.ndarray:
+        """
+        Gets a derivative of the loads per axle from the output data of the UVEC model.
+
+        Args:
+            - uvec_result (Union[KratosMultiphysics.Parameters, Dict[str, Any]]): output data from the uvec model
+            - name (str): name of the derivative, "contact_stiffness" or "contact_damping"
+
+        Returns:
+            - np.ndarray: the derivative per axle, zero if it is not returned by the UVEC model, shape (n_axles, 3)
+        """
+        if isinstance(uvec_result, dict):
+            if uvec_result.get(name) is None:
+                return np.zeros((len(self.axle_numbers), 3))
+            return self.__get_axle_array(uvec_result[name])
+
+        if not uvec_result.Has(name):
+            return np.zeros((len(self.axle_numbers), 3))
+        return np.array([uvec_result[name][axle_number].GetVector() if uvec_result[name].Has(axle_number)
+                         else [0.0, 0.0, 0.0] for axle_number in self.axle_numbers]).reshape(-1, 3)
+
+    def __apply_loads(self, computed_loads: np.ndarray):
+        """
+        Applies the loads computed by the UVEC model to the axles. If a coupling accelerator is used, the accelerated
+        loads are applied instead, based on the loads which were applied in the previous iteration.
+
+        Args:
+            - computed_loads (np.ndarray): the loads computed by the UVEC model, shape (n_axles, 3)
+        """
+        if self.accelerator is None or self.applied_loads is None:
+            self.applied_loads = np.array(computed_loads, dtype=float)
+        else:
+            self.applied_loads = self.accelerator.update(self.applied_loads, computed_loads)
+
+        self.__set_axle_loads(self.applied_loads)
+
+    def __set_axle_loads(self, loads: np.ndarray):
+        """
+        Sets the loads on the axle model parts and transfers them to the active conditions.
+
+        Args:
+            - loads (np.ndarray): the loads on the axles, shape (n_axles, 3)
+        """
+        for axle, load in zip(self.axle_model_parts, loads):
+            # set value on model part and transfer load from model part to conditions
+            axle.SetValue(KSM.POINT_LOAD, KratosMultiphysics.Vector(load))
+            self.__transfer_load_to_active_condition(axle)
+
+    def __write_trace(self, u: np.ndarray, theta: np.ndarray, loads: Union[np.ndarray, list]):
+        """
+        Writes a call of the UVEC model to the UVEC trace.
+
+        Args:
+            - u (np.ndarray): displacements at the axles, shape (n_axles, 3)
+            - theta (np.ndarray): rotations at the axles, shape (n_axles, 3)
+            - loads (Union[np.ndarray, list]): loads on the axles, shape (n_axles, 3)
+        """
+        self.__n_step_calls += 1
+        self.trace_writer.write(self.__process_info[KratosMultiphysics.STEP], self.__n_step_calls,
+                                self.__process_info[KratosMultiphysics.TIME], self.axle_numbers,
+                                np.reshape(u, (-1, 3)), np.reshape(theta, (-1, 3)),
+                                np.reshape(np.asarray(loads, dtype=float), (-1, 3)))
+
+    def __get_axle_state(self, json_data: Union[KratosMultiphysics.Parameters, Dict[str, Any]]) -> np.ndarray:
+        """
+        Gets the displacements and rotations at the axles from the UVEC data.
+
+        Args:
+            - json_data (Union[KratosMultiphysics.Parameters, Dict[str, Any]]): input data for the UVEC model
+
+        Returns:
+            - np.ndarray: the displacements and rotations per axle, shape (n_axles, 6)
+        """
+        if isinstance(json_data, dict):
+            return np.hstack([self.__get_axle_array(json_data["u"]), self.__get_axle_array(json_data["theta"])])
+
+        return np.array([list(json_data["u"][axle_number].GetVector()) +
+                         list(json_data["theta"][axle_number].GetVector())
+                         for axle_number in self.axle_numbers]).reshape(-1, 6)
+
+    def update_active_conditions(self):
+        """
+        Updates the index of the condition which carries the moving load of each axle. The search starts at the
+        previous index and moves outward, such that a moving load which moved to a neighbouring condition is found
+        directly. If the moving load is not found nearby, all conditions of the axle are searched.
+        """
+        for axle_index, conditions in enumerate(self.__axle_conditions):
+            self.__active_indices[axle_index] = self.__find_active_condition_index(
+                conditions, self.__active_indices[axle_index])
+
+    @staticmethod
+    def __find_active_condition_index(conditions: List[KratosMultiphysics.Condition],
+                                      previous_index: Optional[int]) -> Optional[int]:
+        """
+        Finds the index of the condition with a non-zero point load, searching outward from the previous index.
+
+        Args:
+            - conditions (List[KratosMultiphysics.Condition]): conditions of the axle
+            - previous_index (Optional[int]): index of the previously active condition, None if not known
+
+        Returns:
+            - Optional[int]: index of the active condition, None if no condition carries a load
+        """
+        n_conditions = len(conditions)
+        start_index = 0 if previous_index is None else min(previous_index, n_conditions - 1)
+
+        for distance in range(n_conditions):
+            for index in (start_index + distance, start_index - distance):
+                if 0 <= index < n_conditions and \
+                        any(abs(load_magnitude) >= LOAD_PRECISION
+                            for load_magnitude in conditions[index].GetValue(KSM.POINT_LOAD)):
+                    return index
+        return None
+
+    def __get_active_condition(self, axle: KratosMultiphysics.ModelPart) -> Optional[KratosMultiphysics.Condition]:
+        """
+        Gets the condition which carries the moving load of an axle.
+
+        Args:
+            - axle (KratosMultiphysics.ModelPart): model part of the axle
+
+        Returns:
+            - Optional[KratosMultiphysics.Condition]: the active condition, None if the axle is not tracked or the
+              location of the moving load is not known
+        """
+        axle_index = self.__axle_indices.get(axle.Name)
+        if axle_index is None or self.__active_indices[axle_index] is None:
+            return None
+        return self.__axle_conditions[axle_index][self.__active_indices[axle_index]]
 
     def getMovingConditionVariable(self, axle, Variable):
+        # The value is taken from the active condition, if its location is known
+        active_condition = self.__get_active_condition(axle)
+        if active_condition is not None:
+            return KratosMultiphysics.Vector(list(active_condition.GetValue(Variable)))
+
         # This assumes that only one condition contains the moving load has values:
         values = [0.0, 0.0, 0.0]
         for condition in axle.Conditions:
@@ -138,14 +682,24 @@ class StemUvecController:
         self.add_empty_variable_to_parameters(json_data, axle_number, variable_json)
         json_data[variable_json][axle_number].SetVector(self.getMovingConditionVariable(axle_model_part, variable_kratos))
 
-    def update_uvec_from_kratos(self, json_data: KratosMultiphysics.Parameters):
+    def update_uvec_from_kratos(self, json_data: Union[KratosMultiphysics.Parameters, Dict[str, Any]]):
         """
-        This function updates the UVEC data with the displacement and rotation from Kratos.
+        This function updates the UVEC data with the displacement and rotation from Kratos. In the first call of a
+        time step with a predictor, the predicted displacements are used instead of the displacements from Kratos.
 
         Args:
-            - json_data (KratosMultiphysics.Parameters): input data for the uvec model
+            - json_data (Union[KratosMultiphysics.Parameters, Dict[str, Any]]): input data for the uvec model
 
         """
+        predicted_u, self.__predicted_u = self.__predicted_u, None
+
+        if isinstance(json_data, dict):
+            # the arrays are replaced, such that arrays which are kept by the uvec model are not modified
+            json_data["u"] = self.__get_axle_displacements() if predicted_u is None else predicted_u.copy()
+            json_data["theta"] = np.array([self.getMovingConditionVariable(axle, KratosMultiphysics.ROTATION)
+                                           for axle in self.axle_model_parts]).reshape(-1, 3)
+            return
+
         # get data from each axle
         for axle_model_part in self.axle_model_parts:
             axle_number = (axle_model_part.Name.split("_")[-1])
@@ -156,8 +710,37 @@ class StemUvecController:
             self.update_uvec_variable_from_kratos(
                 json_data, axle_number, axle_model_part, "theta", KratosMultiphysics.ROTATION)
 
+        if predicted_u is not None:
+            for axle_number, u in zip(self.axle_numbers, predicted_u):
+                json_data["u"][axle_number].SetVector(KratosMultiphysics.Vector(u))
+
+    def __get_axle_displacements(self) -> np.ndarray:
+        """
+        Gets the displacements from Kratos at the active conditions of the axles.
+
+        Returns:
+            - np.ndarray: the displacements per axle, shape (n_axles, 3)
+        """
+        return np.array([self.getMovingConditionVariable(axle, KratosMultiphysics.DISPLACEMENT)
+                         for axle in self.axle_model_parts]).reshape(-1, 3)
+
+    def __transfer_load_to_active_condition(self, axle: KratosMultiphysics.ModelPart):
+        """
+        This function transfers the point load from the axle model part to the active condition. If the location of
+        the moving load is not known, the load is transferred to the condition which contains a non-zero value.
+
+        Args:
+            - axle (KratosMultiphysics.ModelPart): model part of the axle
+        """
+        active_condition = self.__get_active_condition(axle)
+        if active_condition is None:
+            self.__transfer_load_from_model_part_to_conditions(axle)
+        else:
+            active_condition.SetValue(KSM.POINT_LOAD, axle.GetValue(KSM.POINT_LOAD))
+
     @staticmethod
-    def __transfer_load_from_model_part_to_conditions(model_part: KratosMultiphysics.ModelPart, precision=1e-12):
+    def __transfer_load_from_model_part_to_conditions(model_part: KratosMultiphysics.ModelPart,
+                                                      precision=LOAD_PRECISION):
         """
         This function transfers the point load from the model part to the condition which contains a non-zero value.
 
@@ -169,3 +752,157 @@ class StemUvecController:
         for condition in model_part.Conditions:
             if not all(abs(load_magnitude) < precision for load_magnitude in condition.GetValue(KSM.POINT_LOAD)):
                 condition.SetValue(KSM.POINT_LOAD, model_part.GetValue(KSM.POINT_LOAD))
+
+
+class StemMultipleUvecController:
+    """
+    Controller which couples multiple independent UVEC models, e.g. vehicles on different tracks, to Kratos. Each
+    UVEC model has its own moving load model part, callback function, interface and state, and is coupled by its own
+    :class:`StemUvecController`. The UVEC models are called concurrently each non-linear iteration, using a thread
+    pool. UVEC models which release the global interpreter lock, such as native UVEC models, are evaluated in
+    parallel.
+
+    The time spent in the UVEC models of all vehicles is recorded by a single recorder, which is exported to the
+    "uvec_timing_output" of the first UVEC model.
+
+    Attributes:
+        - controllers (List[:class:`StemUvecController`]): the controller per UVEC model
+        - recorder (:class:`UvecCouplingRecorder`): recorder of the time spent in the coupling phases
+        - __executor (ThreadPoolExecutor): thread pool in which the UVEC models are called
+    """
+
+    def __init__(self, uvec_settings: KratosMultiphysics.Parameters, model_part: KratosMultiphysics.ModelPart):
+        """
+        Constructor of the StemMultipleUvecController.
+
+        Args:
+            - uvec_settings (KratosMultiphysics.Parameters): list with the uvec settings of each UVEC model
+            - model_part (KratosMultiphysics.ModelPart): model part containing the moving load model parts
+        """
+        self.controllers = [StemUvecController(uvec_settings[i], model_part) for i in range(uvec_settings.size())]
+        if len(self.controllers) == 0:
+            raise ValueError("At least one UVEC model should be defined")
+
+        uvec_model_parts = [controller.uvec_base_model_part for controller in self.controllers]
+        if len(set(uvec_model_parts)) != len(uvec_model_parts):
+            raise ValueError(f"Each UVEC model should have its own uvec model part, but the model parts are: "
+                             f"{uvec_model_parts}")
+
+        # all controllers record into the same recorder
+        self.recorder = self.controllers[0].recorder
+        for controller in self.controllers:
+            controller.recorder = self.recorder
+
+        self.__executor = ThreadPoolExecutor(max_workers=len(self.controllers), thread_name_prefix="uvec")
+
+    @property
+    def is_coupling_converged(self) -> bool:
+        """
+        Whether the previous results of all UVEC models are reused in the last call.
+
+        Returns:
+            - bool: True if the coupling of all UVEC models is converged
+        """
+        return all(controller.is_coupling_converged for controller in self.controllers)
+
+    @property
+    def is_implicit_coupling(self) -> bool:
+        """
+        Whether the contact stiffness of any of the UVEC models is added to the system matrix.
+
+        Returns:
+            - bool: True if the coupling of any UVEC model is implicit
+        """
+        return any(controller.is_implicit_coupling for controller in self.controllers)
+
+    @property
+    def is_interface_converged(self) -> bool:
+        """
+        Whether the loads and displacements at the axles of all UVEC models converged in the last call.
+
+        Returns:
+            - bool: True if the interface of all UVEC models is converged
+        """
+        return all(controller.is_interface_converged for controller in self.controllers)
+
+    def create_uvec_data(self, uvec_settings: KratosMultiphysics.Parameters) -> List[Union[
+            KratosMultiphysics.Parameters, Dict[str, Any]]]:
+        """
+        Creates the UVEC data of each UVEC model, in the form of its UVEC interface.
+
+        Args:
+            - uvec_settings (KratosMultiphysics.Parameters): list with the uvec settings of each UVEC model
+
+        Returns:
+            - List[Union[KratosMultiphysics.Parameters, Dict[str, Any]]]: the UVEC data per UVEC model
+        """
+        return [controller.create_uvec_data(uvec_settings[i]["uvec_data"])
+                for i, controller in enumerate(self.controllers)]
+
+    def initialise_solution_step(self, uvec_data: List[Union[KratosMultiphysics.Parameters, Dict[str, Any]]]):
+        """
+        Initialises the solution step of each UVEC model.
+
+        Args:
+            - uvec_data (List[Union[KratosMultiphysics.Parameters, Dict[str, Any]]]): the UVEC data per UVEC model
+        """
+        for controller, data in zip(self.controllers, uvec_data):
+            controller.initialise_solution_step(data)
+
+    def update_uvec_from_kratos(self, uvec_data: List[Union[KratosMultiphysics.Parameters, Dict[str, Any]]]):
+        """
+        Updates the UVEC data of each UVEC model with the displacement and rotation from Kratos.
+
+        Args:
+            - uvec_data (List[Union[KratosMultiphysics.Parameters, Dict[str, Any]]]): the UVEC data per UVEC model
+        """
+        for controller, data in zip(self.controllers, uvec_data):
+            controller.update_uvec_from_kratos(data)
+
+    def execute_uvec_update_kratos(self, uvec_data: List[Union[KratosMultiphysics.Parameters, Dict[str, Any]]]) \
+            -> List[Union[KratosMultiphysics.Parameters, Dict[str, Any]]]:
+        """
+        Calls the UVEC models concurrently and updates the Kratos model with the results. Each UVEC model only updates
+        the conditions of its own axles.
+
+        Args:
+            - uvec_data (List[Union[KratosMultiphysics.Parameters, Dict[str, Any]]]): the UVEC data per UVEC model
+
+        Returns:
+            - List[Union[KratosMultiphysics.Parameters, Dict[str, Any]]]: output data per UVEC model
+        """
+        futures = [self.__executor.submit(controller.execute_uvec_update_kratos, data)
+                   for controller, data in zip(self.controllers, uvec_data)]
+        return [future.result() for future in futures]
+
+    def finalise(self):
+        """
+        Finalises the controller at the end of the stage, the controller of each UVEC model is finalised and the
+        thread pool is shut down.
+        """
+        for controller in self.controllers:
+            controller.finalise()
+        self.__executor.shutdown()
+
+
+def create_uvec_controller(uvec_settings: KratosMultiphysics.Parameters, model_part: KratosMultiphysics.ModelPart) \
+        -> Tuple[Union[StemUvecController, StemMultipleUvecController], Union[
+            KratosMultiphysics.Parameters, Dict[str, Any], List[Union[KratosMultiphysics.Parameters, Dict[str, Any]]]]]:
+    """
+    Creates the controller and the initial UVEC data. A single UVEC model is coupled with a
+    :class:`StemUvecController`, a list of UVEC models is coupled with a :class:`StemMultipleUvecController`.
+
+    Args:
+        - uvec_settings (KratosMultiphysics.Parameters): the uvec settings, or a list of uvec settings
+        - model_part (KratosMultiphysics.ModelPart): model part containing the moving load model parts
+
+    Returns:
+        - Tuple[Union[:class:`StemUvecController`, :class:`StemMultipleUvecController`], Union[
+          KratosMultiphysics.Parameters, Dict[str, Any], List]]: the controller and the UVEC data
+    """
+    if uvec_settings.IsArray():
+        controller = StemMultipleUvecController(uvec_settings, model_part)
+        return controller, controller.create_uvec_data(uvec_settings)
+
+    controller = StemUvecController(uvec_settings, model_part)
+    return controller, controller.create_uvec_data(uvec_settings["uvec_data"])
@@ -0,0 +1,151 @@
+from typing import Optional
+
+import numpy as np
+
+import KratosMultiphysics
+
+from KratosMultiphysics.StemApplication.uvec_coupling_recorder import log_coupling_detail
+
+
+class UvecInterfaceConvergenceCriterion:
+    """
+    Convergence criterion of the coupling between Kratos and the UVEC model, based on the change of the loads on the
+    axles and of the displacements at the axles between consecutive UVEC calls within a time step. The coupling is
+    converged if, for each axle, the change of the load and the change of the displacement are smaller than either
+    the absolute tolerance or the relative tolerance times the current value. The first call of a time step is
+    compared with the displacements and loads at the start of the time step, such that a weakly coupled time step
+    can converge with a single UVEC call.
+
+    Attributes:
+        - load_relative_tolerance (float): relative tolerance of the change of the load per axle
+        - load_absolute_tolerance (float): absolute tolerance of the change of the load per axle
+        - displacement_relative_tolerance (float): relative tolerance of the change of the displacement per axle
+        - displacement_absolute_tolerance (float): absolute tolerance of the change of the displacement per axle
+        - __previous_u (Optional[np.ndarray]): the displacements at the axles of the previous call, or at the start
+            of the time step
+        - __previous_loads (Optional[np.ndarray]): the loads on the axles of the previous call, or at the start of the
+            time step
+    """
+
+    def __init__(self, load_relative_tolerance: float, load_absolute_tolerance: float,
+                 displacement_relative_tolerance: float, displacement_absolute_tolerance: float):
+        """
+        Constructor of the UvecInterfaceConvergenceCriterion.
+
+        Args:
+            - load_relative_tolerance (float): relative tolerance of the change of the load per axle
+            - load_absolute_tolerance (float): absolute tolerance of the change of the load per axle
+            - displacement_relative_tolerance (float): relative tolerance of the change of the displacement per axle
+            - displacement_absolute_tolerance (float): absolute tolerance of the change of the displacement per axle
+        """
+        self.load_relative_tolerance = load_relative_tolerance
+        self.load_absolute_tolerance = load_absolute_tolerance
+        self.displacement_relative_tolerance = displacement_relative_tolerance
+        self.displacement_absolute_tolerance = displacement_absolute_tolerance
+
+        self.__previous_u: Optional[np.ndarray] = None
+        self.__previous_loads: Optional[np.ndarray] = None
+
+    def initialise_solution_step(self, u: Optional[np.ndarray] = None, loads: Optional[np.ndarray] = None):
+        """
+        Sets the displacements at and the loads on the axles at the start of the time step, to which the first call
+        of the time step is compared. Without loads, e.g. before the first call of the UVEC model, the first call of
+        the time step is not converged.
+
+        Args:
+            - u (Optional[np.ndarray]): the displacements at the axles at the start of the time step, shape
+              (n_axles, 3)
+            - loads (Optional[np.ndarray]): the loads on the axles at the start of the time step, shape (n_axles, 3)
+        """
+        if u is None or loads is None:
+            self.__previous_u = None
+            self.__previous_loads = None
+            return
+
+        self.__previous_u = np.array(u, dtype=float).reshape(-1, 3)
+        self.__previous_loads = np.array(loads, dtype=float).reshape(-1, 3)
+
+    def is_converged(self, u: np.ndarray, loads: np.ndarray) -> bool:
+        """
+        Checks whether the displacements and loads of the axles did not change since the previous call, and stores
+        the values for the next check.
+
+        Args:
+            - u (np.ndarray): the displacements at the axles, shape (n_axles, 3)
+            - loads (np.ndarray): the loads on the axles, shape (n_axles, 3)
+
+        Returns:
+            - bool: True if the coupling is converged
+        """
+        u = np.array(u, dtype=float).reshape(-1, 3)
+        loads = np.array(loads, dtype=float).reshape(-1, 3)
+        previous_u, previous_loads = self.__previous_u, self.__previous_loads
+        self.__previous_u, self.__previous_loads = u, loads
+
+        if previous_u is None:
+            return False
+
+        is_load_converged = self.__is_change_converged(loads, previous_loads, self.load_relative_tolerance,
+                                                       self.load_absolute_tolerance, "load")
+        is_displacement_converged = self.__is_change_converged(u, previous_u, self.displacement_relative_tolerance,
+                                                               self.displacement_absolute_tolerance, "displacement")
+        return is_load_converged and is_displacement_converged
+
+    @staticmethod
+    def __is_change_converged(values: np.ndarray, previous_values: np.ndarray, relative_tolerance: float,
+                              absolute_tolerance: float, name: str) -> bool:
+        """
+        Checks per axle whether the change of a vector is smaller than the absolute tolerance or the relative
+        tolerance times the norm of the vector.
+
+        Args:
+            - values (np.ndarray): the current values, shape (n_axles, 3)
+            - previous_values (np.ndarray): the values of the previous call, shape (n_axles, 3)
+            - relative_tolerance (float): the relative tolerance
+            - absolute_tolerance (float): the absolute tolerance
+            - name (str): name of the values in the log message
+
+        Returns:
+            - bool: True if the change of all axles is converged
+        """
+        change = np.linalg.norm(values - previous_values, axis=1)
+        norm = np.linalg.norm(values, axis=1)
+        relative_change = np.divide(change, norm, out=np.zeros_like(change), where=norm > 0)
+
+        log_coupling_detail(f"Interface {name} change, absolute: {np.max(change, initial=0.0):.3e}, relative: "
+                            f"{np.max(relative_change, initial=0.0):.3e}")
+        return bool(np.all((change <= absolute_tolerance) | (change <= relative_tolerance * norm)))
+
+
+def create_interface_convergence_criterion(settings: KratosMultiphysics.Parameters) \
+        -> Optional[UvecInterfaceConvergenceCriterion]:
+    """
+    Creates the convergence criterion of the coupling between Kratos and the UVEC model.
+
+    Args:
+        - settings (KratosMultiphysics.Parameters): settings of the criterion, including:
+            - "active": Whether the interface criterion is used next to the Kratos convergence criterion.
+            - "load_relative_tolerance": Relative tolerance of the change of the load per axle.
+            - "load_absolute_tolerance": Absolute tolerance of the change of the load per axle.
+            - "displacement_relative_tolerance": Relative tolerance of the change of the displacement per axle.
+            - "displacement_absolute_tolerance": Absolute tolerance of the change of the displacement per axle.
+
+    Returns:
+        - Optional[UvecInterfaceConvergenceCriterion]: the criterion, None if it is not active
+    """
+    default_settings = KratosMultiphysics.Parameters("""{
+        "active"                          : false,
+        "load_relative_tolerance"         : 1.0e-4,
+        "load_absolute_tolerance"         : 1.0e-6,
+        "displacement_relative_tolerance" : 1.0e-4,
+        "displacement_absolute_tolerance" : 1.0e-9
+    }""")
+    settings.ValidateAndAssignDefaults(default_settings)
+
+    if not settings["active"].GetBool():
+        return None
+
+    return UvecInterfaceConvergenceCriterion(settings["load_relative_tolerance"].GetDouble(),
+                                             settings["load_absolute_tolerance"].GetDouble(),
+                                             settings["displacement_relative_tolerance"].GetDouble(),
+                                             settings["displacement_absolute_tolerance"].GetDouble())
@@ -0,0 +1,266 @@
+from collections import deque
+from typing import Deque, List, Optional, Tuple, Union
+
+import numpy as np
+
+import KratosMultiphysics
+
+# available accelerators of the coupling between Kratos and the UVEC model
+COUPLING_ACCELERATION_TYPES = ["none", "aitken", "iqn_ils"]
+
+
+class AitkenRelaxation:
+    """
+    Aitken dynamic relaxation of the loads of the fixed point iteration between Kratos and the UVEC model. The
+    interface residual is the difference between the loads computed by the UVEC model and the loads which were
+    applied in the previous iteration. The relaxation factor of the first iteration of each time step is the initial
+    factor, in the following iterations the factor is updated with the Aitken delta-squared method:
+
+    .. math::
+
+        \\omega_k = -\\omega_{k-1} \\frac{r_{k-1} \\cdot (r_k - r_{k-1})}{|r_k - r_{k-1}|^2}
+
+    The magnitude of the factor is limited to the maximum factor.
+
+    Attributes:
+        - initial_factor (float): relaxation factor of the first iteration of each time step
+        - max_factor (float): maximum magnitude of the relaxation factor
+        - factor (float): the current relaxation factor
+        - __previous_residual (Optional[np.ndarray]): the interface residual of the previous iteration
+    """
+
+    def __init__(self, initial_factor: float, max_factor: float):
+        """
+        Constructor of the AitkenRelaxation.
+
+        Args:
+            - initial_factor (float): relaxation factor of the first iteration of each time step
+            - max_factor (float): maximum magnitude of the relaxation factor
+        """
+        if not 0 < initial_factor <= max_factor:
+            raise ValueError(f"The initial relaxation factor should be larger than 0 and smaller than or equal to the "
+                             f"maximum relaxation factor: {max_factor}, but is: {initial_factor}")
+
+        self.initial_factor = initial_factor
+        self.max_factor = max_factor
+        self.factor = initial_factor
+        self.__previous_residual: Optional[np.ndarray] = None
+
+    def initialise_solution_step(self):
+        """
+        Resets the relaxation factor and the residual history at the start of a time step.
+        """
+        self.factor = self.initial_factor
+        self.__previous_residual = None
+
+    def update(self, applied_loads: np.ndarray, computed_loads: np.ndarray) -> np.ndarray:
+        """
+        Computes the relaxed loads which are applied in the next iteration.
+
+        Args:
+            - applied_loads (np.ndarray): the loads which were applied in the previous iteration, shape (n_axles, 3)
+            - computed_loads (np.ndarray): the loads computed by the UVEC model, shape (n_axles, 3)
+
+        Returns:
+            - np.ndarray: the relaxed loads, shape (n_axles, 3)
+        """
+        residual = (computed_loads - applied_loads).ravel()
+
+        if self.__previous_residual is not None:
+            residual_change = residual - self.__previous_residual
+            squared_norm = residual_change @ residual_change
+            if squared_norm > 0:
+                factor = -self.factor * (self.__previous_residual @ residual_change) / squared_norm
+                self.factor = float(np.clip(factor, -self.max_factor, self.max_factor))
+
+        self.__previous_residual = residual
+        return applied_loads + self.factor * residual.reshape(applied_loads.shape)
+
+
+class IqnIlsAccelerator:
+    """
+    Interface quasi-Newton accelerator with an inverse Jacobian approximation from a least-squares model (IQN-ILS) of
+    the fixed point iteration between Kratos and the UVEC model. The unknowns are the loads on the axles. From the
+    differences of the interface residuals, i.e. the computed minus the applied loads, and of the computed loads
+    between consecutive iterations, a low rank approximation of the Jacobian of the residual is built. The loads
+    of the next iteration follow from the least-squares solution of:
+
+    .. math::
+
+        V c = -r_k, \\quad x_{k+1} = \\tilde{x}_k + W c
+
+    where the columns of V and W are the differences of the residuals and of the computed loads. The differences of
+    the current time step are combined with those of a number of previous time steps. Columns which are (nearly)
+    linearly dependent on newer columns are filtered out during the QR decomposition of V. In the first iteration
+    without any differences, the loads are relaxed with the initial relaxation factor.
+
+    Attributes:
+        - initial_factor (float): relaxation factor of the iterations without differences
+        - reused_time_steps (int): number of previous time steps of which the differences are reused
+        - filter_tolerance (float): relative tolerance below which a column of V is considered linearly dependent
+        - __residual_differences (List[np.ndarray]): differences of the residuals in the current time step, newest
+            first
+        - __load_differences (List[np.ndarray]): differences of the computed loads in the current time step, newest
+            first
+        - __previous_steps (Deque[Tuple[List[np.ndarray], List[np.ndarray]]]): differences of the previous time
+            steps, newest first
+        - __previous_residual (Optional[np.ndarray]): the interface residual of the previous iteration
+        - __previous_computed_loads (Optional[np.ndarray]): the computed loads of the previous iteration
+    """
+
+    def __init__(self, initial_factor: float, reused_time_steps: int, filter_tolerance: float):
+        """
+        Constructor of the IqnIlsAccelerator.
+
+        Args:
+            - initial_factor (float): relaxation factor of the iterations without differences
+            - reused_time_steps (int): number of previous time steps of which the differences are reused
+            - filter_tolerance (float): relative tolerance below which a column of V is considered linearly dependent
+        """
+        if not 0 < initial_factor <= 1:
+            raise ValueError(f"The initial relaxation factor should be larger than 0 and smaller than or equal to 1, "
+                             f"but is: {initial_factor}")
+        if reused_time_steps < 0:
+            raise ValueError(f"The number of reused time steps should be positive or zero, but is: "
+                             f"{reused_time_steps}")
+
+        self.initial_factor = initial_factor
+        self.reused_time_steps = reused_time_steps
+        self.filter_tolerance = filter_tolerance
+
+        self.__residual_differences: List[np.ndarray] = []
+        self.__load_differences: List[np.ndarray] = []
+        self.__previous_steps: Deque[Tuple[List[np.ndarray], List[np.ndarray]]] = deque(maxlen=reused_time_steps)
+        self.__previous_residual: Optional[np.ndarray] = None
+        self.__previous_computed_loads: Optional[np.ndarray] = None
+
+    def initialise_solution_step(self):
+        """
+        Stores the differences of the finished time step for reuse, and resets the iteration history at the start of
+        a time step.
+        """
+        if self.reused_time_steps > 0 and len(self.__residual_differences) > 0:
+            self.__previous_steps.appendleft((self.__residual_differences, self.__load_differences))
+
+        self.__residual_differences = []
+        self.__load_differences = []
+        self.__previous_residual = None
+        self.__previous_computed_loads = None
+
+    def update(self, applied_loads: np.ndarray, computed_loads: np.ndarray) -> np.ndarray:
+        """
+        Computes the quasi-Newton update of the loads which are applied in the next iteration.
+
+        Args:
+            - applied_loads (np.ndarray): the loads which were applied in the previous iteration, shape (n_axles, 3)
+            - computed_loads (np.ndarray): the loads computed by the UVEC model, shape (n_axles, 3)
+
+        Returns:
+            - np.ndarray: the loads of the next iteration, shape (n_axles, 3)
+        """
+        # the computed loads are copied, since they are stored and the UVEC model may reuse its load buffer
+        computed = np.array(computed_loads, dtype=float).ravel()
+        residual = computed - applied_loads.ravel()
+
+        if self.__previous_residual is not None:
+            self.__residual_differences.insert(0, residual - self.__previous_residual)
+            self.__load_differences.insert(0, computed - self.__previous_computed_loads)
+        self.__previous_residual = residual
+        self.__previous_computed_loads = computed
+
+        residual_differences = list(self.__residual_differences)
+        load_differences = list(self.__load_differences)
+        for step_residual_differences, step_load_differences in self.__previous_steps:
+            residual_differences.extend(step_residual_differences)
+            load_differences.extend(step_load_differences)
+
+        q, r, kept_columns = self.__filtered_qr(residual_differences)
+        if len(kept_columns) == 0:
+            return applied_loads + self.initial_factor * residual.reshape(applied_loads.shape)
+
+        coefficients = np.linalg.solve(r, -q.T @ residual)
+        w = np.column_stack([load_differences[column] for column in kept_columns])
+        return (computed + w @ coefficients).reshape(applied_loads.shape)
+
+    def __filtered_qr(self, columns: List[np.ndarray]) -> Tuple[np.ndarray, np.ndarray, List[int]]:
+        """
+        Computes the QR decomposition of the columns with modified Gram-Schmidt, where a column is skipped if its
+        norm after orthogonalisation to the previous columns is smaller than the filter tolerance times its
+        original norm. Columns which are negligible compared to the largest column, e.g. the differences of converged
+        iterations, are skipped as well.
+
+        Args:
+            - columns (List[np.ndarray]): the columns, newest first
+
+        Returns:
+            - Tuple[np.ndarray, np.ndarray, List[int]]: the orthonormal columns Q, the upper triangular matrix R and
+              the indices of the kept columns
+        """
+        q_columns: List[np.ndarray] = []
+        r_columns: List[np.ndarray] = []
+        kept_columns: List[int] = []
+        max_norm = max((np.linalg.norm(column) for column in columns), default=0.0)
+        for index, column in enumerate(columns):
+            column_norm = np.linalg.norm(column)
+            if column_norm <= self.filter_tolerance * max_norm:
+                continue
+
+            orthogonal_column = column.copy()
+            projections = np.zeros(len(q_columns) + 1)
+            for q_index, q_column in enumerate(q_columns):
+                projections[q_index] = q_column @ orthogonal_column
+                orthogonal_column -= projections[q_index] * q_column
+
+            orthogonal_norm = np.linalg.norm(orthogonal_column)
+            if orthogonal_norm <= self.filter_tolerance * column_norm:
+                continue
+
+            projections[-1] = orthogonal_norm
+            q_columns.append(orthogonal_column / orthogonal_norm)
+            r_columns.append(projections)
+            kept_columns.append(index)
+
+        r = np.zeros((len(kept_columns), len(kept_columns)))
+        for index, r_column in enumerate(r_columns):
+            r[:index + 1, index] = r_column
+        q = np.column_stack(q_columns) if len(q_columns) > 0 else np.empty((0, 0))
+        return q, r, kept_columns
+
+
+def create_coupling_accelerator(settings: KratosMultiphysics.Parameters) \
+        -> Optional[Union[AitkenRelaxation, IqnIlsAccelerator]]:
+    """
+    Creates the accelerator of the coupling between Kratos and the UVEC model.
+
+    Args:
+        - settings (KratosMultiphysics.Parameters): settings of the accelerator, including:
+            - "type": Type of the accelerator, "none", "aitken" or "iqn_ils".
+            - "initial_relaxation": Relaxation factor of the first iteration of each time step.
+            - "max_relaxation": Maximum magnitude of the Aitken relaxation factor.
+            - "reused_time_steps": Number of previous time steps of which the IQN-ILS differences are reused.
+            - "filter_tolerance": Relative tolerance of the QR filter of the IQN-ILS differences.
+
+    Returns:
+        - Optional[Union[AitkenRelaxation, IqnIlsAccelerator]]: the accelerator, None if the loads are not
+          accelerated
+    """
+    default_settings = KratosMultiphysics.Parameters("""{
+        "type"               : "none",
+        "initial_relaxation" : 0.5,
+        "max_relaxation"     : 1.0,
+        "reused_time_steps"  : 0,
+        "filter_tolerance"   : 1e-8
+    }""")
+    settings.ValidateAndAssignDefaults(default_settings)
+
+    acceleration_type = settings["type"].GetString().lower()
+    if acceleration_type not in COUPLING_ACCELERATION_TYPES:
+        raise ValueError(f"UVEC coupling acceleration: {acceleration_type} is not supported, available types are: "
+                         f"{COUPLING_ACCELERATION_TYPES}")
+
+    if acceleration_type == "aitken":
+        return AitkenRelaxation(settings["initial_relaxation"].GetDouble(), settings["max_relaxation"].GetDouble())
+    if acceleration_type == "iqn_ils":
+        return IqnIlsAccelerator(settings["initial_relaxation"].GetDouble(), settings["reused_time_steps"].GetInt(),
+                                 settings["filter_tolerance"].GetDouble())
+    return None
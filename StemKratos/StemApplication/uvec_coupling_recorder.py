@@ -0,0 +1,143 @@
+import threading
+import time
+from array import array
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator
+
+import numpy as np
+
+import KratosMultiphysics
+
+# phases of the coupling between Kratos and the UVEC model which are timed
+COUPLING_PHASES = ["UVEC", "SERIALISATION", "KRATOS_SOLVE"]
+
+# file formats to which the recorded coupling data can be exported
+RECORDER_OUTPUT_FORMATS = [".csv", ".npz"]
+
+# label of the log messages of the coupling between Kratos and the UVEC model
+LOGGER_LABEL = "StemUvec"
+
+
+def log_coupling_detail(message: str):
+    """
+    Writes a message about the coupling between Kratos and the UVEC model to the Kratos logger, with DETAIL
+    severity. The message is only shown if the severity of the logger output is set to DETAIL or higher.
+
+    Args:
+        - message (str): the message
+    """
+    KratosMultiphysics.Logger.Print(message, label=LOGGER_LABEL, severity=KratosMultiphysics.Logger.Severity.DETAIL)
+
+
+class UvecCouplingRecorder:
+    """
+    Records the wall clock time and the number of calls of each phase of the coupling between Kratos and the UVEC
+    model, i.e. the call of the UVEC model, the (de)serialisation of the UVEC data and the Kratos solve, and the number
+    of non-linear iterations, per time step. The recorded data is kept in memory and exported at the end of the stage.
+
+    Attributes:
+        - output_file_name (str): name of the csv or npz output file, empty if the data is not exported
+        - __steps (array): step number per recorded time step
+        - __time (array): time per recorded time step
+        - __iterations (array): number of non-linear iterations per recorded time step
+        - __durations (Dict[str, array]): wall clock time per phase and recorded time step
+        - __calls (Dict[str, array]): number of calls per phase and recorded time step
+        - __lock (threading.Lock): lock on the recorded data, such that phases can be recorded from multiple threads
+    """
+
+    def __init__(self, output_file_name: str = ""):
+        """
+        Constructor of the UvecCouplingRecorder.
+
+        Args:
+            - output_file_name (str): name of the csv or npz output file, empty if the data is not exported
+        """
+        if output_file_name != "" and Path(output_file_name).suffix.lower() not in RECORDER_OUTPUT_FORMATS:
+            raise ValueError(f"The UVEC timing output: {output_file_name} should have one of the extensions: "
+                             f"{RECORDER_OUTPUT_FORMATS}")
+
+        self.output_file_name = output_file_name
+        self.__steps = array("q")
+        self.__time = array("d")
+        self.__iterations = array("q")
+        self.__durations = {phase: array("d") for phase in COUPLING_PHASES}
+        self.__calls = {phase: array("q") for phase in COUPLING_PHASES}
+        self.__lock = threading.Lock()
+
+    def start_step(self, step: int, current_time: float):
+        """
+        Starts recording a new time step.
+
+        Args:
+            - step (int): the step number
+            - current_time (float): the time of the step
+        """
+        self.__steps.append(step)
+        self.__time.append(current_time)
+        self.__iterations.append(0)
+        for phase in COUPLING_PHASES:
+            self.__durations[phase].append(0.0)
+            self.__calls[phase].append(0)
+
+    def add_iteration(self):
+        """
+        Counts a non-linear iteration of the current time step.
+        """
+        if len(self.__iterations) > 0:
+            self.__iterations[-1] += 1
+
+    @contextmanager
+    def record(self, phase: str) -> Iterator[None]:
+        """
+        Context manager which adds the wall clock time of the enclosed code to a phase of the current time step.
+        Nothing is recorded before the first time step is started. Phases which are recorded concurrently from
+        multiple threads are summed.
+
+        Args:
+            - phase (str): the coupling phase, one of COUPLING_PHASES
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            with self.__lock:
+                if len(self.__steps) > 0:
+                    self.__durations[phase][-1] += duration
+                    self.__calls[phase][-1] += 1
+
+    def as_arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Gets the recorded data as arrays with one value per recorded time step.
+
+        Returns:
+            - Dict[str, np.ndarray]: "STEP", "TIME", "ITERATIONS" and per phase "<PHASE>_TIME" and "<PHASE>_CALLS"
+        """
+        arrays = {"STEP": np.frombuffer(self.__steps, dtype=np.int64),
+                  "TIME": np.frombuffer(self.__time, dtype=np.float64),
+                  "ITERATIONS": np.frombuffer(self.__iterations, dtype=np.int64)}
+        for phase in COUPLING_PHASES:
+            arrays[f"{phase}_TIME"] = np.frombuffer(self.__durations[phase], dtype=np.float64)
+            arrays[f"{phase}_CALLS"] = np.frombuffer(self.__calls[phase], dtype=np.int64)
+        return arrays
+
+    def export(self):
+        """
+        Writes the recorded data to the output file, as csv with one row per time step or as npz with one array per
+        column, and logs the total time per phase. Nothing is written if no output file is given.
+        """
+        if self.output_file_name == "":
+            return
+
+        arrays = self.as_arrays()
+        if Path(self.output_file_name).suffix.lower() == ".npz":
+            np.savez(self.output_file_name, **arrays)
+        else:
+            np.savetxt(self.output_file_name, np.column_stack(list(arrays.values())), delimiter=",",
+                       header=",".join(arrays.keys()), comments="",
+                       fmt=["%.10g" if array_values.dtype.kind == "f" else "%d" for array_values in arrays.values()])
+
+        totals = ", ".join(f"{phase}: {np.sum(arrays[phase + '_TIME']):.3f} s" for phase in COUPLING_PHASES)
+        KratosMultiphysics.Logger.PrintInfo(LOGGER_LABEL, f"Coupling time over {len(self.__steps)} steps and "
+                                                          f"{int(np.sum(arrays['ITERATIONS']))} iterations, {totals}")
@@ -0,0 +1,74 @@
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Union
+
+import numpy as np
+
+
+class UvecStateStore:
+    """
+    Store of the large state arrays of a UVEC model, e.g. the history of the degrees of freedom of the vehicle or
+    irregularity buffers. The arrays are kept as numpy arrays in memory, such that they are never serialised to json,
+    and are saved to and loaded from a binary npz file between stages.
+
+    The store behaves as a dictionary of numpy arrays, i.e. arrays are stored and retrieved by name.
+
+    Attributes:
+        - __arrays (Dict[str, np.ndarray]): the state arrays by name
+    """
+
+    def __init__(self):
+        """
+        Constructor of the UvecStateStore.
+        """
+        self.__arrays: Dict[str, np.ndarray] = {}
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.__arrays[name]
+
+    def __setitem__(self, name: str, values: Union[np.ndarray, list, float]):
+        self.__arrays[name] = np.asarray(values)
+
+    def __delitem__(self, name: str):
+        del self.__arrays[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.__arrays
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__arrays)
+
+    def __len__(self) -> int:
+        return len(self.__arrays)
+
+    def get(self, name: str, default: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """
+        Gets a state array, or the default if the array is not in the store.
+
+        Args:
+            - name (str): name of the state array
+            - default (Optional[np.ndarray]): value which is returned if the array is not in the store
+
+        Returns:
+            - Optional[np.ndarray]: the state array
+        """
+        return self.__arrays.get(name, default)
+
+    def save(self, file_name: Union[str, Path]):
+        """
+        Saves all state arrays to a binary npz file.
+
+        Args:
+            - file_name (Union[str, Path]): name of the npz file
+        """
+        with open(file_name, "wb") as f:
+            np.savez(f, **self.__arrays)
+
+    def load(self, file_name: Union[str, Path]):
+        """
+        Loads the state arrays from a binary npz file, replacing the arrays in the store.
+
+        Args:
+            - file_name (Union[str, Path]): name of the npz file
+        """
+        with np.load(file_name, allow_pickle=False) as npz_data:
+            self.__arrays = {name: npz_data[name] for name in npz_data.files}
@@ -0,0 +1,188 @@
+import os
+import struct
+from pathlib import Path
+from typing import Any, Dict, List, Tuple, Union
+
+import numpy as np
+
+# identifier and version of the binary UVEC trace format
+TRACE_MAGIC = b"STEMUVEC"
+TRACE_VERSION = 1
+
+# header of the trace: magic, version and number of axles, followed by the axle numbers as int64
+TRACE_HEADER = struct.Struct("<8sBI")
+
+
+def get_trace_record_dtype(n_axles: int) -> np.dtype:
+    """
+    Gets the data type of a record of the UVEC trace, i.e. of a single call of the UVEC model.
+
+    Args:
+        - n_axles (int): number of axles
+
+    Returns:
+        - np.dtype: structured data type with the step, the iteration within the step, the time and the displacements,
+          rotations and loads per axle
+    """
+    return np.dtype([("step", "<i8"), ("iteration", "<i8"), ("time", "<f8"),
+                     ("u", "<f8", (n_axles, 3)), ("theta", "<f8", (n_axles, 3)), ("loads", "<f8", (n_axles, 3))])
+
+
+def read_uvec_trace(file_name: Union[str, Path]) -> Tuple[List[str], np.ndarray]:
+    """
+    Reads a binary UVEC trace. An incomplete last record, e.g. of an interrupted simulation, is ignored.
+
+    Args:
+        - file_name (Union[str, Path]): name of the trace file
+
+    Returns:
+        - Tuple[List[str], np.ndarray]: the axle numbers and the records, as structured array with the fields of
+          :func:`get_trace_record_dtype`
+    """
+    with open(file_name, "rb") as f:
+        magic, version, n_axles = TRACE_HEADER.unpack(f.read(TRACE_HEADER.size))
+        if magic != TRACE_MAGIC or version != TRACE_VERSION:
+            raise ValueError(f"File: {file_name} is not a UVEC trace of version: {TRACE_VERSION}")
+
+        axle_numbers = [str(axle_number) for axle_number in np.frombuffer(f.read(8 * n_axles), dtype="<i8")]
+        buffer = f.read()
+
+    record_dtype = get_trace_record_dtype(n_axles)
+    n_records = len(buffer) // record_dtype.itemsize
+    return axle_numbers, np.frombuffer(buffer, dtype=record_dtype, count=n_records)
+
+
+class UvecTraceWriter:
+    """
+    Writes each call of a UVEC model, i.e. the displacements and rotations at the axles and the resulting loads, per
+    step and non-linear iteration, to a compact binary trace. The trace starts with a header containing the axle
+    numbers, followed by fixed size records.
+
+    Attributes:
+        - file_name (str): name of the trace file
+        - axle_numbers (List[str]): numbers of the axles, in the order of the rows of the axle data
+        - __record (np.ndarray): buffer of a single record
+        - __file (BinaryIO): the opened trace file
+    """
+
+    def __init__(self, file_name: str, axle_numbers: List[str], append: bool = False):
+        """
+        Constructor of the UvecTraceWriter. The trace file is created, or opened for appending to a trace of a
+        previous stage with the same axles.
+
+        Args:
+            - file_name (str): name of the trace file
+            - axle_numbers (List[str]): numbers of the axles, in the order of the rows of the axle data
+            - append (bool): whether the records are appended to an existing trace
+        """
+        self.file_name = file_name
+        self.axle_numbers = list(axle_numbers)
+        self.__record = np.zeros(1, dtype=get_trace_record_dtype(len(self.axle_numbers)))
+
+        if append and os.path.isfile(file_name):
+            existing_axle_numbers, _ = read_uvec_trace(file_name)
+            if sorted(existing_axle_numbers) != sorted(self.axle_numbers):
+                raise ValueError(f"The axles: {self.axle_numbers} do not match the axles: {existing_axle_numbers} "
+                                 f"of UVEC trace: {file_name}")
+            self.axle_numbers = existing_axle_numbers
+            self.__file = open(file_name, "ab")
+        else:
+            self.__file = open(file_name, "wb")
+            self.__file.write(TRACE_HEADER.pack(TRACE_MAGIC, TRACE_VERSION, len(self.axle_numbers)))
+            self.__file.write(np.asarray([int(axle_number) for axle_number in self.axle_numbers], dtype="<i8")
+                              .tobytes())
+
+    def write(self, step: int, iteration: int, time: float, axle_numbers: List[str], u: np.ndarray,
+              theta: np.ndarray, loads: np.ndarray):
+        """
+        Writes a call of the UVEC model to the trace.
+
+        Args:
+            - step (int): the step number
+            - iteration (int): the number of the call within the step, starting at 1
+            - time (float): the time of the step
+            - axle_numbers (List[str]): numbers of the axles, in the order of the rows of u, theta and loads
+            - u (np.ndarray): displacements at the axles, shape (n_axles, 3)
+            - theta (np.ndarray): rotations at the axles, shape (n_axles, 3)
+            - loads (np.ndarray): loads on the axles, shape (n_axles, 3)
+        """
+        order = [axle_numbers.index(axle_number) for axle_number in self.axle_numbers]
+
+        record = self.__record[0]
+        record["step"] = step
+        record["iteration"] = iteration
+        record["time"] = time
+        record["u"] = np.asarray(u)[order]
+        record["theta"] = np.asarray(theta)[order]
+        record["loads"] = np.asarray(loads)[order]
+        self.__file.write(self.__record.tobytes())
+
+    def close(self):
+        """
+        Closes the trace file.
+        """
+        self.__file.close()
+
+
+class UvecReplayModel:
+    """
+    UVEC model which replays the loads of a recorded UVEC trace, without calling the original UVEC model. The model
+    is called with the python UVEC interface. The n-th call within a step returns the loads of the n-th recorded call
+    within that step. If a step has more calls than were recorded, the loads of the last recorded call of the step are
+    returned.
+
+    Attributes:
+        - trace_file (str): name of the trace file
+        - axle_numbers (List[str]): numbers of the axles, in the order of the rows of the uvec data
+        - __loads (Dict[int, np.ndarray]): recorded loads per step, shape (n_calls, n_axles, 3)
+        - __step (int): the step of the previous call
+        - __iteration (int): the number of calls within the current step
+    """
+
+    def __init__(self, trace_file: str, axle_numbers: List[str]):
+        """
+        Constructor of the UvecReplayModel, the trace is read and ordered by step.
+
+        Args:
+            - trace_file (str): name of the trace file
+            - axle_numbers (List[str]): numbers of the axles, in the order of the rows of the uvec data
+        """
+        self.trace_file = trace_file
+        self.axle_numbers = list(axle_numbers)
+
+        trace_axle_numbers, records = read_uvec_trace(trace_file)
+        missing_axles = sorted(set(self.axle_numbers) - set(trace_axle_numbers))
+        if len(missing_axles) > 0:
+            raise ValueError(f"Axles: {missing_axles} are not recorded in UVEC trace: {trace_file}")
+        order = [trace_axle_numbers.index(axle_number) for axle_number in self.axle_numbers]
+
+        self.__loads: Dict[int, np.ndarray] = {}
+        for step in np.unique(records["step"]):
+            step_records = np.sort(records[records["step"] == step], order="iteration", kind="stable")
+            self.__loads[int(step)] = step_records["loads"][:, order]
+
+        self.__step = -1
+        self.__iteration = 0
+
+    def __call__(self, uvec_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Replays the recorded loads of the current step and call.
+
+        Args:
+            - uvec_data (Dict[str, Any]): input data for the uvec model, in the form of the python interface
+
+        Returns:
+            - Dict[str, Any]: the uvec data, containing the recorded loads
+        """
+        step = uvec_data["time_index"] + 1
+        if step != self.__step:
+            self.__step = step
+            self.__iteration = 0
+
+        if step not in self.__loads:
+            raise ValueError(f"Step: {step} is not recorded in UVEC trace: {self.trace_file}")
+
+        step_loads = self.__loads[step]
+        uvec_data["loads"] = step_loads[min(self.__iteration, len(step_loads) - 1)].copy()
+        self.__iteration += 1
+        return uvec_data
@@ -0,0 +1,201 @@
+import importlib.util
+import os
+import multiprocessing
+from multiprocessing import shared_memory
+from multiprocessing.connection import Connection
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+# messages from the controller to the UVEC worker
+CALL_MESSAGE = "call"
+STOP_MESSAGE = "stop"
+
+# number of scalar values in front of the axle data in the shared buffer: t, dt and time_index
+N_SCALARS = 3
+
+
+def _get_buffer_views(buffer: memoryview, n_axles: int) -> Dict[str, np.ndarray]:
+    """
+    Gets the views on the shared buffer, which contains the scalars, followed by u, theta and loads per axle.
+
+    Args:
+        - buffer (memoryview): the shared buffer
+        - n_axles (int): number of axles
+
+    Returns:
+        - Dict[str, np.ndarray]: the views "scalars", "u", "theta" and "loads"
+    """
+    values = np.ndarray((N_SCALARS + 9 * n_axles,), dtype=np.float64, buffer=buffer)
+    views = {"scalars": values[:N_SCALARS]}
+    for index, variable in enumerate(["u", "theta", "loads"]):
+        start = N_SCALARS + 3 * n_axles * index
+        views[variable] = values[start:start + 3 * n_axles].reshape(n_axles, 3)
+    return views
+
+
+def _run_uvec_worker(uvec_path: str, uvec_method: str, shared_memory_name: str, axle_numbers: List[str],
+                     connection: Connection, uvec_data: Dict[str, Any]):
+    """
+    Runs the UVEC model in the worker process. Each call message, the UVEC model is called with the time data,
+    displacements and rotations in the shared buffer, and the loads are written to the shared buffer. The worker
+    keeps the UVEC data, including the state, between calls. At the stop message, the state is returned.
+
+    Args:
+        - uvec_path (str): path to the UVEC model
+        - uvec_method (str): name of the UVEC function, with the python interface
+        - shared_memory_name (str): name of the shared memory block
+        - axle_numbers (List[str]): numbers of the axles, in the order of the rows of the axle data
+        - connection (Connection): connection to the controller
+        - uvec_data (Dict[str, Any]): the initial UVEC data, without the axle arrays
+    """
+    module_name = os.path.basename(uvec_path).split(".")[0]
+    spec = importlib.util.spec_from_file_location(module_name, uvec_path)
+    uvec = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(uvec)
+    callback_function = getattr(uvec, uvec_method)
+
+    shared_buffer = shared_memory.SharedMemory(name=shared_memory_name)
+    views = _get_buffer_views(shared_buffer.buf, len(axle_numbers))
+
+    while True:
+        message = connection.recv()
+        if message == STOP_MESSAGE:
+            connection.send(uvec_data.get("state", {}))
+            break
+
+        try:
+            uvec_data["t"], uvec_data["dt"] = float(views["scalars"][0]), float(views["scalars"][1])
+            uvec_data["time_index"] = int(views["scalars"][2])
+            uvec_data["u"] = views["u"].copy()
+            uvec_data["theta"] = views["theta"].copy()
+
+            uvec_data = callback_function(uvec_data)
+
+            loads = uvec_data["loads"]
+            if isinstance(loads, dict):
+                loads = [loads.get(axle_number, loads.get(int(axle_number), [0.0, 0.0, 0.0]))
+                         for axle_number in axle_numbers]
+            views["loads"][:] = np.reshape(np.asarray(loads, dtype=float), (-1, 3))
+            connection.send(None)
+        except Exception as error:
+            connection.send(f"{type(error).__name__}: {error}")
+
+    del views
+    shared_buffer.close()
+
+
+class UvecWorkerModel:
+    """
+    UVEC model which runs in a persistent worker process, such that the UVEC model does not compete with Kratos for
+    the global interpreter lock, and a crash of the UVEC model does not stop the simulation without an error. The
+    UVEC model has the python interface. The time data, displacements, rotations and loads are exchanged through a
+    shared memory buffer, only a short message is sent through a pipe to start a call.
+
+    The UVEC data, including the state, is kept in the worker process. The state is returned when the worker is
+    stopped.
+
+    Attributes:
+        - uvec_path (str): path to the UVEC model
+        - uvec_method (str): name of the UVEC function
+        - axle_numbers (List[str]): numbers of the axles, in the order of the rows of the axle data
+        - __shared_buffer (Optional[shared_memory.SharedMemory]): the shared memory block
+        - __views (Dict[str, np.ndarray]): views on the shared memory block
+        - __connection (Optional[Connection]): connection to the worker process
+        - __process (Optional[multiprocessing.Process]): the worker process
+    """
+
+    def __init__(self, uvec_path: str, uvec_method: str, axle_numbers: List[str]):
+        """
+        Constructor of the UvecWorkerModel, the worker is started with :meth:`start`.
+
+        Args:
+            - uvec_path (str): path to the UVEC model
+            - uvec_method (str): name of the UVEC function
+            - axle_numbers (List[str]): numbers of the axles, in the order of the rows of the axle data
+        """
+        self.uvec_path = uvec_path
+        self.uvec_method = uvec_method
+        self.axle_numbers = list(axle_numbers)
+
+        self.__shared_buffer: Optional[shared_memory.SharedMemory] = None
+        self.__views: Dict[str, np.ndarray] = {}
+        self.__connection: Optional[Connection] = None
+        self.__process: Optional[multiprocessing.Process] = None
+
+    def start(self, uvec_data: Dict[str, Any]):
+        """
+        Allocates the shared buffer and starts the worker process. The worker is spawned, such that it does not
+        inherit the state of the Kratos process.
+
+        Args:
+            - uvec_data (Dict[str, Any]): the initial UVEC data, containing only json serialisable values
+        """
+        n_values = N_SCALARS + 9 * len(self.axle_numbers)
+        self.__shared_buffer = shared_memory.SharedMemory(create=True, size=n_values * 8)
+        self.__views = _get_buffer_views(self.__shared_buffer.buf, len(self.axle_numbers))
+        self.__views["scalars"][:] = 0.0
+
+        context = multiprocessing.get_context("spawn")
+        self.__connection, worker_connection = context.Pipe()
+        self.__process = context.Process(target=_run_uvec_worker, daemon=True,
+                                         args=(self.uvec_path, self.uvec_method, self.__shared_buffer.name,
+                                               self.axle_numbers, worker_connection, uvec_data))
+        self.__process.start()
+        worker_connection.close()
+
+    def __call__(self, uvec_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Calls the UVEC model in the worker process.
+
+        Args:
+            - uvec_data (Dict[str, Any]): input data for the uvec model, in the form of the python interface
+
+        Returns:
+            - Dict[str, Any]: the uvec data, containing the loads
+        """
+        if self.__process is None:
+            raise RuntimeError("The UVEC worker is not started")
+
+        self.__views["scalars"][:] = [uvec_data["t"], uvec_data["dt"], uvec_data["time_index"]]
+        self.__views["u"][:] = uvec_data["u"]
+        self.__views["theta"][:] = uvec_data["theta"]
+
+        try:
+            self.__connection.send(CALL_MESSAGE)
+            error = self.__connection.recv()
+        except (EOFError, OSError):
+            raise RuntimeError(f"The UVEC worker of: {self.uvec_path} stopped with exit code: "
+                               f"{self.__process.exitcode}")
+
+        if error is not None:
+            raise RuntimeError(f"UVEC function: {self.uvec_method} of: {self.uvec_path} failed in the worker: "
+                               f"{error}")
+
+        uvec_data["loads"] = self.__views["loads"].copy()
+        return uvec_data
+
+    def stop(self) -> Dict[str, Any]:
+        """
+        Stops the worker process and releases the shared buffer.
+
+        Returns:
+            - Dict[str, Any]: the final state of the UVEC model, empty if the worker stopped unexpectedly
+        """
+        if self.__process is None:
+            return {}
+
+        state = {}
+        try:
+            self.__connection.send(STOP_MESSAGE)
+            state = self.__connection.recv()
+        except (EOFError, OSError):
+            pass
+
+        self.__process.join()
+        self.__connection.close()
+        self.__views = {}
+        self.__shared_buffer.close()
+        self.__shared_buffer.unlink()
+        self.__process = None
+        return state
@@ -0,0 +1,338 @@
+import os
+import warnings
+from typing import Dict
+
+import numpy as np
+
+import KratosMultiphysics
+from KratosMultiphysics.json_output_process import JsonOutputProcess
+from KratosMultiphysics.StemApplication.binary_output_utilities import (BINARY_OUTPUT_FORMATS, SEPARATOR,
+                                                                        get_binary_output_path,
+                                                                        convert_arrays_to_output_data,
+                                                                        write_binary_arrays)
+from KratosMultiphysics.StemApplication.fast_json_output_process import (fast_write_external_json,
+                                                                         select_output_nodes)
+
+# names of the components of the velocity in the output
+COMPONENTS = ["_X", "_Y", "_Z"]
+
+
+class VibrationMetricsOutputProcess(JsonOutputProcess):
+    """
+    This process computes vibration metrics of the velocity at the output nodes during the calculation, instead of
+    storing the full time series. The metrics are updated each solution step with running reductions:
+
+    - the peak particle velocity (PPV), per component and of the velocity vector
+    - the root mean square (RMS) of the velocity over the whole stage
+    - the maximum of the running RMS, with an exponential time weighting
+    - the maximum effective velocity Veff according to SBR and DIN 4150-2, i.e. the running RMS with a time constant
+      of 0.125 s of the velocity weighted with the KB filter, a first order high pass filter with a cut-off frequency
+      of 5.6 Hz
+    - the maximum one-third octave band spectrum of the velocity, computed with a Hann window over overlapping
+      windows
+
+    The output nodes are selected as in the FastJsonOutputProcess. Per output node, the metrics are written in the
+    layout of the json output, the centre frequencies of the one-third octave bands are written to
+    "ONE_THIRD_OCTAVE_FREQUENCIES". Next to json, the metrics can be written as npy or npz arrays.
+
+    Inheritance:
+        - :class:`KratosMultiphysics.JsonOutputProcess`
+
+    Attributes:
+        - metrics_settings (KratosMultiphysics.Parameters): settings which are specific to this process
+        - velocity_variable (KratosMultiphysics.Array1DVariable3): the velocity variable
+        - output_format (str): format of the output, "json", "npy" or "npz"
+        - precision (str): floating point precision of the binary output, "float64" or "float32"
+        - flush_interval (int): number of solution steps between writing the output file, 0 means that the output
+            file is only written at the end of the stage
+        - __node_keys (list): keys of the output nodes in the output data
+        - __node_indices (np.ndarray): indices of the output nodes within the sub model part, None if all nodes are
+            output nodes
+        - __nodal_expression (KratosMultiphysics.Expression.NodalExpression): expression used to gather the velocity
+        - __metrics (Dict[str, np.ndarray]): the running reductions per output node
+        - __duration (float): time over which the metrics are computed
+        - __dt (float): time step of the spectrum windows
+        - __window (np.ndarray): the Hann window
+        - __window_buffer (np.ndarray): ring buffer with the last velocities, shape (n_nodes, 3, n_window_samples)
+        - __band_matrix (np.ndarray): per frequency bin, the scaled contribution to each one-third octave band
+        - __band_frequencies (np.ndarray): centre frequencies of the one-third octave bands
+        - __n_samples (int): number of velocities added to the ring buffer
+        - __n_steps_since_flush (int): number of solution steps since the output file was written
+    """
+
+    def __init__(self, model: KratosMultiphysics.Model, params: KratosMultiphysics.Parameters):
+        """
+        Constructor of the VibrationMetricsOutputProcess.
+
+        Args:
+            - model (KratosMultiphysics.Model): The model containing the sub_model_part to output.
+            - params (KratosMultiphysics.Parameters): The parameters for the process, including the node selection
+              of the JsonOutputProcess and:
+                - "velocity_variable": Name of the velocity variable.
+                - "rms_time_constant": Time constant of the running RMS.
+                - "veff_cutoff_frequency": Cut-off frequency of the KB filter.
+                - "veff_time_constant": Time constant of the running RMS of the effective velocity.
+                - "spectrum_window": Duration of the windows of the one-third octave spectra.
+                - "spectrum_overlap": Overlap fraction of consecutive windows, from 0 to 1.
+                - "spectrum_frequency_range": Minimum and maximum centre frequency of the one-third octave bands.
+                - "flush_interval": Number of solution steps between writing the output file, 0 means that the
+                  output file is only written at the end of the stage.
+                - "output_format": Format of the output, "json", "npy" or "npz".
+                - "precision": Floating point precision of the binary output, "float64" or "float32".
+        """
+        self.metrics_settings = self.__extract_metrics_settings(params)
+        self.velocity_variable = KratosMultiphysics.KratosGlobals.GetVariable(
+            self.metrics_settings["velocity_variable"].GetString())
+        self.output_format = self.metrics_settings["output_format"].GetString().lower()
+        self.precision = self.metrics_settings["precision"].GetString().lower()
+        self.flush_interval = self.metrics_settings["flush_interval"].GetInt()
+
+        if self.output_format != "json" and self.output_format not in BINARY_OUTPUT_FORMATS:
+            raise ValueError(f"Output format: {self.output_format} is not supported, available formats are: "
+                             f"{['json'] + BINARY_OUTPUT_FORMATS}")
+
+        overlap = self.metrics_settings["spectrum_overlap"].GetDouble()
+        if not 0.0 <= overlap < 1.0:
+            raise ValueError(f"The spectrum overlap should be at least 0 and smaller than 1, but is: {overlap}")
+
+        super().__init__(model, params)
+
+        self.__node_keys = []
+        self.__node_indices = None
+        self.__nodal_expression = None
+        self.__metrics: Dict[str, np.ndarray] = {}
+        self.__duration = 0.0
+        self.__dt = 0.0
+        self.__window = np.empty(0)
+        self.__window_buffer = np.empty((0, 3, 0))
+        self.__band_matrix = np.empty((0, 0))
+        self.__band_frequencies = np.empty(0)
+        self.__n_samples = 0
+        self.__n_steps_since_flush = 0
+
+    @staticmethod
+    def __extract_metrics_settings(params: KratosMultiphysics.Parameters) -> KratosMultiphysics.Parameters:
+        """
+        Extracts the settings which are specific to the VibrationMetricsOutputProcess from the process parameters.
+        The extracted settings are removed from the process parameters.
+
+        Args:
+            - params (KratosMultiphysics.Parameters): The parameters for the process.
+
+        Returns:
+            - KratosMultiphysics.Parameters: The settings specific to the VibrationMetricsOutputProcess.
+        """
+        default_settings = KratosMultiphysics.Parameters("""{
+            "velocity_variable"        : "VELOCITY",
+            "rms_time_constant"        : 1.0,
+            "veff_cutoff_frequency"    : 5.6,
+            "veff_time_constant"       : 0.125,
+            "spectrum_window"          : 1.0,
+            "spectrum_overlap"         : 0.5,
+            "spectrum_frequency_range" : [1.0, 80.0],
+            "flush_interval"           : 0,
+            "output_format"            : "json",
+            "precision"                : "float64"
+        }""")
+
+        metrics_settings = KratosMultiphysics.Parameters("{}")
+        for key in default_settings.keys():
+            if params.Has(key):
+                metrics_settings.AddValue(key, params[key])
+                params.RemoveValue(key)
+
+        metrics_settings.ValidateAndAssignDefaults(default_settings)
+
+        return metrics_settings
+
+    def ExecuteBeforeSolutionLoop(self):
+        """
+        Selects the output nodes and initialises the running reductions.
+        """
+        if self.resultant_solution:
+            raise ValueError("A resultant solution is not supported by the VibrationMetricsOutputProcess")
+
+        self.__node_keys, self.__node_indices = select_output_nodes(self)
+        self.__nodal_expression = KratosMultiphysics.Expression.NodalExpression(self.sub_model_part)
+
+        n_nodes = len(self.__node_keys)
+        self.__metrics = {name: np.zeros((n_nodes, 3)) for name in
+                          ["PPV", "SUM_OF_SQUARES", "RUNNING_MEAN_SQUARE", "MAX_RUNNING_RMS", "PREVIOUS_VELOCITY",
+                           "KB_VELOCITY", "VEFF_MEAN_SQUARE", "VEFF_MAX"]}
+        self.__metrics["PPV_VECTOR"] = np.zeros(n_nodes)
+        self.__duration = 0.0
+        self.__dt = 0.0
+        self.__n_steps_since_flush = 0
+
+        # binary output is written to a separate path
+        if self.output_format != "json" and os.path.isfile(self.output_file_name):
+            os.remove(self.output_file_name)
+
+    def __initialise_spectrum(self, dt: float):
+        """
+        Initialises the ring buffer of the spectrum windows and the mapping of the frequency bins to the one-third
+        octave bands, for a time step.
+
+        Args:
+            - dt (float): the time step
+        """
+        self.__dt = dt
+        n_window_samples = max(2, int(round(self.metrics_settings["spectrum_window"].GetDouble() / dt)))
+
+        # periodic Hann window
+        self.__window = 0.5 - 0.5 * np.cos(2.0 * np.pi * np.arange(n_window_samples) / n_window_samples)
+        self.__window_buffer = np.zeros((len(self.__node_keys), 3, n_window_samples))
+        self.__n_samples = 0
+
+        # nominal centre frequencies of the one-third octave bands, with band edges at a factor 10^(1/20)
+        min_frequency, max_frequency = self.metrics_settings["spectrum_frequency_range"].GetVector()
+        band_numbers = np.arange(np.ceil(10 * np.log10(min_frequency) - 1e-9),
+                                 np.floor(10 * np.log10(max_frequency) + 1e-9) + 1)
+        self.__band_frequencies = 10.0 ** (band_numbers / 10)
+        lower_edges = self.__band_frequencies * 10 ** -0.05
+        upper_edges = self.__band_frequencies * 10 ** 0.05
+
+        # scaling of the one-sided power spectrum, such that the sum over all bins equals the mean square
+        bin_frequencies = np.fft.rfftfreq(n_window_samples, dt)
+        bin_scaling = np.full(len(bin_frequencies), 2.0 / (n_window_samples * np.sum(self.__window ** 2)))
+        bin_scaling[0] /= 2
+        if n_window_samples % 2 == 0:
+            bin_scaling[-1] /= 2
+
+        is_in_band = ((bin_frequencies[:, np.newaxis] >= lower_edges[np.newaxis, :]) &
+                      (bin_frequencies[:, np.newaxis] < upper_edges[np.newaxis, :]))
+        self.__band_matrix = is_in_band * bin_scaling[:, np.newaxis]
+        self.__metrics["BAND_MAX"] = np.zeros((len(self.__node_keys), 3, len(self.__band_frequencies)))
+
+    def __add_to_spectrum(self, velocity: np.ndarray):
+        """
+        Adds the velocity to the ring buffer of the spectrum windows. After each hop, the one-third octave band
+        spectrum of the last window is computed and the maximum band values are updated.
+
+        Args:
+            - velocity (np.ndarray): the velocity at the output nodes, shape (n_nodes, 3)
+        """
+        n_window_samples = len(self.__window)
+        self.__window_buffer[:, :, self.__n_samples % n_window_samples] = velocity
+        self.__n_samples += 1
+
+        overlap = self.metrics_settings["spectrum_overlap"].GetDouble()
+        hop = max(1, int(round(n_window_samples * (1.0 - overlap))))
+        if self.__n_samples < n_window_samples or (self.__n_samples - n_window_samples) % hop != 0:
+            return
+
+        # the oldest sample in the ring buffer is at the current write position
+        window_values = np.roll(self.__window_buffer, -(self.__n_samples % n_window_samples), axis=2)
+        power = np.abs(np.fft.rfft(window_values * self.__window, axis=2)) ** 2
+        band_values = np.sqrt(power @ self.__band_matrix)
+        np.maximum(self.__metrics["BAND_MAX"], band_values, out=self.__metrics["BAND_MAX"])
+
+    def ExecuteFinalizeSolutionStep(self):
+        """
+        Updates the running reductions with the velocity of the solution step. The output file is written every
+        flush interval.
+        """
+        dt = self.sub_model_part.ProcessInfo.GetValue(KratosMultiphysics.DELTA_TIME)
+
+        KratosMultiphysics.Expression.VariableExpressionIO.Read(self.__nodal_expression, self.velocity_variable,
+                                                                self.historical_value)
+        velocity = self.__nodal_expression.Evaluate()
+        if self.__node_indices is not None:
+            velocity = velocity[self.__node_indices]
+
+        metrics = self.__metrics
+        np.maximum(metrics["PPV"], np.abs(velocity), out=metrics["PPV"])
+        np.maximum(metrics["PPV_VECTOR"], np.linalg.norm(velocity, axis=1), out=metrics["PPV_VECTOR"])
+
+        metrics["SUM_OF_SQUARES"] += velocity ** 2 * dt
+        self.__duration += dt
+
+        # exponentially time weighted running mean square
+        rms_weight = 1.0 - np.exp(-dt / self.metrics_settings["rms_time_constant"].GetDouble())
+        metrics["RUNNING_MEAN_SQUARE"] += rms_weight * (velocity ** 2 - metrics["RUNNING_MEAN_SQUARE"])
+        np.maximum(metrics["MAX_RUNNING_RMS"], np.sqrt(metrics["RUNNING_MEAN_SQUARE"]),
+                   out=metrics["MAX_RUNNING_RMS"])
+
+        # KB filter: first order high pass filter, followed by the running mean square
+        rc = 1.0 / (2.0 * np.pi * self.metrics_settings["veff_cutoff_frequency"].GetDouble())
+        metrics["KB_VELOCITY"] = rc / (rc + dt) * (metrics["KB_VELOCITY"] + velocity - metrics["PREVIOUS_VELOCITY"])
+        metrics["PREVIOUS_VELOCITY"] = velocity
+        veff_weight = 1.0 - np.exp(-dt / self.metrics_settings["veff_time_constant"].GetDouble())
+        metrics["VEFF_MEAN_SQUARE"] += veff_weight * (metrics["KB_VELOCITY"] ** 2 - metrics["VEFF_MEAN_SQUARE"])
+        np.maximum(metrics["VEFF_MAX"], np.sqrt(metrics["VEFF_MEAN_SQUARE"]), out=metrics["VEFF_MAX"])
+
+        # the spectrum windows require a constant time step
+        if self.__dt == 0.0:
+            self.__initialise_spectrum(dt)
+        elif not np.isclose(dt, self.__dt, rtol=1e-9, atol=0.0):
+            warnings.warn(f"The time step changed from: {self.__dt} to: {dt}, the spectrum windows are restarted")
+            band_max = self.__metrics["BAND_MAX"]
+            self.__initialise_spectrum(dt)
+            if band_max.shape == self.__metrics["BAND_MAX"].shape:
+                self.__metrics["BAND_MAX"] = band_max
+        self.__add_to_spectrum(velocity)
+
+        self.__n_steps_since_flush += 1
+        if self.flush_interval > 0 and self.__n_steps_since_flush >= self.flush_interval:
+            self.flush()
+
+    def ExecuteFinalize(self):
+        """
+        Writes the vibration metrics to the output file.
+        """
+        self.flush()
+
+    def get_output_arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Returns the vibration metrics as numeric arrays, in the layout of the binary output.
+
+        Returns:
+            - Dict[str, np.ndarray]: the output arrays
+        """
+        time = self.sub_model_part.ProcessInfo.GetValue(KratosMultiphysics.TIME)
+        arrays = {"TIME": np.array([time]),
+                  "ONE_THIRD_OCTAVE_FREQUENCIES": self.__band_frequencies,
+                  "NODE" + SEPARATOR + "KEYS": np.asarray(self.__node_keys, dtype=str),
+                  "NODE" + SEPARATOR + "GAUSS_POINT_SERIES": np.asarray([], dtype=str)}
+
+        metrics = self.__metrics
+        rms = np.sqrt(metrics["SUM_OF_SQUARES"] / self.__duration) if self.__duration > 0 \
+            else np.zeros_like(metrics["SUM_OF_SQUARES"])
+        band_max = metrics.get("BAND_MAX", np.zeros((len(self.__node_keys), 3, 0)))
+
+        arrays["NODE" + SEPARATOR + "PPV"] = metrics["PPV_VECTOR"]
+        for index, component in enumerate(COMPONENTS):
+            arrays["NODE" + SEPARATOR + "PPV" + component] = metrics["PPV"][:, index]
+            arrays["NODE" + SEPARATOR + "RMS" + component] = rms[:, index]
+            arrays["NODE" + SEPARATOR + "MAX_RUNNING_RMS" + component] = metrics["MAX_RUNNING_RMS"][:, index]
+            arrays["NODE" + SEPARATOR + "VEFF_MAX" + component] = metrics["VEFF_MAX"][:, index]
+            arrays["NODE" + SEPARATOR + "ONE_THIRD_OCTAVE" + component] = band_max[:, index]
+
+        return arrays
+
+    def flush(self):
+        """
+        Writes the current vibration metrics to the output file.
+        """
+        arrays = self.get_output_arrays()
+
+        if self.output_format == "json":
+            data = convert_arrays_to_output_data(arrays)
+            data["ONE_THIRD_OCTAVE_FREQUENCIES"] = arrays["ONE_THIRD_OCTAVE_FREQUENCIES"].tolist()
+            fast_write_external_json(self.output_file_name, data)
+        else:
+            write_binary_arrays(get_binary_output_path(self.output_file_name, self.output_format), arrays,
+                                self.output_format, self.precision)
+
+        self.__n_steps_since_flush = 0
+
+
+def Factory(settings: KratosMultiphysics.Parameters, Model: KratosMultiphysics.Model):
+    """
+    Factory method to create an instance of the VibrationMetricsOutputProcess.
+
+    Args:
+        - settings (KratosMultiphysics.Parameters): The parameters for the process
+        - Model (KratosMultiphysics.Model): The model containing the sub_model_part to output.
+    """
+    return VibrationMetricsOutputProcess(Model, settings["Parameters"])
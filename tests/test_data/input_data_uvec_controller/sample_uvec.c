@@ -0,0 +1,46 @@
+/*
+ * uvec model with the native interface, the load on each axle depends on the vertical displacement of the axle.
+ * The reference load is read from the "parameters" of the uvec data at initialisation.
+ *
+ * compile with: gcc -shared -fPIC -O2 -o sample_uvec.so sample_uvec.c
+ */
+#include <stdlib.h>
+#include <string.h>
+
+static double reference_load = -1000.0;
+static int n_calls = 0;
+
+int uvec_native_initialise(int n_axles, const char* parameters_json)
+{
+    const char* key = strstr(parameters_json, "\"reference_load\"");
+    if (n_axles < 0) {
+        return 1;
+    }
+    if (key != NULL) {
+        key = strchr(key, ':');
+        if (key == NULL) {
+            return 2;
+        }
+        reference_load = strtod(key + 1, NULL);
+    }
+    n_calls = 0;
+    return 0;
+}
+
+int uvec_native(int n_axles, double t, double dt, int time_index,
+                const double* u, const double* theta, double* loads)
+{
+    int i;
+    for (i = 0; i < n_axles; ++i) {
+        loads[3 * i] = 0.0;
+        loads[3 * i + 1] = reference_load + 1e5 * u[3 * i + 1];
+        loads[3 * i + 2] = 0.0;
+    }
+    ++n_calls;
+    return 0;
+}
+
+int uvec_native_n_calls(void)
+{
+    return n_calls;
+}
@@ -0,0 +1,85 @@
+from typing import Dict, Any
+import json
+
+import numpy as np
+
+
+def uvec_json(json_string: str) -> str:
+    """
+    uvec function with the json interface, the load on each axle depends on the vertical displacement of the axle.
+
+    Args:
+        - json_string (str): json string containing the uvec data
+
+    Returns:
+        - str: json string containing the load data
+
+    """
+    uvec_data = json.loads(json_string)
+
+    uvec_data["loads"] = {axle_number: [0.0, -1000.0 * int(axle_number) + 1e5 * u[1], 0.0]
+                          for axle_number, u in uvec_data["u"].items()}
+    uvec_data["state"]["n_calls"] = uvec_data["state"].get("n_calls", 0) + 1
+
+    return json.dumps(uvec_data)
+
+
+def uvec_python(uvec_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    uvec function with the python interface, the load on each axle depends on the vertical displacement of the axle.
+
+    Args:
+        - uvec_data (Dict[str, Any]): uvec data, where "u", "theta" and "loads" contain one row per axle
+
+    Returns:
+        - Dict[str, Any]: uvec data containing the load data
+
+    """
+    axle_numbers = np.array([int(axle_number) for axle_number in uvec_data["axle_numbers"]])
+
+    uvec_data["loads"] = np.zeros((len(axle_numbers), 3))
+    uvec_data["loads"][:, 1] = -1000.0 * axle_numbers + 1e5 * uvec_data["u"][:, 1]
+    uvec_data["state"]["n_calls"] = uvec_data["state"].get("n_calls", 0) + 1
+
+    return uvec_data
+
+
+def uvec_python_state_arrays(uvec_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    uvec function with the python interface, which keeps the history of the vertical displacement of the axles in
+    the state arrays.
+
+    Args:
+        - uvec_data (Dict[str, Any]): uvec data, where "u", "theta" and "loads" contain one row per axle
+
+    Returns:
+        - Dict[str, Any]: uvec data containing the load data
+
+    """
+    state_arrays = uvec_data["state_arrays"]
+    history = state_arrays.get("u_history", np.empty((0, len(uvec_data["axle_numbers"]))))
+    state_arrays["u_history"] = np.vstack([history, uvec_data["u"][:, 1]])
+
+    return uvec_python(uvec_data)
+
+
+def uvec_python_contact_stiffness(uvec_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    uvec function with the python interface, which also returns the derivatives of the load with respect to the
+    contact displacement and velocity of the axles.
+
+    Args:
+        - uvec_data (Dict[str, Any]): uvec data, where "u", "theta" and "loads" contain one row per axle
+
+    Returns:
+        - Dict[str, Any]: uvec data containing the load data, the contact stiffness and the contact damping
+
+    """
+    uvec_data = uvec_python(uvec_data)
+
+    uvec_data["contact_stiffness"] = np.zeros((len(uvec_data["axle_numbers"]), 3))
+    uvec_data["contact_stiffness"][:, 1] = 1e5
+    uvec_data["contact_damping"] = np.zeros((len(uvec_data["axle_numbers"]), 3))
+    uvec_data["contact_damping"][:, 1] = 1e3
+
+    return uvec_data
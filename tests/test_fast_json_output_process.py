@@ -1,9 +1,20 @@
 import json
 from pathlib import Path
+from shutil import rmtree
+from typing import List
 
+import numpy as np
 import numpy.testing as npt
+import pytest
 import KratosMultiphysics
+import KratosMultiphysics.StructuralMechanicsApplication as KSM
+from KratosMultiphysics.json_output_process import JsonOutputProcess
 from KratosMultiphysics.StemApplication.fast_json_output_process import FastJsonOutputProcess
+from KratosMultiphysics.StemApplication.binary_output_utilities import (read_binary_output, get_binary_output_path,
+                                                                        convert_binary_output_to_json)
+from KratosMultiphysics.StemApplication.compressed_output_container import (get_chunked_output_path, read_chunk_index,
+                                                                            convert_compressed_output_to_json)
+from tests.utils import create_triangle_model_part
 
 
 def test_add_nodal_parameters_process_nodal_concentrated_element():
@@ -46,6 +57,8 @@ def test_add_nodal_parameters_process_nodal_concentrated_element():
     process.ExecuteInitialize()
     process.ExecuteBeforeSolutionLoop()
     process.ExecuteFinalizeSolutionStep()
+    # by default, the output file is written at the end of the stage
+    process.ExecuteFinalize()
 
     # Get the output from the JSON file
     with open("tests/test_data/test_fast_json_output.json", 'r') as f:
@@ -65,3 +78,519 @@ def test_add_nodal_parameters_process_nodal_concentrated_element():
         output_file_path.unlink()
 
 
+@pytest.mark.parametrize("flush_settings, expected_n_written_steps",
+                         [(', "flush_interval": 2', [0, 2, 2]), ("", [0, 0, 0])])
+def test_fast_json_output_process_flush_interval(flush_settings: str, expected_n_written_steps: List[int]):
+    """
+    This test checks that the FastJsonOutputProcess accumulates the results in memory and only writes the output file
+    every flush interval and at the end of the stage. By default, the output file is only written at the end of the
+    stage.
+    """
+
+    # initialize Kratos model
+    model = KratosMultiphysics.Model()
+
+    # initialize model part
+    json_output_model_part = model.CreateModelPart("json_model_part", 1)
+    json_output_model_part.AddNodalSolutionStepVariable(KratosMultiphysics.VELOCITY)
+
+    json_output_model_part.ProcessInfo.SetValue(KratosMultiphysics.TIME, 0.0)
+    json_output_model_part.ProcessInfo.SetValue(KratosMultiphysics.DELTA_TIME, 0.1)
+
+    node = json_output_model_part.CreateNewNode(1, 0.0, 0.0, 0.0)
+
+    output_file_name = "tests/test_data/test_fast_json_output_flush.json"
+    json_output_parameters = KratosMultiphysics.Parameters(f"""{{
+            "model_part_name": "json_model_part",
+            "output_file_name": "{output_file_name}",
+            "output_variables": ["VELOCITY"],
+            "gauss_points_output_variables": [],
+            "time_frequency": 1e-5{flush_settings}
+            }}""")
+
+    process = FastJsonOutputProcess(model, json_output_parameters)
+
+    process.ExecuteInitialize()
+    process.ExecuteBeforeSolutionLoop()
+
+    n_written_steps = []
+    for step in range(3):
+        json_output_model_part.ProcessInfo.SetValue(KratosMultiphysics.TIME, 0.1 * (step + 1))
+        node.SetSolutionStepValue(KratosMultiphysics.VELOCITY, [step, 2.0 * step, 3.0 * step])
+        process.ExecuteFinalizeSolutionStep()
+
+        with open(output_file_name, 'r') as f:
+            n_written_steps.append(len(json.load(f)["TIME"]))
+
+    process.ExecuteFinalize()
+
+    with open(output_file_name, 'r') as f:
+        data = json.load(f)
+
+    # with a flush interval of 2, the file is also written after the second step
+    assert n_written_steps == expected_n_written_steps
+    npt.assert_array_almost_equal(data["TIME"], [0.1, 0.2, 0.3])
+    npt.assert_array_almost_equal(data["NODE_1"]["VELOCITY_Y"], [0.0, 2.0, 4.0])
+
+    Path(output_file_name).unlink()
+
+
+@pytest.mark.parametrize("output_format, precision", [("npy", "float64"), ("npz", "float32")])
+def test_fast_json_output_process_binary_output(output_format: str, precision: str):
+    """
+    This test checks the binary output of the FastJsonOutputProcess and the conversion of the binary output back to
+    the json layout.
+
+    Args:
+        - output_format (str): binary output format
+        - precision (str): floating point precision of the binary output
+    """
+
+    # initialize Kratos model
+    model = KratosMultiphysics.Model()
+
+    # initialize model part
+    json_output_model_part = model.CreateModelPart("json_model_part", 1)
+    json_output_model_part.AddNodalSolutionStepVariable(KratosMultiphysics.VELOCITY)
+
+    json_output_model_part.ProcessInfo.SetValue(KratosMultiphysics.DELTA_TIME, 0.1)
+
+    nodes = [json_output_model_part.CreateNewNode(i + 1, float(i), 0.0, 0.0) for i in range(2)]
+
+    output_file_name = "tests/test_data/test_fast_binary_output.json"
+    json_output_parameters = KratosMultiphysics.Parameters(f"""{{
+            "model_part_name": "json_model_part",
+            "output_file_name": "{output_file_name}",
+            "output_variables": ["VELOCITY"],
+            "gauss_points_output_variables": [],
+            "time_frequency": 1e-5,
+            "output_format": "{output_format}",
+            "precision": "{precision}"
+            }}""")
+
+    process = FastJsonOutputProcess(model, json_output_parameters)
+
+    process.ExecuteInitialize()
+    process.ExecuteBeforeSolutionLoop()
+
+    for step in range(3):
+        json_output_model_part.ProcessInfo.SetValue(KratosMultiphysics.TIME, 0.1 * (step + 1))
+        for node in nodes:
+            node.SetSolutionStepValue(KratosMultiphysics.VELOCITY, [node.Id * step, 2.0, 3.0])
+        process.ExecuteFinalizeSolutionStep()
+
+    process.ExecuteFinalize()
+
+    # the json file is not written for binary output
+    assert not Path(output_file_name).exists()
+
+    binary_output_path = Path(output_file_name).with_suffix(".npz" if output_format == "npz" else "")
+    arrays = read_binary_output(binary_output_path)
+
+    assert arrays["NODE.VELOCITY_X"].dtype == np.dtype(precision)
+    assert arrays["NODE.KEYS"].tolist() == ["NODE_1", "NODE_2"]
+    npt.assert_array_almost_equal(arrays["TIME"], [0.1, 0.2, 0.3])
+    npt.assert_array_almost_equal(arrays["NODE.VELOCITY_X"], [[0.0, 1.0, 2.0], [0.0, 2.0, 4.0]])
+
+    # convert back to json
+    converted_file_name = "tests/test_data/test_fast_binary_output_converted.json"
+    convert_binary_output_to_json(binary_output_path, converted_file_name)
+
+    with open(converted_file_name, 'r') as f:
+        data = json.load(f)
+
+    npt.assert_array_almost_equal(data["NODE_2"]["VELOCITY_X"], [0.0, 2.0, 4.0])
+    npt.assert_array_almost_equal(data["NODE_1"]["VELOCITY_Z"], [3.0, 3.0, 3.0])
+
+    Path(converted_file_name).unlink()
+    if binary_output_path.is_dir():
+        rmtree(binary_output_path)
+    else:
+        binary_output_path.unlink()
+
+
+def test_fast_json_output_process_equal_to_json_output_process():
+    """
+    This test checks that the output plan of the FastJsonOutputProcess results in the same output as the
+    JsonOutputProcess, for nodal and gauss point variables.
+    """
+
+    results = []
+    for process_type, output_file_name in [(JsonOutputProcess, "tests/test_data/test_json_output_reference.json"),
+                                           (FastJsonOutputProcess, "tests/test_data/test_fast_json_output_plan.json")]:
+        model = KratosMultiphysics.Model()
+        model_part = create_triangle_model_part(model)
+
+        json_output_parameters = KratosMultiphysics.Parameters(f"""{{
+                "model_part_name": "json_model_part",
+                "output_file_name": "{output_file_name}",
+                "output_variables": ["DISPLACEMENT"],
+                "gauss_points_output_variables": ["GREEN_LAGRANGE_STRAIN_VECTOR", "VON_MISES_STRESS"],
+                "time_frequency": 1e-5
+                }}""")
+
+        process = process_type(model, json_output_parameters)
+        process.ExecuteInitialize()
+        process.ExecuteBeforeSolutionLoop()
+        for step in range(2):
+            model_part.ProcessInfo.SetValue(KratosMultiphysics.TIME, 0.1 * (step + 1))
+            process.ExecuteFinalizeSolutionStep()
+        process.ExecuteFinalize()
+
+        with open(output_file_name, 'r') as f:
+            results.append(json.load(f))
+        Path(output_file_name).unlink()
+
+    expected_data, calculated_data = results
+
+    assert expected_data.keys() == calculated_data.keys()
+    npt.assert_array_almost_equal(calculated_data["NODE_3"]["DISPLACEMENT_Y"],
+                                  expected_data["NODE_3"]["DISPLACEMENT_Y"])
+    npt.assert_array_almost_equal(calculated_data["ELEMENT_2"]["VON_MISES_STRESS"]["0"],
+                                  expected_data["ELEMENT_2"]["VON_MISES_STRESS"]["0"])
+    npt.assert_array_almost_equal(calculated_data["ELEMENT_1"]["GREEN_LAGRANGE_STRAIN_VECTOR"]["0"],
+                                  expected_data["ELEMENT_1"]["GREEN_LAGRANGE_STRAIN_VECTOR"]["0"])
+
+
+def test_fast_json_output_process_gauss_point_resultant():
+    """
+    This test checks the resultant of gauss point variables, which is the sum over all elements per integration point.
+    """
+
+    model = KratosMultiphysics.Model()
+    model_part = create_triangle_model_part(model)
+
+    output_file_name = "tests/test_data/test_fast_json_output_resultant.json"
+    json_output_parameters = KratosMultiphysics.Parameters(f"""{{
+            "model_part_name": "json_model_part",
+            "output_file_name": "{output_file_name}",
+            "output_variables": ["DISPLACEMENT"],
+            "gauss_points_output_variables": ["GREEN_LAGRANGE_STRAIN_VECTOR"],
+            "time_frequency": 1e-5,
+            "resultant_solution": true
+            }}""")
+
+    process = FastJsonOutputProcess(model, json_output_parameters)
+    process.ExecuteInitialize()
+    process.ExecuteBeforeSolutionLoop()
+    model_part.ProcessInfo.SetValue(KratosMultiphysics.TIME, 0.1)
+    process.ExecuteFinalizeSolutionStep()
+    process.ExecuteFinalize()
+
+    with open(output_file_name, 'r') as f:
+        data = json.load(f)
+    Path(output_file_name).unlink()
+
+    npt.assert_array_almost_equal(data["RESULTANT"]["DISPLACEMENT_X"], [0.01])
+    npt.assert_array_almost_equal(data["RESULTANT"]["GREEN_LAGRANGE_STRAIN_VECTOR"]["0"], [[0.01, 0.02, 0.03]])
+
+
+def test_fast_json_output_process_gauss_point_arrays():
+    """
+    This test checks that the gauss point values are stored as one array per variable with the shape
+    (n_elements, n_gauss_points, n_time, n_components) in the binary output.
+    """
+
+    model = KratosMultiphysics.Model()
+    model_part = create_triangle_model_part(model)
+
+    output_file_name = "tests/test_data/test_fast_json_output_gauss_point_arrays.json"
+    json_output_parameters = KratosMultiphysics.Parameters(f"""{{
+            "model_part_name": "json_model_part",
+            "output_file_name": "{output_file_name}",
+            "gauss_points_output_variables": ["GREEN_LAGRANGE_STRAIN_VECTOR"],
+            "time_frequency": 1e-5,
+            "output_format": "npz"
+            }}""")
+
+    process = FastJsonOutputProcess(model, json_output_parameters)
+    process.ExecuteInitialize()
+    process.ExecuteBeforeSolutionLoop()
+    for time in [0.1, 0.2, 0.3]:
+        model_part.ProcessInfo.SetValue(KratosMultiphysics.TIME, time)
+        process.ExecuteFinalizeSolutionStep()
+    process.ExecuteFinalize()
+
+    output_path = get_binary_output_path(output_file_name, "npz")
+    arrays = read_binary_output(output_path)
+    output_path.unlink()
+
+    npt.assert_array_equal(arrays["ELEMENT.KEYS"], ["ELEMENT_1", "ELEMENT_2"])
+    assert arrays["ELEMENT.GREEN_LAGRANGE_STRAIN_VECTOR"].shape == (2, 1, 3, 3)
+    npt.assert_array_almost_equal(arrays["ELEMENT.GREEN_LAGRANGE_STRAIN_VECTOR"][:, 0, 2],
+                                  [[0.0, 0.02, 0.01], [0.01, 0.0, 0.02]])
+
+
+@pytest.mark.parametrize("resultant_solution", [False, True])
+def test_fast_json_output_process_flagged_nodes(resultant_solution: bool):
+    """
+    This test checks the bulk gathering of nodal values, when only the nodes with a flag are written to the output,
+    for separate nodes and for the resultant.
+
+    Args:
+        - resultant_solution (bool): whether the resultant solution is written
+    """
+
+    model = KratosMultiphysics.Model()
+
+    json_output_model_part = model.CreateModelPart("json_model_part", 1)
+    json_output_model_part.AddNodalSolutionStepVariable(KratosMultiphysics.VELOCITY)
+    json_output_model_part.AddNodalSolutionStepVariable(KratosMultiphysics.PRESSURE)
+    json_output_model_part.ProcessInfo.SetValue(KratosMultiphysics.TIME, 0.1)
+    json_output_model_part.ProcessInfo.SetValue(KratosMultiphysics.DELTA_TIME, 0.1)
+
+    # only the odd nodes are active
+    for i in range(1, 6):
+        node = json_output_model_part.CreateNewNode(i, float(i), 0.0, 0.0)
+        node.SetSolutionStepValue(KratosMultiphysics.VELOCITY, [i, 2.0 * i, 0.0])
+        node.SetSolutionStepValue(KratosMultiphysics.PRESSURE, 10.0 * i)
+        node.Set(KratosMultiphysics.ACTIVE, i % 2 == 1)
+
+    output_file_name = "tests/test_data/test_fast_json_output_flagged.json"
+    json_output_parameters = KratosMultiphysics.Parameters(f"""{{
+            "model_part_name": "json_model_part",
+            "output_file_name": "{output_file_name}",
+            "output_variables": ["VELOCITY", "PRESSURE"],
+            "gauss_points_output_variables": [],
+            "check_for_flag": "ACTIVE",
+            "time_frequency": 1e-5,
+            "resultant_solution": {str(resultant_solution).lower()}
+            }}""")
+
+    process = FastJsonOutputProcess(model, json_output_parameters)
+    process.ExecuteInitialize()
+    process.ExecuteBeforeSolutionLoop()
+    process.ExecuteFinalizeSolutionStep()
+    process.ExecuteFinalize()
+
+    with open(output_file_name, 'r') as f:
+        data = json.load(f)
+    Path(output_file_name).unlink()
+
+    if resultant_solution:
+        assert list(data.keys()) == ["TIME", "RESULTANT"]
+        npt.assert_array_almost_equal(data["RESULTANT"]["VELOCITY_Y"], [18.0])
+        npt.assert_array_almost_equal(data["RESULTANT"]["PRESSURE"], [90.0])
+    else:
+        assert list(data.keys()) == ["TIME", "NODE_1", "NODE_3", "NODE_5"]
+        npt.assert_array_almost_equal(data["NODE_3"]["VELOCITY_X"], [3.0])
+        npt.assert_array_almost_equal(data["NODE_5"]["PRESSURE"], [50.0])
+
+
+def test_fast_json_output_process_asynchronous_writing():
+    """
+    This test checks that the output written by the background writer is equal to the accumulated output, also when
+    the values change after the snapshot is handed to the writer.
+    """
+
+    model = KratosMultiphysics.Model()
+    model_part = create_triangle_model_part(model)
+
+    output_file_name = "tests/test_data/test_fast_json_output_asynchronous.json"
+    json_output_parameters = KratosMultiphysics.Parameters(f"""{{
+            "model_part_name": "json_model_part",
+            "output_file_name": "{output_file_name}",
+            "output_variables": ["DISPLACEMENT"],
+            "gauss_points_output_variables": ["VON_MISES_STRESS"],
+            "time_frequency": 1e-5,
+            "asynchronous_writing": true,
+            "writer_queue_size": 1
+            }}""")
+
+    process = FastJsonOutputProcess(model, json_output_parameters)
+    process.ExecuteInitialize()
+    process.ExecuteBeforeSolutionLoop()
+    for step in range(5):
+        model_part.ProcessInfo.SetValue(KratosMultiphysics.TIME, 0.1 * (step + 1))
+        model_part.GetNode(3).SetSolutionStepValue(KratosMultiphysics.DISPLACEMENT, [0.0, 0.01 * step, 0.0])
+        process.ExecuteFinalizeSolutionStep()
+    process.ExecuteFinalize()
+
+    with open(output_file_name, 'r') as f:
+        data = json.load(f)
+    Path(output_file_name).unlink()
+
+    npt.assert_array_almost_equal(data["TIME"], [0.1, 0.2, 0.3, 0.4, 0.5])
+    npt.assert_array_almost_equal(data["NODE_3"]["DISPLACEMENT_Y"], [0.0, 0.01, 0.02, 0.03, 0.04])
+    assert len(data["ELEMENT_1"]["VON_MISES_STRESS"]["0"]) == 5
+
+
+@pytest.mark.parametrize("output_format", ["json", "npz"])
+def test_fast_json_output_process_step_frequency_and_decimation(output_format: str):
+    """
+    This test checks that the output is written based on the step index and that decimated variables are only written
+    every n-th output step, together with their output times.
+    """
+
+    model = KratosMultiphysics.Model()
+    model_part = model.CreateModelPart("json_model_part", 1)
+    model_part.AddNodalSolutionStepVariable(KratosMultiphysics.DISPLACEMENT)
+    model_part.AddNodalSolutionStepVariable(KratosMultiphysics.VELOCITY)
+    model_part.ProcessInfo.SetValue(KratosMultiphysics.DELTA_TIME, 0.1)
+    node = model_part.CreateNewNode(1, 0.0, 0.0, 0.0)
+
+    output_file_name = "tests/test_data/test_fast_json_output_decimation.json"
+    json_output_parameters = KratosMultiphysics.Parameters(f"""{{
+            "model_part_name": "json_model_part",
+            "output_file_name": "{output_file_name}",
+            "output_variables": ["DISPLACEMENT", "VELOCITY"],
+            "step_frequency": 2,
+            "decimation": {{"DISPLACEMENT": 2}},
+            "output_format": "{output_format}"
+            }}""")
+
+    process = FastJsonOutputProcess(model, json_output_parameters)
+    process.ExecuteInitialize()
+    process.ExecuteBeforeSolutionLoop()
+    for step in range(1, 9):
+        model_part.ProcessInfo.SetValue(KratosMultiphysics.STEP, step)
+        model_part.ProcessInfo.SetValue(KratosMultiphysics.TIME, 0.1 * step)
+        node.SetSolutionStepValue(KratosMultiphysics.DISPLACEMENT, [step, 0.0, 0.0])
+        node.SetSolutionStepValue(KratosMultiphysics.VELOCITY, [step, 0.0, 0.0])
+        process.ExecuteFinalizeSolutionStep()
+    process.ExecuteFinalize()
+
+    if output_format == "json":
+        with open(output_file_name, 'r') as f:
+            data = json.load(f)
+        Path(output_file_name).unlink()
+    else:
+        output_path = get_binary_output_path(output_file_name, output_format)
+        convert_binary_output_to_json(output_path, output_file_name)
+        with open(output_file_name, 'r') as f:
+            data = json.load(f)
+        output_path.unlink()
+        Path(output_file_name).unlink()
+
+    npt.assert_array_almost_equal(data["TIME"], [0.2, 0.4, 0.6, 0.8])
+    npt.assert_array_almost_equal(data["NODE_1"]["VELOCITY_X"], [2, 4, 6, 8])
+    npt.assert_array_almost_equal(data["NODE_1"]["DISPLACEMENT_X"], [2, 6])
+    npt.assert_array_almost_equal(data["VARIABLE_TIME"]["DISPLACEMENT_X"], [0.2, 0.6])
+    assert "VELOCITY_X" not in data["VARIABLE_TIME"]
+
+
+def test_fast_json_output_process_moving_load_trigger():
+    """
+    This test checks that the output is only written while a moving load is within the trigger distance of the output
+    nodes. The location of the moving load is given by the condition with a non-zero point load.
+    """
+
+    model = KratosMultiphysics.Model()
+    model_part = model.CreateModelPart("json_model_part", 1)
+    model_part.AddNodalSolutionStepVariable(KratosMultiphysics.DISPLACEMENT)
+    model_part.ProcessInfo.SetValue(KratosMultiphysics.DELTA_TIME, 0.1)
+    model_part.CreateNewNode(1, 5.0, 1.0, 0.0)
+
+    # a track of 10 line conditions along the x-axis
+    load_model_part = model.CreateModelPart("load_model_part")
+    properties = load_model_part.GetProperties()[1]
+    for node_id in range(11):
+        load_model_part.CreateNewNode(node_id + 100, float(node_id), 0.0, 0.0)
+    for condition_id in range(10):
+        load_model_part.CreateNewCondition("LineLoadCondition2D2N", condition_id + 1,
+                                           [condition_id + 100, condition_id + 101], properties)
+
+    output_file_name = "tests/test_data/test_fast_json_output_trigger.json"
+    json_output_parameters = KratosMultiphysics.Parameters(f"""{{
+            "model_part_name": "json_model_part",
+            "output_file_name": "{output_file_name}",
+            "output_variables": ["DISPLACEMENT"],
+            "step_frequency": 1,
+            "moving_load_trigger": {{
+                "model_part_names": ["load_model_part"],
+                "distance": 2.5
+            }}
+            }}""")
+
+    process = FastJsonOutputProcess(model, json_output_parameters)
+    process.ExecuteInitialize()
+    process.ExecuteBeforeSolutionLoop()
+
+    # the load moves one condition per step
+    for step, condition in enumerate(load_model_part.Conditions, start=1):
+        for other_condition in load_model_part.Conditions:
+            other_condition.SetValue(KSM.POINT_LOAD, [0.0, 0.0, 0.0])
+        condition.SetValue(KSM.POINT_LOAD, [0.0, -1.0, 0.0])
+
+        model_part.ProcessInfo.SetValue(KratosMultiphysics.STEP, step)
+        model_part.ProcessInfo.SetValue(KratosMultiphysics.TIME, float(step))
+        process.ExecuteFinalizeSolutionStep()
+    process.ExecuteFinalize()
+
+    with open(output_file_name, 'r') as f:
+        data = json.load(f)
+    Path(output_file_name).unlink()
+
+    # conditions 3 to 8 have a node within 2.5 of the output node at x = 5, y = 1
+    npt.assert_array_almost_equal(data["TIME"], [3.0, 4.0, 5.0, 6.0, 7.0, 8.0])
+    assert len(data["NODE_1"]["DISPLACEMENT_X"]) == 6
+
+
+@pytest.mark.parametrize("compression", ["zlib", "lzma"])
+def test_fast_json_output_process_chunked_output(compression: str):
+    """
+    This test checks that the chunked output contains one chunk per flush and that it is equal to the json output,
+    also for a time range and for decimated variables.
+    """
+
+    model = KratosMultiphysics.Model()
+    model_part = model.CreateModelPart("json_model_part", 1)
+    model_part.AddNodalSolutionStepVariable(KratosMultiphysics.DISPLACEMENT)
+    model_part.AddNodalSolutionStepVariable(KratosMultiphysics.VELOCITY)
+    model_part.ProcessInfo.SetValue(KratosMultiphysics.DELTA_TIME, 0.1)
+    nodes = [model_part.CreateNewNode(node_id, float(node_id), 0.0, 0.0) for node_id in range(1, 4)]
+
+    data = {}
+    for output_format in ["json", "chunked"]:
+        output_file_name = f"tests/test_data/test_fast_json_output_{output_format}.json"
+        json_output_parameters = KratosMultiphysics.Parameters(f"""{{
+                "model_part_name": "json_model_part",
+                "output_file_name": "{output_file_name}",
+                "output_variables": ["DISPLACEMENT", "VELOCITY"],
+                "step_frequency": 1,
+                "decimation": {{"VELOCITY": 3}},
+                "flush_interval": 4,
+                "output_format": "{output_format}",
+                "compression": "{compression}"
+                }}""")
+
+        process = FastJsonOutputProcess(model, json_output_parameters)
+        process.ExecuteInitialize()
+        process.ExecuteBeforeSolutionLoop()
+        for step in range(1, 11):
+            model_part.ProcessInfo.SetValue(KratosMultiphysics.STEP, step)
+            model_part.ProcessInfo.SetValue(KratosMultiphysics.TIME, 0.1 * step)
+            for node in nodes:
+                node.SetSolutionStepValue(KratosMultiphysics.DISPLACEMENT, [step * node.Id, 0.0, 0.0])
+                node.SetSolutionStepValue(KratosMultiphysics.VELOCITY, [0.0, step * node.Id, 0.0])
+            process.ExecuteFinalizeSolutionStep()
+        process.ExecuteFinalize()
+
+        if output_format == "chunked":
+            output_path = get_chunked_output_path(output_file_name)
+
+            # chunks of 4, 4 and 2 output steps
+            assert [entry.n_steps for entry in read_chunk_index(output_path)] == [4, 4, 2]
+
+            convert_compressed_output_to_json(output_path, output_file_name, 0.35, 0.75)
+            with open(output_file_name, 'r') as f:
+                data["range"] = json.load(f)
+            convert_compressed_output_to_json(output_path, output_file_name)
+            output_path.unlink()
+
+        with open(output_file_name, 'r') as f:
+            data[output_format] = json.load(f)
+        Path(output_file_name).unlink()
+
+    assert data["chunked"].keys() == data["json"].keys()
+    npt.assert_array_almost_equal(data["chunked"]["TIME"], data["json"]["TIME"])
+    npt.assert_array_almost_equal(data["chunked"]["VARIABLE_TIME"]["VELOCITY_Y"],
+                                  data["json"]["VARIABLE_TIME"]["VELOCITY_Y"])
+    for node_key in ["NODE_1", "NODE_2", "NODE_3"]:
+        for series_name in ["DISPLACEMENT_X", "VELOCITY_Y"]:
+            npt.assert_array_almost_equal(data["chunked"][node_key][series_name], data["json"][node_key][series_name])
+
+    npt.assert_array_almost_equal(data["range"]["TIME"], [0.4, 0.5, 0.6, 0.7])
+    npt.assert_array_almost_equal(data["range"]["NODE_2"]["DISPLACEMENT_X"], [8, 10, 12, 14])
+    npt.assert_array_almost_equal(data["range"]["VARIABLE_TIME"]["VELOCITY_Y"], [0.4, 0.7])
+    npt.assert_array_almost_equal(data["range"]["NODE_2"]["VELOCITY_Y"], [8, 14])
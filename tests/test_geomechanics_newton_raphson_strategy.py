@@ -0,0 +1,116 @@
+from typing import List
+
+import pytest
+import KratosMultiphysics
+
+from KratosMultiphysics.StemApplication.geomechanics_newton_raphson_strategy import solve_uvec_solution_step
+from KratosMultiphysics.StemApplication.uvec_controller import StemUvecController
+from tests.utils import create_axle_model_parts, create_uvec_settings
+
+
+class ScriptedKratosStrategy:
+    """
+    Strategy of which each Kratos solve returns the next scripted convergence result, without changing the model.
+
+    Attributes:
+        - results (List[bool]): the convergence result of each Kratos solve
+        - n_solves (int): number of Kratos solves
+    """
+
+    def __init__(self, results: List[bool]):
+        """
+        Constructor of the ScriptedKratosStrategy.
+
+        Args:
+            - results (List[bool]): the convergence result of each Kratos solve
+        """
+        self.results = results
+        self.n_solves = 0
+
+    def SolveSolutionStep(self) -> bool:
+        """
+        Returns the next scripted convergence result.
+
+        Returns:
+            - bool: True if the Kratos solve converged
+        """
+        self.n_solves += 1
+        return self.results[self.n_solves - 1]
+
+
+class ScriptedUvecStrategy(ScriptedKratosStrategy):
+    """
+    Strategy which couples a UVEC model to the scripted Kratos solves, with the solution step of the STEM strategies.
+
+    Attributes:
+        - model_part (KratosMultiphysics.ModelPart): the model part
+        - max_iters (int): the maximum number of non-linear iterations
+        - uvec_controller (StemUvecController): the UVEC controller
+        - uvec_data (Union[KratosMultiphysics.Parameters, Dict[str, Any]]): the UVEC data
+    """
+
+    def __init__(self, model_part: KratosMultiphysics.ModelPart, uvec_settings: KratosMultiphysics.Parameters,
+                 max_iters: int, results: List[bool]):
+        """
+        Constructor of the ScriptedUvecStrategy.
+
+        Args:
+            - model_part (KratosMultiphysics.ModelPart): the model part
+            - uvec_settings (KratosMultiphysics.Parameters): the UVEC settings
+            - max_iters (int): the maximum number of non-linear iterations
+            - results (List[bool]): the convergence result of each Kratos solve
+        """
+        super().__init__(results)
+        self.model_part = model_part
+        self.max_iters = max_iters
+        self.uvec_controller = StemUvecController(uvec_settings, model_part)
+        self.uvec_data = self.uvec_controller.create_uvec_data(uvec_settings["uvec_data"])
+
+    def SolveSolutionStep(self) -> bool:
+        return solve_uvec_solution_step(self)
+
+
+@pytest.mark.parametrize("results, expected_is_converged, expected_n_solves",
+                         [([False, True, True], True, 2), ([False, False, False], False, 3)])
+def test_solve_uvec_solution_step_cache_requires_kratos_convergence(results: List[bool], expected_is_converged: bool,
+                                                                     expected_n_solves: int):
+    """
+    This test checks that a cache hit of the UVEC result only finishes the solution step if Kratos converged in the
+    previous iteration. With unchanged axle displacements, Kratos keeps iterating until it converges, and the step is
+    not converged if Kratos does not converge within the maximum number of iterations.
+    """
+    model = KratosMultiphysics.Model()
+    model_part = create_axle_model_parts(model)
+
+    uvec_settings = create_uvec_settings("uvec_python", "python")
+    uvec_settings.AddBool("uvec_cache", True)
+    uvec_settings.AddDouble("uvec_cache_tolerance", 1e-6)
+    strategy = ScriptedUvecStrategy(model_part, uvec_settings, 3, results)
+
+    assert strategy.SolveSolutionStep() == expected_is_converged
+    assert strategy.n_solves == expected_n_solves
+    # the uvec model is only called in the first iteration, the axle displacements do not change
+    assert strategy.uvec_data["state"]["n_calls"] == 1
+
+
+def test_solve_uvec_solution_step_interface_convergence_in_one_iteration():
+    """
+    This test checks that, with the interface convergence criterion, a weakly coupled time step converges with a
+    single call of the UVEC model and a single Kratos solve, once loads are applied at the start of the time step.
+    """
+    model = KratosMultiphysics.Model()
+    model_part = create_axle_model_parts(model)
+
+    uvec_settings = create_uvec_settings("uvec_python", "python")
+    uvec_settings.AddValue("uvec_convergence_criterion", KratosMultiphysics.Parameters("""{"active": true}"""))
+    strategy = ScriptedUvecStrategy(model_part, uvec_settings, 3, [True, True, True])
+
+    # the first time step has no loads at the start, such that a second iteration is required
+    assert strategy.SolveSolutionStep()
+    assert strategy.n_solves == 2
+
+    model_part.ProcessInfo.SetValue(KratosMultiphysics.TIME, 0.2)
+    model_part.ProcessInfo.SetValue(KratosMultiphysics.STEP, 2)
+    assert strategy.SolveSolutionStep()
+    assert strategy.n_solves == 3
+    assert strategy.uvec_data["state"]["n_calls"] == 3
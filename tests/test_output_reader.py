@@ -0,0 +1,148 @@
+import json
+import shutil
+import zlib
+from pathlib import Path
+
+import numpy.testing as npt
+import pytest
+import KratosMultiphysics
+
+from KratosMultiphysics.StemApplication.fast_json_output_process import FastJsonOutputProcess, fast_read_selection
+from KratosMultiphysics.StemApplication.output_reader import StemOutputReader
+from KratosMultiphysics.StemApplication.binary_output_utilities import get_binary_output_path
+from KratosMultiphysics.StemApplication.compressed_output_container import get_chunked_output_path, read_chunk_index
+from tests.utils import create_triangle_model_part
+
+
+def write_output(output_format: str, output_file_name: str) -> Path:
+    """
+    Writes the output of a model part with two elements for 5 output steps with the FastJsonOutputProcess.
+
+    Args:
+        - output_format (str): format of the output
+        - output_file_name (str): name of the json output file
+
+    Returns:
+        - Path: path of the output
+    """
+    model = KratosMultiphysics.Model()
+    model_part = create_triangle_model_part(model)
+
+    json_output_parameters = KratosMultiphysics.Parameters(f"""{{
+            "model_part_name": "json_model_part",
+            "output_file_name": "{output_file_name}",
+            "output_variables": ["DISPLACEMENT"],
+            "gauss_points_output_variables": ["GREEN_LAGRANGE_STRAIN_VECTOR"],
+            "step_frequency": 1,
+            "flush_interval": 2,
+            "output_format": "{output_format}"
+            }}""")
+
+    process = FastJsonOutputProcess(model, json_output_parameters)
+    process.ExecuteInitialize()
+    process.ExecuteBeforeSolutionLoop()
+    for step in range(1, 6):
+        model_part.ProcessInfo.SetValue(KratosMultiphysics.STEP, step)
+        model_part.ProcessInfo.SetValue(KratosMultiphysics.TIME, 0.1 * step)
+        model_part.GetNode(3).SetSolutionStepValue(KratosMultiphysics.DISPLACEMENT, [0.01 * step, 0.0, 0.0])
+        process.ExecuteFinalizeSolutionStep()
+    process.ExecuteFinalize()
+
+    if output_format == "json":
+        return Path(output_file_name)
+    elif output_format == "chunked":
+        return get_chunked_output_path(output_file_name)
+    return get_binary_output_path(output_file_name, output_format)
+
+
+@pytest.mark.parametrize("output_format", ["json", "npy", "npz", "chunked"])
+def test_output_reader_selection(output_format: str):
+    """
+    This test checks that the reader returns only the requested entities, variables and time range, equal to the
+    values of the complete json output.
+    """
+    json_file_name = "tests/test_data/test_output_reader_reference.json"
+    write_output("json", json_file_name)
+    with open(json_file_name, 'r') as f:
+        reference = json.load(f)
+    Path(json_file_name).unlink()
+
+    output_path = write_output(output_format, f"tests/test_data/test_output_reader_{output_format}.json")
+
+    with StemOutputReader(output_path) as reader:
+        assert sorted(reader.keys) == ["ELEMENT_1", "ELEMENT_2", "NODE_1", "NODE_2", "NODE_3", "NODE_4"]
+        npt.assert_array_almost_equal(reader.time, reference["TIME"])
+
+        data = reader.read(node_ids=[3], element_ids=[2],
+                           variables=["DISPLACEMENT_X", "GREEN_LAGRANGE_STRAIN_VECTOR"], start_time=0.15,
+                           end_time=0.45)
+
+    assert set(data.keys()) == {"TIME", "NODE_3", "ELEMENT_2"}
+    assert list(data["NODE_3"].keys()) == ["DISPLACEMENT_X"]
+    npt.assert_array_almost_equal(data["TIME"], [0.2, 0.3, 0.4])
+    npt.assert_array_almost_equal(data["NODE_3"]["DISPLACEMENT_X"], reference["NODE_3"]["DISPLACEMENT_X"][1:4])
+    npt.assert_array_almost_equal(data["ELEMENT_2"]["GREEN_LAGRANGE_STRAIN_VECTOR"]["0"],
+                                  reference["ELEMENT_2"]["GREEN_LAGRANGE_STRAIN_VECTOR"]["0"][1:4])
+
+    with pytest.raises(ValueError, match=r"Entities: \['NODE_5'\] are not in output"):
+        fast_read_selection(output_path, node_ids=[5])
+
+    if output_path.is_dir():
+        shutil.rmtree(output_path)
+    else:
+        output_path.unlink()
+    Path(str(output_path) + ".index").unlink(missing_ok=True)
+
+
+def test_output_reader_json_index_file():
+    """
+    This test checks that the index of a json output is stored on first access, reused while the json file is not
+    modified and rebuilt after the json file is modified.
+    """
+    output_path = write_output("json", "tests/test_data/test_output_reader_index.json")
+    index_path = Path(str(output_path) + ".index")
+
+    data = fast_read_selection(output_path, node_ids=[3], variables=["DISPLACEMENT"])
+    assert index_path.is_file()
+    npt.assert_array_almost_equal(data["NODE_3"]["DISPLACEMENT_X"], [0.01, 0.02, 0.03, 0.04, 0.05])
+    npt.assert_array_almost_equal(data["NODE_3"]["DISPLACEMENT_Y"], [0.0, 0.0, 0.0, 0.0, 0.0])
+
+    # the reused index gives the same result
+    data = fast_read_selection(output_path, node_ids=[3], variables=["DISPLACEMENT"], end_time=0.2)
+    npt.assert_array_almost_equal(data["NODE_3"]["DISPLACEMENT_X"], [0.01, 0.02])
+
+    # a modified json file with a different layout requires a new index
+    with open(output_path, 'r') as f:
+        modified_data = json.load(f)
+    with open(output_path, 'w') as f:
+        json.dump(modified_data, f)
+
+    data = fast_read_selection(output_path, node_ids=[3], variables=["DISPLACEMENT_X"], start_time=0.45)
+    npt.assert_array_almost_equal(data["NODE_3"]["DISPLACEMENT_X"], [0.05])
+
+    output_path.unlink()
+    index_path.unlink()
+
+
+def test_output_reader_chunked_time_without_decompression():
+    """
+    This test checks that the output times of a chunked container with multiple chunks are read without
+    decompressing any chunk, by overwriting the compressed chunks after writing.
+    """
+    output_path = write_output("chunked", "tests/test_data/test_output_reader_chunked_time.json")
+    chunk_index = read_chunk_index(output_path)
+    assert [entry.n_steps for entry in chunk_index] == [2, 2, 1]
+
+    with open(output_path, "r+b") as container:
+        for entry in chunk_index:
+            container.seek(entry.offset)
+            container.write(bytes(entry.size))
+
+    with StemOutputReader(output_path) as reader:
+        npt.assert_array_almost_equal(reader.time, [0.1, 0.2, 0.3, 0.4, 0.5])
+
+        # the chunks themselves can no longer be decompressed
+        with pytest.raises(zlib.error):
+            reader.read(node_ids=[3])
+
+    output_path.unlink()
@@ -0,0 +1,123 @@
+import json
+from pathlib import Path
+
+import numpy.testing as npt
+import pytest
+import KratosMultiphysics
+
+from KratosMultiphysics.StemApplication.fast_json_output_process import FastJsonOutputProcess
+from KratosMultiphysics.StemApplication.probe_output_process import ProbeOutputProcess
+from KratosMultiphysics.StemApplication.binary_output_utilities import get_binary_output_path, read_binary_output
+from tests.utils import create_triangle_model_part
+
+
+@pytest.mark.parametrize("output_format", ["json", "npz"])
+def test_probe_output_process(output_format: str):
+    """
+    This test checks that the nodal solution is interpolated to probes inside the elements and at the nodes.
+    """
+    model = KratosMultiphysics.Model()
+    model_part = create_triangle_model_part(model)
+
+    output_file_name = "tests/test_data/test_probe_output.json"
+    parameters = KratosMultiphysics.Parameters(f"""{{
+            "model_part_name": "json_model_part",
+            "output_file_name": "{output_file_name}",
+            "output_variables": ["DISPLACEMENT"],
+            "probe_coordinates": [[0.5, 0.25, 0.0], [1.0, 1.0, 0.0], [0.25, 0.5, 0.0]],
+            "step_frequency": 1,
+            "output_format": "{output_format}"
+            }}""")
+
+    process = ProbeOutputProcess(model, parameters)
+    process.ExecuteBeforeSolutionLoop()
+    for step in [1, 2]:
+        model_part.ProcessInfo.SetValue(KratosMultiphysics.STEP, step)
+        model_part.ProcessInfo.SetValue(KratosMultiphysics.TIME, 0.1 * step)
+        model_part.GetNode(3).SetSolutionStepValue(KratosMultiphysics.DISPLACEMENT, [0.01 * step, 0.02 * step, 0.0])
+        process.ExecuteFinalizeSolutionStep()
+    process.ExecuteFinalize()
+
+    if output_format == "json":
+        with open(output_file_name, 'r') as f:
+            data = json.load(f)
+        Path(output_file_name).unlink()
+
+        npt.assert_array_almost_equal(data["TIME"], [0.1, 0.2])
+        # the first probe has a weight of 0.25 for node 3, the second probe is located at node 3
+        npt.assert_array_almost_equal(data["PROBE_1"]["DISPLACEMENT_X"], [0.0025, 0.005])
+        npt.assert_array_almost_equal(data["PROBE_1"]["DISPLACEMENT_Y"], [0.005, 0.01])
+        npt.assert_array_almost_equal(data["PROBE_2"]["DISPLACEMENT_X"], [0.01, 0.02])
+        npt.assert_array_almost_equal(data["PROBE_3"]["DISPLACEMENT_Y"], [0.005, 0.01])
+    else:
+        output_path = get_binary_output_path(output_file_name, output_format)
+        arrays = read_binary_output(output_path)
+        output_path.unlink()
+
+        npt.assert_array_equal(arrays["PROBE.KEYS"], ["PROBE_1", "PROBE_2", "PROBE_3"])
+        npt.assert_array_almost_equal(arrays["PROBE.DISPLACEMENT_X"], [[0.0025, 0.005], [0.01, 0.02],
+                                                                       [0.0025, 0.005]])
+
+
+def test_probe_output_process_time_frequency():
+    """
+    This test checks that the probe output process and the fast json output process share the "time_frequency"
+    setting, and write the output at the same times.
+    """
+    model = KratosMultiphysics.Model()
+    model_part = create_triangle_model_part(model)
+
+    probe_file_name = "tests/test_data/test_probe_output_time_frequency.json"
+    json_file_name = "tests/test_data/test_fast_json_output_time_frequency.json"
+    probe_process = ProbeOutputProcess(model, KratosMultiphysics.Parameters(f"""{{
+            "model_part_name": "json_model_part",
+            "output_file_name": "{probe_file_name}",
+            "output_variables": ["DISPLACEMENT"],
+            "probe_coordinates": [[1.0, 1.0, 0.0]],
+            "time_frequency": 0.15
+            }}"""))
+    json_process = FastJsonOutputProcess(model, KratosMultiphysics.Parameters(f"""{{
+            "model_part_name": "json_model_part",
+            "output_file_name": "{json_file_name}",
+            "output_variables": ["DISPLACEMENT"],
+            "time_frequency": 0.15
+            }}"""))
+
+    probe_process.ExecuteBeforeSolutionLoop()
+    json_process.ExecuteInitialize()
+    json_process.ExecuteBeforeSolutionLoop()
+    for step in range(1, 7):
+        model_part.ProcessInfo.SetValue(KratosMultiphysics.STEP, step)
+        model_part.ProcessInfo.SetValue(KratosMultiphysics.TIME, 0.1 * step)
+        probe_process.ExecuteFinalizeSolutionStep()
+        json_process.ExecuteFinalizeSolutionStep()
+    probe_process.ExecuteFinalize()
+    json_process.ExecuteFinalize()
+
+    output_times = []
+    for file_name in [probe_file_name, json_file_name]:
+        with open(file_name, 'r') as f:
+            output_times.append(json.load(f)["TIME"])
+        Path(file_name).unlink()
+
+    npt.assert_array_almost_equal(output_times[0], [0.2, 0.4, 0.6])
+    npt.assert_array_almost_equal(output_times[0], output_times[1])
+
+
+def test_probe_output_process_probe_outside_mesh():
+    """
+    This test checks that an error is raised for a probe which is not located within an element.
+    """
+    model = KratosMultiphysics.Model()
+    create_triangle_model_part(model)
+
+    parameters = KratosMultiphysics.Parameters("""{
+            "model_part_name": "json_model_part",
+            "output_file_name": "tests/test_data/test_probe_output_outside.json",
+            "output_variables": ["DISPLACEMENT"],
+            "probe_coordinates": [[0.5, 0.5, 0.0], [2.0, 2.0, 0.0]]
+            }""")
+
+    process = ProbeOutputProcess(model, parameters)
+    with pytest.raises(ValueError, match=r"Probes at coordinates: \[\[2.0, 2.0, 0.0\]\] are not located"):
+        process.ExecuteBeforeSolutionLoop()
@@ -0,0 +1,136 @@
+import numpy as np
+import numpy.testing as npt
+import pytest
+import KratosMultiphysics
+import KratosMultiphysics.StructuralMechanicsApplication as KSM
+
+from KratosMultiphysics.StemApplication.uvec_axle_predictor import UvecAxlePredictor, create_axle_predictor
+from KratosMultiphysics.StemApplication.uvec_controller import StemUvecController
+from tests.utils import create_axle_model_parts, create_uvec_settings
+
+
+@pytest.mark.parametrize("order", [1, 2])
+def test_axle_predictor_polynomial(order: int):
+    """
+    This test checks that the axle predictor extrapolates a polynomial of its order exactly, also with a varying time
+    step, and that the order is reduced as long as fewer time steps are stored.
+    """
+    predictor = UvecAxlePredictor(order)
+    assert predictor.predict(0.1) is None
+
+    def polynomial(time: float) -> np.ndarray:
+        return np.array([[0.0, 1.0 + 2.0 * time + (order - 1) * 3.0 * time ** 2, 0.0]])
+
+    times = [0.1, 0.15, 0.3, 0.35]
+    predictor.add_step(times[0], polynomial(times[0]), -polynomial(times[0]))
+
+    # with a single time step, the values of that time step are predicted
+    u, loads = predictor.predict(times[1])
+    npt.assert_array_almost_equal(u, polynomial(times[0]))
+    npt.assert_array_almost_equal(loads, -polynomial(times[0]))
+
+    for time in times[1:-1]:
+        predictor.add_step(time, polynomial(time), -polynomial(time))
+
+    u, loads = predictor.predict(times[-1])
+    npt.assert_array_almost_equal(u, polynomial(times[-1]))
+    npt.assert_array_almost_equal(loads, -polynomial(times[-1]))
+
+
+def test_axle_predictor_replaces_same_time():
+    """
+    This test checks that a time step which is stored twice replaces the values of the first time.
+    """
+    predictor = UvecAxlePredictor(1)
+    predictor.add_step(0.1, [[0.0, 1.0, 0.0]], [[0.0, 1.0, 0.0]])
+    predictor.add_step(0.2, [[0.0, 5.0, 0.0]], [[0.0, 5.0, 0.0]])
+    predictor.add_step(0.2, [[0.0, 2.0, 0.0]], [[0.0, 2.0, 0.0]])
+
+    u, _ = predictor.predict(0.3)
+    npt.assert_array_almost_equal(u, [[0.0, 3.0, 0.0]])
+
+
+def test_create_axle_predictor():
+    """
+    This test checks the creation of the axle predictor from the settings.
+    """
+    assert create_axle_predictor(KratosMultiphysics.Parameters("""{}""")) is None
+    assert create_axle_predictor(KratosMultiphysics.Parameters("""{"type": "quadratic"}""")).order == 2
+
+    with pytest.raises(ValueError, match="UVEC axle predictor: cubic is not supported"):
+        create_axle_predictor(KratosMultiphysics.Parameters("""{"type": "cubic"}"""))
+
+
+@pytest.mark.parametrize("uvec_method, uvec_interface", [("uvec_json", "json"), ("uvec_python", "python")])
+def test_uvec_controller_linear_predictor(uvec_method: str, uvec_interface: str):
+    """
+    This test checks that, with a linear predictor, the first UVEC call of a time step receives the displacements
+    extrapolated from the previous time steps, and that the loads of the first UVEC call are applied.
+    """
+    model = KratosMultiphysics.Model()
+    model_part = create_axle_model_parts(model, n_axles=1)
+    loaded_condition = model_part.GetSubModelPart("moving_load_cloned_1").GetCondition(2)
+
+    uvec_settings = create_uvec_settings(uvec_method, uvec_interface)
+    uvec_settings.AddValue("uvec_predictor", KratosMultiphysics.Parameters("""{"type": "linear"}"""))
+    controller = StemUvecController(uvec_settings, model_part)
+    uvec_data = controller.create_uvec_data(uvec_settings["uvec_data"])
+
+    first_call_u = []
+    for step in range(1, 4):
+        model_part.ProcessInfo.SetValue(KratosMultiphysics.STEP, step)
+        model_part.ProcessInfo.SetValue(KratosMultiphysics.TIME, 0.1 * step)
+        controller.initialise_solution_step(uvec_data)
+
+        controller.update_uvec_from_kratos(uvec_data)
+        u = uvec_data["u"][0] if uvec_interface == "python" else uvec_data["u"]["1"].GetVector()
+        first_call_u.append(u[1])
+        uvec_data = controller.execute_uvec_update_kratos(uvec_data)
+
+        # the displacement of the converged time step increases linearly in time
+        loaded_condition.SetValue(KratosMultiphysics.DISPLACEMENT, [0.0, -0.001 * step, 0.0])
+
+    # the first step uses the initial displacement, the second step the displacement of the first step, and the third
+    # step the linear extrapolation of the first two steps
+    npt.assert_array_almost_equal(first_call_u, [-0.001, -0.001, -0.003])
+
+    # the loads of the third step follow from the extrapolated displacement
+    npt.assert_array_almost_equal(controller.applied_loads, [[0.0, -1300.0, 0.0]])
+
+
+def test_uvec_controller_predicted_loads_with_acceleration():
+    """
+    This test checks that the predicted loads are the starting point of the coupling acceleration, such that they
+    reach the loads of the first Kratos solve of a time step, and that they are not set on the conditions before the
+    first UVEC call.
+    """
+    model = KratosMultiphysics.Model()
+    model_part = create_axle_model_parts(model, n_axles=1)
+    loaded_condition = model_part.GetSubModelPart("moving_load_cloned_1").GetCondition(2)
+
+    uvec_settings = create_uvec_settings("uvec_python", "python")
+    uvec_settings.AddValue("uvec_predictor", KratosMultiphysics.Parameters("""{"type": "linear"}"""))
+    uvec_settings.AddValue("uvec_acceleration", KratosMultiphysics.Parameters("""{"type": "aitken"}"""))
+    controller = StemUvecController(uvec_settings, model_part)
+    uvec_data = controller.create_uvec_data(uvec_settings["uvec_data"])
+
+    initial_loads, first_solve_loads = [], []
+    for step in range(1, 4):
+        model_part.ProcessInfo.SetValue(KratosMultiphysics.STEP, step)
+        model_part.ProcessInfo.SetValue(KratosMultiphysics.TIME, 0.1 * step)
+        controller.initialise_solution_step(uvec_data)
+        initial_loads.append(loaded_condition.GetValue(KSM.POINT_LOAD)[1])
+
+        controller.update_uvec_from_kratos(uvec_data)
+        uvec_data = controller.execute_uvec_update_kratos(uvec_data)
+        first_solve_loads.append(loaded_condition.GetValue(KSM.POINT_LOAD)[1])
+
+        # the displacement of the converged time step
+        loaded_condition.SetValue(KratosMultiphysics.DISPLACEMENT, [0.0, -0.002 * step, 0.0])
+
+    # the conditions keep the loads of the previous time step until the first UVEC call
+    npt.assert_array_almost_equal(initial_loads, [-1.0, -1100.0, -1150.0])
+
+    # the third step predicts a displacement of -0.006 and a load of -1200, the load of the first UVEC call is
+    # -1600, which is relaxed from the predicted load with the initial relaxation factor of 0.5
+    npt.assert_array_almost_equal(first_solve_loads, [-1100.0, -1150.0, -1400.0])
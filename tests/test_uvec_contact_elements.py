@@ -0,0 +1,251 @@
+from typing import Tuple
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+import KratosMultiphysics
+import KratosMultiphysics.StructuralMechanicsApplication as KSM
+
+from KratosMultiphysics.StemApplication.uvec_contact_elements import UvecContactElements, create_contact_elements
+from KratosMultiphysics.StemApplication.uvec_controller import StemUvecController
+from tests.utils import create_axle_model_parts, create_uvec_settings
+
+
+def create_contact_model_part(model: KratosMultiphysics.Model) -> KratosMultiphysics.ModelPart:
+    """
+    Creates a 2D model part with a single axle, in which the nodes have displacement and velocity variables and the
+    moving load is located at a quarter of the second condition.
+
+    Args:
+        - model (KratosMultiphysics.Model): the Kratos model
+
+    Returns:
+        - KratosMultiphysics.ModelPart: the model part
+    """
+    model_part = model.CreateModelPart("porous_computational_model_part")
+    model_part.AddNodalSolutionStepVariable(KratosMultiphysics.DISPLACEMENT)
+    model_part.AddNodalSolutionStepVariable(KratosMultiphysics.VELOCITY)
+    model_part.ProcessInfo.SetValue(KratosMultiphysics.DOMAIN_SIZE, 2)
+    model_part.ProcessInfo.SetValue(KratosMultiphysics.DELTA_TIME, 0.1)
+    model_part.ProcessInfo.SetValue(KratosMultiphysics.TIME, 0.1)
+    model_part.ProcessInfo.SetValue(KratosMultiphysics.STEP, 1)
+
+    create_axle_model_parts(model, n_axles=1)
+    for condition in model_part.GetSubModelPart("moving_load_cloned_1").Conditions:
+        condition.SetValue(KSM.MOVING_LOAD_LOCAL_DISTANCE, 0.25)
+    for node in model_part.Nodes:
+        node.SetSolutionStepValue(KratosMultiphysics.VELOCITY, [0.0, -0.01, 0.0])
+
+    return model_part
+
+
+def get_nodal_contact_values(model_part: KratosMultiphysics.ModelPart, variable) -> list:
+    """
+    Gets the vertical contact stiffness or damping of the contact element, or the vertical point load of the contact
+    condition, of each node.
+
+    Args:
+        - model_part (KratosMultiphysics.ModelPart): the model part of the contact elements
+        - variable: NODAL_DISPLACEMENT_STIFFNESS or NODAL_DAMPING_RATIO of the elements, or POINT_LOAD of the
+          conditions
+
+    Returns:
+        - list: the vertical value per node, in the order of the node ids
+    """
+    entities = model_part.Conditions if variable == KSM.POINT_LOAD else model_part.Elements
+    return [entity.GetValue(variable)[1] for entity in sorted(entities, key=lambda entity: entity.GetGeometry()[0].Id)]
+
+
+def solve_track(model_part: KratosMultiphysics.ModelPart, ground_stiffness: float,
+                contact_model_part: KratosMultiphysics.ModelPart = None) -> float:
+    """
+    Solves the vertical displacements of the nodes of the axle, which are supported by ground springs and loaded by
+    the moving load, distributed with the shape functions at the location of the moving load. The local systems of
+    the contact elements and conditions are assembled if a contact model part is given. The displacement of the
+    moving load condition is updated with the interpolated nodal displacements.
+
+    Args:
+        - model_part (KratosMultiphysics.ModelPart): the model part with the axle
+        - ground_stiffness (float): the stiffness of the ground spring of each node
+        - contact_model_part (KratosMultiphysics.ModelPart): the model part of the contact elements and conditions
+
+    Returns:
+        - float: the maximum absolute change of the nodal displacements
+    """
+    node_ids = [node.Id for node in model_part.Nodes]
+    row = {node_id: index for index, node_id in enumerate(node_ids)}
+    u = np.array([model_part.GetNode(node_id).GetSolutionStepValue(KratosMultiphysics.DISPLACEMENT_Y)
+                  for node_id in node_ids])
+
+    lhs = ground_stiffness * np.eye(len(node_ids))
+    rhs = -ground_stiffness * u
+
+    loaded_condition = [condition for condition in model_part.GetSubModelPart("moving_load_cloned_1").Conditions
+                        if condition.GetValue(KSM.POINT_LOAD)[1] != 0][0]
+    weights = UvecContactElements.get_shape_function_weights(loaded_condition)
+    for node_id, weight in weights.items():
+        rhs[row[node_id]] += weight * loaded_condition.GetValue(KSM.POINT_LOAD)[1]
+
+    if contact_model_part is not None:
+        process_info = model_part.ProcessInfo
+        for entity in list(contact_model_part.Elements) + list(contact_model_part.Conditions):
+            local_lhs, local_rhs = KratosMultiphysics.Matrix(), KratosMultiphysics.Vector()
+            entity.CalculateLocalSystem(local_lhs, local_rhs, process_info)
+            index = row[entity.GetGeometry()[0].Id]
+            if local_lhs.Size1() > 0:
+                lhs[index, index] += local_lhs[1, 1]
+            rhs[index] += local_rhs[1]
+
+    du = np.linalg.solve(lhs, rhs)
+    for node_id, u_node in zip(node_ids, u + du):
+        model_part.GetNode(node_id).SetSolutionStepValue(KratosMultiphysics.DISPLACEMENT, [0.0, u_node, 0.0])
+    loaded_condition.SetValue(KratosMultiphysics.DISPLACEMENT,
+                              [0.0, sum(weight * (u + du)[row[node_id]] for node_id, weight in weights.items()), 0.0])
+
+    return float(np.max(np.abs(du)))
+
+
+def solve_coupled_step(is_implicit: bool) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    Solves a time step of the coupling between the uvec model and the track on ground springs, until the nodal
+    displacements do not change.
+
+    Args:
+        - is_implicit (bool): whether the contact stiffness of the uvec model is added to the system
+
+    Returns:
+        - Tuple[np.ndarray, np.ndarray, int]: the nodal displacements, the applied loads and the number of iterations
+    """
+    model = KratosMultiphysics.Model()
+    model_part = create_contact_model_part(model)
+
+    uvec_settings = create_uvec_settings("uvec_python_contact_stiffness", "python")
+    uvec_settings.AddValue("uvec_implicit_coupling",
+                           KratosMultiphysics.Parameters(f"""{{"active": {str(is_implicit).lower()}}}"""))
+    controller = StemUvecController(uvec_settings, model_part)
+    uvec_data = controller.create_uvec_data(uvec_settings["uvec_data"])
+    contact_model_part = model_part.GetSubModelPart("moving_load_contact") if is_implicit else None
+
+    controller.initialise_solution_step(uvec_data)
+    for iteration in range(1, 100):
+        controller.update_uvec_from_kratos(uvec_data)
+        uvec_data = controller.execute_uvec_update_kratos(uvec_data)
+        if solve_track(model_part, 1e6, contact_model_part) < 1e-15:
+            break
+
+    u = np.array([node.GetSolutionStepValue(KratosMultiphysics.DISPLACEMENT_Y) for node in model_part.Nodes])
+    return u, controller.applied_loads, iteration
+
+
+def test_uvec_controller_implicit_coupling():
+    """
+    This test checks that the contact stiffness and damping of the uvec model are lumped to the nodes of the active
+    condition, that the loads on the condition are corrected for the linearised part, and that the contact moves with
+    the moving load.
+    """
+    model = KratosMultiphysics.Model()
+    model_part = create_contact_model_part(model)
+    axle = model_part.GetSubModelPart("moving_load_cloned_1")
+
+    uvec_settings = create_uvec_settings("uvec_python_contact_stiffness", "python")
+    uvec_settings.AddValue("uvec_implicit_coupling",
+                           KratosMultiphysics.Parameters("""{"active": true, "use_damping": true}"""))
+    controller = StemUvecController(uvec_settings, model_part)
+    assert controller.is_implicit_coupling
+
+    contact_model_part = model_part.GetSubModelPart("moving_load_contact")
+    assert contact_model_part.NumberOfElements() == 5
+
+    uvec_data = controller.create_uvec_data(uvec_settings["uvec_data"])
+    controller.initialise_solution_step(uvec_data)
+    controller.update_uvec_from_kratos(uvec_data)
+    uvec_data = controller.execute_uvec_update_kratos(uvec_data)
+
+    # the stiffness and damping are lumped to the nodes of the second condition, with the opposite sign
+    npt.assert_array_almost_equal(get_nodal_contact_values(contact_model_part, KSM.NODAL_DISPLACEMENT_STIFFNESS),
+                                  [0.0, -0.75e5, -0.25e5, 0.0, 0.0])
+    npt.assert_array_almost_equal(get_nodal_contact_values(contact_model_part, KSM.NODAL_DAMPING_RATIO),
+                                  [0.0, -750.0, -250.0, 0.0, 0.0])
+
+    # the uvec load is applied unchanged, the contact conditions cancel the contact forces at the current nodal
+    # displacements and velocities
+    npt.assert_array_almost_equal(controller.applied_loads, [[0.0, -1100.0, 0.0]])
+    npt.assert_array_almost_equal(list(axle.GetCondition(2).GetValue(KSM.POINT_LOAD)), [0.0, -1100.0, 0.0])
+    npt.assert_array_almost_equal(get_nodal_contact_values(contact_model_part, KSM.POINT_LOAD),
+                                  [0.0, 7.5, 2.5, 0.0, 0.0])
+
+    # the moving load moves to the third condition, the contact of the second condition is removed
+    for index, condition in enumerate(axle.Conditions):
+        condition.SetValue(KSM.POINT_LOAD, [0.0, -1.0 if index == 2 else 0.0, 0.0])
+        condition.SetValue(KratosMultiphysics.DISPLACEMENT, [0.0, -0.001 if index == 2 else 0.0, 0.0])
+
+    controller.initialise_solution_step(uvec_data)
+    controller.update_uvec_from_kratos(uvec_data)
+    controller.execute_uvec_update_kratos(uvec_data)
+
+    npt.assert_array_almost_equal(get_nodal_contact_values(contact_model_part, KSM.NODAL_DISPLACEMENT_STIFFNESS),
+                                  [0.0, 0.0, -0.75e5, -0.25e5, 0.0])
+
+
+def test_implicit_coupling_converges_to_explicit_coupling():
+    """
+    This test checks that the implicit coupling converges to the same displacements and loads as the explicit
+    coupling, in fewer iterations.
+    """
+    explicit_u, explicit_loads, explicit_iterations = solve_coupled_step(False)
+    implicit_u, implicit_loads, implicit_iterations = solve_coupled_step(True)
+
+    npt.assert_allclose(implicit_u, explicit_u, rtol=1e-10, atol=1e-16)
+    npt.assert_allclose(implicit_loads, explicit_loads, rtol=1e-10)
+    assert implicit_iterations < explicit_iterations
+
+
+def test_contact_elements_between_stages():
+    """
+    This test checks that the contact elements and conditions are removed from the model at the end of a stage, such
+    that the controller of the next stage, with the same model, creates new contact elements.
+    """
+    model = KratosMultiphysics.Model()
+    model_part = create_contact_model_part(model)
+    n_conditions = model_part.NumberOfConditions()
+
+    uvec_settings = create_uvec_settings("uvec_python_contact_stiffness", "python")
+    uvec_settings.AddValue("uvec_implicit_coupling", KratosMultiphysics.Parameters("""{"active": true}"""))
+
+    for _ in range(2):
+        controller = StemUvecController(uvec_settings, model_part)
+        uvec_data = controller.create_uvec_data(uvec_settings["uvec_data"])
+        controller.initialise_solution_step(uvec_data)
+        controller.update_uvec_from_kratos(uvec_data)
+        controller.execute_uvec_update_kratos(uvec_data)
+
+        assert model_part.NumberOfElements() == 5
+        assert model_part.NumberOfConditions() == n_conditions + 5
+        controller.finalise()
+
+        assert not model_part.HasSubModelPart("moving_load_contact")
+        assert model_part.NumberOfElements() == 0
+        assert model_part.NumberOfConditions() == n_conditions
+
+
+def test_create_contact_elements():
+    """
+    This test checks that no contact elements are created if the coupling is not implicit, and that the contact
+    elements are nodal spring elements without damping if the damping is not used.
+    """
+    model = KratosMultiphysics.Model()
+    model_part = create_contact_model_part(model)
+    axle_model_parts = [model_part.GetSubModelPart("moving_load_cloned_1")]
+
+    assert create_contact_elements(KratosMultiphysics.Parameters("""{}"""), model_part, axle_model_parts,
+                                   "contact") is None
+
+    contact_elements = create_contact_elements(KratosMultiphysics.Parameters("""{"active": true}"""), model_part,
+                                               axle_model_parts, "contact")
+    assert not contact_elements.use_damping
+    assert all(not element.Has(KSM.NODAL_DAMPING_RATIO) for element in contact_elements.model_part.Elements)
+
+    model_part.ProcessInfo.SetValue(KratosMultiphysics.DOMAIN_SIZE, 1)
+    with pytest.raises(ValueError, match="require a domain size of 2 or 3"):
+        create_contact_elements(KratosMultiphysics.Parameters("""{"active": true}"""), model_part,
+                                axle_model_parts, "contact_1d")
@@ -0,0 +1,300 @@
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+import numpy.testing as npt
+import KratosMultiphysics
+import KratosMultiphysics.StructuralMechanicsApplication as KSM
+
+from KratosMultiphysics.StemApplication.uvec_controller import (StemUvecController, StemMultipleUvecController,
+                                                                create_uvec_controller)
+from tests.utils import create_axle_model_parts, create_uvec_settings
+
+NATIVE_UVEC_SOURCE = "tests/test_data/input_data_uvec_controller/sample_uvec.c"
+
+
+@pytest.mark.parametrize("uvec_method, uvec_interface", [("uvec_json", "json"), ("uvec_python", "python")])
+def test_uvec_controller_interfaces(uvec_method: str, uvec_interface: str):
+    """
+    This test checks that the json and the python interface of the uvec controller give the same loads on the
+    conditions and keep the state of the uvec model.
+    """
+    model = KratosMultiphysics.Model()
+    model_part = create_axle_model_parts(model)
+
+    uvec_settings = create_uvec_settings(uvec_method, uvec_interface)
+    controller = StemUvecController(uvec_settings, model_part)
+    uvec_data = controller.create_uvec_data(uvec_settings["uvec_data"])
+
+    for _ in range(2):
+        controller.initialise_solution_step(uvec_data)
+        controller.update_uvec_from_kratos(uvec_data)
+        uvec_data = controller.execute_uvec_update_kratos(uvec_data)
+
+    if uvec_interface == "python":
+        assert uvec_data["dt"] == pytest.approx(0.1)
+        assert uvec_data["time_index"] == 0
+        # the rows are ordered as the axle numbers
+        npt.assert_array_almost_equal(uvec_data["u"], [[0.0, -0.001 * int(axle_number), 0.0]
+                                                       for axle_number in uvec_data["axle_numbers"]])
+        assert uvec_data["state"]["n_calls"] == 2
+    else:
+        assert uvec_data["state"]["n_calls"].GetInt() == 2
+
+    # the load is only transferred to the loaded condition of each axle
+    for axle_number, expected_load in [(1, -1100.0), (2, -2200.0)]:
+        axle = model_part.GetSubModelPart(f"moving_load_cloned_{axle_number}")
+        loads = [list(condition.GetValue(KSM.POINT_LOAD)) for condition in axle.Conditions]
+        npt.assert_array_almost_equal(loads, [[0, 0, 0], [0, expected_load, 0], [0, 0, 0], [0, 0, 0]])
+
+
+def test_uvec_controller_invalid_interface():
+    """
+    This test checks that an error is raised for an unknown uvec interface.
+    """
+    model = KratosMultiphysics.Model()
+    model_part = create_axle_model_parts(model)
+
+    with pytest.raises(ValueError, match="UVEC interface: binary is not supported"):
+        StemUvecController(create_uvec_settings("uvec_json", "binary"), model_part)
+
+
+@pytest.mark.skipif(shutil.which("gcc") is None, reason="a C compiler is required to build the native uvec model")
+def test_uvec_controller_native_interface():
+    """
+    This test checks that a uvec model in a shared library is initialised with the uvec parameters and transfers the
+    loads to the conditions.
+    """
+    library_path = Path("tests/test_data/sample_uvec.so")
+    subprocess.run(["gcc", "-shared", "-fPIC", "-O2", "-o", str(library_path), NATIVE_UVEC_SOURCE], check=True)
+
+    model = KratosMultiphysics.Model()
+    model_part = create_axle_model_parts(model)
+
+    uvec_settings = create_uvec_settings("uvec_native", "native", str(library_path))
+    uvec_settings["uvec_data"]["parameters"].AddDouble("reference_load", -500.0)
+    controller = StemUvecController(uvec_settings, model_part)
+    uvec_data = controller.create_uvec_data(uvec_settings["uvec_data"])
+
+    for _ in range(2):
+        controller.initialise_solution_step(uvec_data)
+        controller.update_uvec_from_kratos(uvec_data)
+        uvec_data = controller.execute_uvec_update_kratos(uvec_data)
+
+    npt.assert_array_almost_equal(uvec_data["loads"], [[0.0, -500.0 - 100.0 * int(axle_number), 0.0]
+                                                       for axle_number in uvec_data["axle_numbers"]])
+
+    for axle_number, expected_load in [(1, -600.0), (2, -700.0)]:
+        axle = model_part.GetSubModelPart(f"moving_load_cloned_{axle_number}")
+        loads = [list(condition.GetValue(KSM.POINT_LOAD)) for condition in axle.Conditions]
+        npt.assert_array_almost_equal(loads, [[0, 0, 0], [0, expected_load, 0], [0, 0, 0], [0, 0, 0]])
+
+    # the stage is finalised without a worker
+    controller.finalise()
+
+    # a function which is not exported by the library
+    with pytest.raises(ValueError, match="Function: uvec_missing is not exported"):
+        StemUvecController(create_uvec_settings("uvec_missing", "native", str(library_path)), model_part)
+
+    library_path.unlink()
+
+
+def test_uvec_controller_active_condition_tracking():
+    """
+    This test checks that the controller follows the moving load of each axle to a neighbouring condition and to a
+    distant condition, and exchanges the axle data with the active condition only.
+    """
+    model = KratosMultiphysics.Model()
+    model_part = create_axle_model_parts(model, n_conditions=10)
+
+    uvec_settings = create_uvec_settings("uvec_python", "python")
+    controller = StemUvecController(uvec_settings, model_part)
+    uvec_data = controller.create_uvec_data(uvec_settings["uvec_data"])
+
+    # the moving load moves to the neighbouring condition and then jumps to the last condition
+    for new_index in [2, 9]:
+        for axle_number in range(1, 3):
+            axle = model_part.GetSubModelPart(f"moving_load_cloned_{axle_number}")
+            for index, condition in enumerate(axle.Conditions):
+                is_active = index == new_index
+                condition.SetValue(KSM.POINT_LOAD, [0.0, -1.0 if is_active else 0.0, 0.0])
+                condition.SetValue(KratosMultiphysics.DISPLACEMENT,
+                                   [0.0, -0.001 * axle_number * new_index if is_active else 0.0, 0.0])
+
+        controller.initialise_solution_step(uvec_data)
+        controller.update_uvec_from_kratos(uvec_data)
+        uvec_data = controller.execute_uvec_update_kratos(uvec_data)
+
+        npt.assert_array_almost_equal(uvec_data["u"], [[0.0, -0.001 * int(axle_number) * new_index, 0.0]
+                                                       for axle_number in uvec_data["axle_numbers"]])
+
+        for axle_number in range(1, 3):
+            axle = model_part.GetSubModelPart(f"moving_load_cloned_{axle_number}")
+            expected_loads = [[0.0, 0.0, 0.0] for _ in range(10)]
+            expected_loads[new_index][1] = -1000.0 * axle_number * (1 + 0.1 * new_index)
+            npt.assert_array_almost_equal([list(condition.GetValue(KSM.POINT_LOAD)) for condition in axle.Conditions],
+                                          expected_loads)
+
+
+@pytest.mark.parametrize("uvec_method, uvec_interface", [("uvec_json", "json"), ("uvec_python", "python")])
+def test_uvec_controller_cache(uvec_method: str, uvec_interface: str):
+    """
+    This test checks that the uvec model is only called within a time step if the axle displacements changed more
+    than the cache tolerance, and that the cache is cleared at a new time step.
+    """
+    model = KratosMultiphysics.Model()
+    model_part = create_axle_model_parts(model)
+
+    uvec_settings = create_uvec_settings(uvec_method, uvec_interface)
+    uvec_settings.AddBool("uvec_cache", True)
+    uvec_settings.AddDouble("uvec_cache_tolerance", 1e-6)
+    controller = StemUvecController(uvec_settings, model_part)
+    uvec_data = controller.create_uvec_data(uvec_settings["uvec_data"])
+    loaded_condition = model_part.GetSubModelPart("moving_load_cloned_1").GetCondition(2)
+
+    is_converged = []
+    controller.initialise_solution_step(uvec_data)
+    # first call, a change within the tolerance, and a change larger than the tolerance
+    for displacement in [-0.001, -0.001 + 1e-7, -0.002]:
+        loaded_condition.SetValue(KratosMultiphysics.DISPLACEMENT, [0.0, displacement, 0.0])
+        controller.update_uvec_from_kratos(uvec_data)
+        uvec_data = controller.execute_uvec_update_kratos(uvec_data)
+        is_converged.append(controller.is_coupling_converged)
+
+    # a new time step with unchanged displacements calls the uvec model again
+    controller.initialise_solution_step(uvec_data)
+    controller.update_uvec_from_kratos(uvec_data)
+    uvec_data = controller.execute_uvec_update_kratos(uvec_data)
+    is_converged.append(controller.is_coupling_converged)
+
+    assert is_converged == [False, True, False, False]
+    n_calls = uvec_data["state"]["n_calls"]
+    assert (n_calls if uvec_interface == "python" else n_calls.GetInt()) == 3
+    npt.assert_array_almost_equal(loaded_condition.GetValue(KSM.POINT_LOAD), [0.0, -1200.0, 0.0])
+
+
+def test_uvec_controller_invalid_cache_tolerance():
+    """
+    This test checks that an error is raised for a negative cache tolerance.
+    """
+    model = KratosMultiphysics.Model()
+    model_part = create_axle_model_parts(model)
+
+    uvec_settings = create_uvec_settings("uvec_json", "json")
+    uvec_settings.AddDouble("uvec_cache_tolerance", -1.0)
+    with pytest.raises(ValueError, match="The UVEC cache tolerance should be positive or zero"):
+        StemUvecController(uvec_settings, model_part)
+
+
+def test_uvec_controller_multiple_uvec_models():
+    """
+    This test checks that multiple uvec models, each with its own moving load model part, interface and state, are
+    coupled concurrently and only load the conditions of their own axles.
+    """
+    model = KratosMultiphysics.Model()
+    create_axle_model_parts(model, uvec_model_part="train_1")
+    model_part = create_axle_model_parts(model, n_axles=1, uvec_model_part="train_2")
+
+    uvec_settings = KratosMultiphysics.Parameters("[]")
+    uvec_settings.Append(create_uvec_settings("uvec_json", "json", uvec_model_part="train_1"))
+    uvec_settings.Append(create_uvec_settings("uvec_python", "python", uvec_model_part="train_2"))
+
+    controller, uvec_data = create_uvec_controller(uvec_settings, model_part)
+    assert isinstance(controller, StemMultipleUvecController)
+
+    controller.recorder.start_step(1, 0.1)
+    for _ in range(3):
+        controller.initialise_solution_step(uvec_data)
+        controller.update_uvec_from_kratos(uvec_data)
+        uvec_data = controller.execute_uvec_update_kratos(uvec_data)
+    controller.finalise()
+
+    assert uvec_data[0]["state"]["n_calls"].GetInt() == 3
+    assert uvec_data[1]["state"]["n_calls"] == 3
+    assert controller.recorder.as_arrays()["UVEC_CALLS"][0] == 6
+
+    for axle_name, expected_load in [("train_1_cloned_1", -1100.0), ("train_1_cloned_2", -2200.0),
+                                     ("train_2_cloned_1", -1100.0)]:
+        axle = model_part.GetSubModelPart(axle_name)
+        loads = [list(condition.GetValue(KSM.POINT_LOAD)) for condition in axle.Conditions]
+        npt.assert_array_almost_equal(loads, [[0, 0, 0], [0, expected_load, 0], [0, 0, 0], [0, 0, 0]])
+
+    # uvec models cannot share a moving load model part
+    uvec_settings = KratosMultiphysics.Parameters("[]")
+    uvec_settings.Append(create_uvec_settings("uvec_json", "json", uvec_model_part="train_1"))
+    uvec_settings.Append(create_uvec_settings("uvec_python", "python", uvec_model_part="train_1"))
+    with pytest.raises(ValueError, match="Each UVEC model should have its own uvec model part"):
+        create_uvec_controller(uvec_settings, model_part)
+
+
+def test_uvec_controller_state_store_between_stages():
+    """
+    This test checks that the state arrays of a uvec model are saved in binary at the end of a stage and restored in
+    the next stage.
+    """
+    state_file = Path("uvec_state_moving_load.npz")
+
+    u_history = []
+    for stage in range(2):
+        model = KratosMultiphysics.Model()
+        model_part = create_axle_model_parts(model)
+
+        uvec_settings = create_uvec_settings("uvec_python_state_arrays", "python")
+        uvec_settings.AddBool("uvec_serialize_state", True)
+        controller = StemUvecController(uvec_settings, model_part)
+        uvec_data = controller.create_uvec_data(uvec_settings["uvec_data"])
+
+        for _ in range(2):
+            controller.initialise_solution_step(uvec_data)
+            controller.update_uvec_from_kratos(uvec_data)
+            uvec_data = controller.execute_uvec_update_kratos(uvec_data)
+            u_history.append([-0.001 * int(axle_number) for axle_number in uvec_data["axle_numbers"]])
+
+        controller.finalise()
+        assert state_file.is_file()
+
+        # the state arrays are kept outside the json state
+        assert "u_history" not in uvec_data["state"]
+        npt.assert_array_almost_equal(controller.state_store["u_history"], u_history)
+
+    state_file.unlink()
+
+
+def test_uvec_controller_worker_interface():
+    """
+    This test checks that a uvec model in a worker process gives the same loads as the python interface, keeps its
+    state in the worker and returns the state when the worker is stopped.
+    """
+    model = KratosMultiphysics.Model()
+    model_part = create_axle_model_parts(model)
+
+    uvec_settings = create_uvec_settings("uvec_python", "worker")
+    controller = StemUvecController(uvec_settings, model_part)
+    uvec_data = controller.create_uvec_data(uvec_settings["uvec_data"])
+
+    for _ in range(2):
+        controller.initialise_solution_step(uvec_data)
+        controller.update_uvec_from_kratos(uvec_data)
+        uvec_data = controller.execute_uvec_update_kratos(uvec_data)
+
+    npt.assert_array_almost_equal(uvec_data["loads"], [[0.0, -1100.0 * int(axle_number), 0.0]
+                                                       for axle_number in uvec_data["axle_numbers"]])
+    for axle_number, expected_load in [(1, -1100.0), (2, -2200.0)]:
+        axle = model_part.GetSubModelPart(f"moving_load_cloned_{axle_number}")
+        loads = [list(condition.GetValue(KSM.POINT_LOAD)) for condition in axle.Conditions]
+        npt.assert_array_almost_equal(loads, [[0, 0, 0], [0, expected_load, 0], [0, 0, 0], [0, 0, 0]])
+
+    assert "n_calls" not in uvec_data["state"]
+    controller.finalise()
+    assert uvec_data["state"]["n_calls"] == 2
+
+    # an error in the uvec model is raised in the controller
+    uvec_settings = create_uvec_settings("uvec_json", "worker")
+    controller = StemUvecController(uvec_settings, model_part)
+    uvec_data = controller.create_uvec_data(uvec_settings["uvec_data"])
+    controller.initialise_solution_step(uvec_data)
+    controller.update_uvec_from_kratos(uvec_data)
+    with pytest.raises(RuntimeError, match="UVEC function: uvec_json .* failed in the worker: TypeError"):
+        controller.execute_uvec_update_kratos(uvec_data)
+    controller.finalise()
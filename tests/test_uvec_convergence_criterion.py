@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+import KratosMultiphysics
+
+from KratosMultiphysics.StemApplication.uvec_controller import StemUvecController
+from KratosMultiphysics.StemApplication.uvec_convergence_criterion import (UvecInterfaceConvergenceCriterion,
+                                                                          create_interface_convergence_criterion)
+from tests.utils import create_axle_model_parts, create_uvec_settings
+
+
+def test_interface_convergence_criterion():
+    """
+    This test checks that the interface is converged if, for each axle, the change of the load and of the
+    displacement is within the absolute or the relative tolerance.
+    """
+    criterion = UvecInterfaceConvergenceCriterion(1e-3, 1e-6, 1e-3, 1e-9)
+    u = np.array([[0.0, -0.001, 0.0], [0.0, -0.002, 0.0]])
+    loads = np.array([[0.0, -1000.0, 0.0], [0.0, 0.0, 0.0]])
+
+    # the first call of a time step without loads at the start of the time step is not converged
+    criterion.initialise_solution_step()
+    assert not criterion.is_converged(u, loads)
+
+    # a relative load change of 1e-4 on the first axle is converged, the unloaded second axle is unchanged
+    assert criterion.is_converged(u, loads + [[0.0, 0.1, 0.0], [0.0, 0.0, 0.0]])
+
+    # a load change of 10 on the first axle is not converged
+    assert not criterion.is_converged(u, loads + [[0.0, 10.0, 0.0], [0.0, 0.0, 0.0]])
+
+    # a displacement change on the second axle is not converged
+    assert not criterion.is_converged(u + [[0.0, 0.0, 0.0], [0.0, 1e-5, 0.0]], loads + [[0.0, 10.0, 0.0],
+                                                                                        [0.0, 0.0, 0.0]])
+
+    # a new time step starts without previous values
+    criterion.initialise_solution_step()
+    assert not criterion.is_converged(u, loads)
+
+    # the first call of a time step is converged if it equals the values at the start of the time step
+    criterion.initialise_solution_step(u, loads)
+    assert criterion.is_converged(u, loads + [[0.0, 0.1, 0.0], [0.0, 0.0, 0.0]])
+    criterion.initialise_solution_step(u, loads)
+    assert not criterion.is_converged(u, loads + [[0.0, 10.0, 0.0], [0.0, 0.0, 0.0]])
+
+    assert create_interface_convergence_criterion(KratosMultiphysics.Parameters("""{"active": false}""")) is None
+
+
+@pytest.mark.parametrize("uvec_method, uvec_interface", [("uvec_json", "json"), ("uvec_python", "python")])
+def test_uvec_controller_interface_convergence(uvec_method: str, uvec_interface: str):
+    """
+    This test checks that the uvec controller reports interface convergence once the displacements and loads of the
+    axles do not change, and that the interface is always converged without an interface criterion.
+    """
+    model = KratosMultiphysics.Model()
+    model_part = create_axle_model_parts(model)
+    loaded_condition = model_part.GetSubModelPart("moving_load_cloned_1").GetCondition(2)
+
+    uvec_settings = create_uvec_settings(uvec_method, uvec_interface)
+    controller = StemUvecController(uvec_settings, model_part)
+    assert controller.is_interface_converged
+
+    uvec_settings.AddValue("uvec_convergence_criterion", KratosMultiphysics.Parameters("""{"active": true}"""))
+    controller = StemUvecController(uvec_settings, model_part)
+    uvec_data = controller.create_uvec_data(uvec_settings["uvec_data"])
+
+    is_converged = []
+    controller.initialise_solution_step(uvec_data)
+    for displacement in [-0.001, -0.002, -0.002]:
+        loaded_condition.SetValue(KratosMultiphysics.DISPLACEMENT, [0.0, displacement, 0.0])
+        controller.update_uvec_from_kratos(uvec_data)
+        uvec_data = controller.execute_uvec_update_kratos(uvec_data)
+        is_converged.append(controller.is_interface_converged)
+
+    assert is_converged == [False, False, True]
+
+    controller.initialise_solution_step(uvec_data)
+    assert not controller.is_interface_converged
+
+
+@pytest.mark.parametrize("uvec_method, uvec_interface", [("uvec_json", "json"), ("uvec_python", "python")])
+def test_uvec_controller_interface_convergence_first_call(uvec_method: str, uvec_interface: str):
+    """
+    This test checks that the first call of a time step is compared with the loads applied at the end of the
+    previous time step, such that a weakly coupled time step converges with a single call of the uvec model, and that
+    a changed load in the first call is not converged.
+    """
+    model = KratosMultiphysics.Model()
+    model_part = create_axle_model_parts(model)
+    loaded_condition = model_part.GetSubModelPart("moving_load_cloned_1").GetCondition(2)
+
+    uvec_settings = create_uvec_settings(uvec_method, uvec_interface)
+    uvec_settings.AddValue("uvec_convergence_criterion", KratosMultiphysics.Parameters("""{"active": true}"""))
+    controller = StemUvecController(uvec_settings, model_part)
+    uvec_data = controller.create_uvec_data(uvec_settings["uvec_data"])
+
+    is_converged = []
+    for displacement in [-0.001, -0.001, -0.002]:
+        controller.initialise_solution_step(uvec_data)
+        loaded_condition.SetValue(KratosMultiphysics.DISPLACEMENT, [0.0, displacement, 0.0])
+        controller.update_uvec_from_kratos(uvec_data)
+        uvec_data = controller.execute_uvec_update_kratos(uvec_data)
+        is_converged.append(controller.is_interface_converged)
+
+    # the first time step has no loads at the start, the load of the third time step changes with the displacement
+    assert is_converged == [False, True, False]
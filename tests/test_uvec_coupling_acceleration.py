@@ -0,0 +1,156 @@
+import numpy as np
+import numpy.testing as npt
+import pytest
+import KratosMultiphysics
+import KratosMultiphysics.StructuralMechanicsApplication as KSM
+
+from KratosMultiphysics.StemApplication.uvec_controller import StemUvecController
+from KratosMultiphysics.StemApplication.uvec_coupling_acceleration import (AitkenRelaxation, IqnIlsAccelerator,
+                                                                          create_coupling_accelerator)
+from tests.utils import create_axle_model_parts, create_uvec_settings
+
+
+def solve_fixed_point(accelerator, n_iterations: int, stiffness: np.ndarray = np.diag([1.5, 1.5, 1.5, 1.2, 1.2, 1.2]),
+                      initialise: bool = True) -> np.ndarray:
+    """
+    Solves the linear fixed point problem of two axles L = a - B L, in which the plain fixed point iteration diverges,
+    as the spectral radius of B is larger than 1.
+
+    Args:
+        - accelerator: the coupling accelerator
+        - n_iterations (int): number of iterations
+        - stiffness (np.ndarray): the matrix B, shape (6, 6)
+        - initialise (bool): whether a new time step is started
+
+    Returns:
+        - np.ndarray: the applied loads after the iterations, shape (2, 3)
+    """
+    a = np.array([[0.0, -1000.0, 0.0], [0.0, -2000.0, 0.0]])
+
+    applied_loads = np.zeros((2, 3))
+    if initialise:
+        accelerator.initialise_solution_step()
+    for _ in range(n_iterations):
+        computed_loads = a - (stiffness @ applied_loads.ravel()).reshape(2, 3)
+        applied_loads = accelerator.update(applied_loads, computed_loads)
+    return applied_loads
+
+
+def test_aitken_relaxation_converges():
+    """
+    This test checks that the Aitken relaxation converges to the fixed point of a problem for which the plain fixed
+    point iteration diverges, and that the factor is reset at a new time step.
+    """
+    expected_loads = np.array([[0.0, -1000.0 / 2.5, 0.0], [0.0, -2000.0 / 2.2, 0.0]])
+
+    accelerator = AitkenRelaxation(0.3, 1.0)
+    npt.assert_array_almost_equal(solve_fixed_point(accelerator, 30), expected_loads, decimal=6)
+    assert accelerator.factor != 0.3
+
+    accelerator.initialise_solution_step()
+    assert accelerator.factor == 0.3
+
+    with pytest.raises(ValueError, match="The initial relaxation factor should be larger than 0"):
+        AitkenRelaxation(1.5, 1.0)
+
+
+def test_iqn_ils_accelerator_converges():
+    """
+    This test checks that the IQN-ILS accelerator converges for a strongly coupled problem with coupled axles within
+    a few iterations, and that the differences of a previous time step are reused, such that the following time step
+    converges in the first update.
+    """
+    a = np.array([0.0, -1000.0, 0.0, 0.0, -2000.0, 0.0])
+    stiffness = np.full((6, 6), 0.5) + np.diag([3.0, 3.0, 3.0, 2.0, 2.0, 2.0])
+    expected_loads = np.linalg.solve(np.eye(6) + stiffness, a).reshape(2, 3)
+
+    # the differences of the iterations span the interface space within 8 iterations
+    accelerator = IqnIlsAccelerator(0.1, 1, 1e-10)
+    npt.assert_array_almost_equal(solve_fixed_point(accelerator, 8, stiffness), expected_loads, decimal=6)
+
+    # the same problem in the next time step is solved with the reused differences
+    accelerator.initialise_solution_step()
+    npt.assert_array_almost_equal(solve_fixed_point(accelerator, 1, stiffness, initialise=False), expected_loads,
+                                  decimal=6)
+
+    # without reuse, the next time step starts again with a relaxation
+    accelerator = IqnIlsAccelerator(0.1, 0, 1e-10)
+    solve_fixed_point(accelerator, 8, stiffness)
+    accelerator.initialise_solution_step()
+    npt.assert_array_almost_equal(solve_fixed_point(accelerator, 1, stiffness, initialise=False),
+                                  0.1 * a.reshape(2, 3))
+
+
+@pytest.mark.parametrize("accelerator_type", [AitkenRelaxation, IqnIlsAccelerator])
+def test_coupling_accelerator_reused_load_buffer(accelerator_type: type):
+    """
+    This test checks that the accelerated loads do not depend on whether the computed loads are passed as new arrays,
+    or as a single buffer which is overwritten by each UVEC call, as with the native interface.
+    """
+    a = np.array([[0.0, -1000.0, 0.0], [0.0, -2000.0, 0.0]])
+    stiffness = np.full((6, 6), 0.5) + np.diag([3.0, 3.0, 3.0, 2.0, 2.0, 2.0])
+    arguments = (0.1, 1.0) if accelerator_type is AitkenRelaxation else (0.1, 0, 1e-10)
+
+    accelerator = accelerator_type(*arguments)
+    buffer_accelerator = accelerator_type(*arguments)
+    accelerator.initialise_solution_step()
+    buffer_accelerator.initialise_solution_step()
+
+    applied_loads = np.zeros((2, 3))
+    buffer_applied_loads = np.zeros((2, 3))
+    load_buffer = np.zeros((2, 3))
+    for _ in range(4):
+        applied_loads = accelerator.update(applied_loads, a - (stiffness @ applied_loads.ravel()).reshape(2, 3))
+
+        load_buffer[:] = a - (stiffness @ buffer_applied_loads.ravel()).reshape(2, 3)
+        buffer_applied_loads = buffer_accelerator.update(buffer_applied_loads, load_buffer)
+
+        npt.assert_array_almost_equal(buffer_applied_loads, applied_loads)
+
+
+def test_coupling_accelerator_settings():
+    """
+    This test checks the creation of the coupling accelerator from the settings.
+    """
+    assert create_coupling_accelerator(KratosMultiphysics.Parameters("""{"type": "none"}""")) is None
+
+    accelerator = create_coupling_accelerator(KratosMultiphysics.Parameters("""{"type": "aitken",
+                                                                               "initial_relaxation": 0.25}"""))
+    assert isinstance(accelerator, AitkenRelaxation)
+    assert accelerator.initial_factor == 0.25
+
+    accelerator = create_coupling_accelerator(KratosMultiphysics.Parameters("""{"type": "iqn_ils",
+                                                                               "reused_time_steps": 2}"""))
+    assert isinstance(accelerator, IqnIlsAccelerator)
+    assert accelerator.reused_time_steps == 2
+
+    with pytest.raises(ValueError, match="UVEC coupling acceleration: secant is not supported"):
+        create_coupling_accelerator(KratosMultiphysics.Parameters("""{"type": "secant"}"""))
+
+
+def test_uvec_controller_relaxed_loads():
+    """
+    This test checks that the uvec controller applies the relaxed loads to the conditions, where the loads of the
+    first call are applied without relaxation.
+    """
+    model = KratosMultiphysics.Model()
+    model_part = create_axle_model_parts(model)
+    uvec_settings = create_uvec_settings("uvec_python", "python")
+    uvec_settings.AddValue("uvec_acceleration", KratosMultiphysics.Parameters("""{"type": "aitken",
+                                                                                 "initial_relaxation": 0.5}"""))
+    controller = StemUvecController(uvec_settings, model_part)
+    uvec_data = controller.create_uvec_data(uvec_settings["uvec_data"])
+    loaded_condition = model_part.GetSubModelPart("moving_load_cloned_1").GetCondition(2)
+
+    vertical_loads = []
+    controller.initialise_solution_step(uvec_data)
+    for displacement in [-0.001, -0.003]:
+        loaded_condition.SetValue(KratosMultiphysics.DISPLACEMENT, [0.0, displacement, 0.0])
+        controller.update_uvec_from_kratos(uvec_data)
+        uvec_data = controller.execute_uvec_update_kratos(uvec_data)
+        vertical_loads.append(loaded_condition.GetValue(KSM.POINT_LOAD)[1])
+
+    # the second load is halfway between the first load, -1100, and the computed load, -1300
+    npt.assert_array_almost_equal(vertical_loads, [-1100.0, -1200.0])
+    # the uvec data contains the computed loads
+    assert uvec_data["loads"][uvec_data["axle_numbers"].index("1")][1] == pytest.approx(-1300.0)
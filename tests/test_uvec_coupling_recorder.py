@@ -0,0 +1,67 @@
+from pathlib import Path
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+import KratosMultiphysics
+
+from KratosMultiphysics.StemApplication.uvec_controller import StemUvecController
+from KratosMultiphysics.StemApplication.uvec_coupling_recorder import UvecCouplingRecorder
+from tests.utils import create_axle_model_parts, create_uvec_settings
+
+
+@pytest.mark.parametrize("output_file_name", ["tests/test_data/test_uvec_timing.csv",
+                                              "tests/test_data/test_uvec_timing.npz"])
+def test_uvec_coupling_recorder_export(output_file_name: str):
+    """
+    This test checks that the iterations and the calls of each coupling phase are recorded per time step, including
+    the (de)serialisation of the json interface, and exported to csv and npz.
+    """
+    model = KratosMultiphysics.Model()
+    model_part = create_axle_model_parts(model)
+
+    uvec_settings = create_uvec_settings("uvec_json", "json")
+    uvec_settings.AddString("uvec_timing_output", output_file_name)
+    controller = StemUvecController(uvec_settings, model_part)
+    uvec_data = controller.create_uvec_data(uvec_settings["uvec_data"])
+    recorder = controller.recorder
+
+    # calls before the first step are not recorded
+    with recorder.record("KRATOS_SOLVE"):
+        pass
+
+    for step, n_iterations in [(1, 2), (2, 3)]:
+        recorder.start_step(step, 0.1 * step)
+        controller.initialise_solution_step(uvec_data)
+        for _ in range(n_iterations):
+            recorder.add_iteration()
+            controller.update_uvec_from_kratos(uvec_data)
+            uvec_data = controller.execute_uvec_update_kratos(uvec_data)
+            with recorder.record("KRATOS_SOLVE"):
+                pass
+
+    recorder.export()
+
+    if output_file_name.endswith(".npz"):
+        with np.load(output_file_name) as npz_data:
+            data = {key: npz_data[key] for key in npz_data.files}
+    else:
+        data = np.genfromtxt(output_file_name, delimiter=",", names=True)
+
+    npt.assert_array_equal(data["STEP"], [1, 2])
+    npt.assert_array_almost_equal(data["TIME"], [0.1, 0.2])
+    npt.assert_array_equal(data["ITERATIONS"], [2, 3])
+    npt.assert_array_equal(data["UVEC_CALLS"], [2, 3])
+    npt.assert_array_equal(data["SERIALISATION_CALLS"], [4, 6])
+    npt.assert_array_equal(data["KRATOS_SOLVE_CALLS"], [2, 3])
+    assert np.all(data["UVEC_TIME"] > 0)
+
+    Path(output_file_name).unlink()
+
+
+def test_uvec_coupling_recorder_invalid_output():
+    """
+    This test checks that an error is raised for an unsupported output file extension.
+    """
+    with pytest.raises(ValueError, match="should have one of the extensions"):
+        UvecCouplingRecorder("timing.json")
@@ -0,0 +1,76 @@
+from pathlib import Path
+
+import numpy.testing as npt
+import pytest
+import KratosMultiphysics
+import KratosMultiphysics.StructuralMechanicsApplication as KSM
+
+from KratosMultiphysics.StemApplication.uvec_controller import StemUvecController
+from KratosMultiphysics.StemApplication.uvec_trace import read_uvec_trace
+from tests.utils import create_axle_model_parts, create_uvec_settings
+
+TRACE_FILE = "tests/test_data/test_uvec_trace.bin"
+
+
+def run_uvec_steps(controller: StemUvecController, model_part: KratosMultiphysics.ModelPart, uvec_data):
+    """
+    Runs two steps with two iterations of the uvec controller, in which the displacement of the first axle changes
+    each iteration, and collects the load on the loaded condition of the first axle.
+
+    Args:
+        - controller (StemUvecController): the uvec controller
+        - model_part (KratosMultiphysics.ModelPart): the model part containing the axles
+        - uvec_data: the uvec data, in the form of the uvec interface
+
+    Returns:
+        - List[float]: the vertical load on the first axle per call
+    """
+    loaded_condition = model_part.GetSubModelPart("moving_load_cloned_1").GetCondition(2)
+    vertical_loads = []
+    for step in [1, 2]:
+        model_part.ProcessInfo.SetValue(KratosMultiphysics.STEP, step)
+        model_part.ProcessInfo.SetValue(KratosMultiphysics.TIME, 0.1 * step)
+        controller.initialise_solution_step(uvec_data)
+        for iteration in [1, 2]:
+            loaded_condition.SetValue(KratosMultiphysics.DISPLACEMENT, [0.0, -0.001 * (step + iteration), 0.0])
+            controller.update_uvec_from_kratos(uvec_data)
+            uvec_data = controller.execute_uvec_update_kratos(uvec_data)
+            vertical_loads.append(loaded_condition.GetValue(KSM.POINT_LOAD)[1])
+    controller.finalise()
+    return vertical_loads
+
+
+@pytest.mark.parametrize("uvec_method, uvec_interface", [("uvec_json", "json"), ("uvec_python", "python")])
+def test_uvec_trace_record_and_replay(uvec_method: str, uvec_interface: str):
+    """
+    This test checks that each call of the uvec model is recorded to the binary trace, and that the replay interface
+    applies the recorded loads without calling the uvec model.
+    """
+    model = KratosMultiphysics.Model()
+    model_part = create_axle_model_parts(model)
+    uvec_settings = create_uvec_settings(uvec_method, uvec_interface)
+    uvec_settings.AddString("uvec_trace_file", TRACE_FILE)
+    controller = StemUvecController(uvec_settings, model_part)
+    recorded_loads = run_uvec_steps(controller, model_part, controller.create_uvec_data(uvec_settings["uvec_data"]))
+
+    npt.assert_array_almost_equal(recorded_loads, [-1200.0, -1300.0, -1300.0, -1400.0])
+
+    axle_numbers, records = read_uvec_trace(TRACE_FILE)
+    assert sorted(axle_numbers) == ["1", "2"]
+    npt.assert_array_equal(records["step"], [1, 1, 2, 2])
+    npt.assert_array_equal(records["iteration"], [1, 2, 1, 2])
+    npt.assert_array_almost_equal(records["time"], [0.1, 0.1, 0.2, 0.2])
+    first_axle = axle_numbers.index("1")
+    npt.assert_array_almost_equal(records["u"][:, first_axle, 1], [-0.002, -0.003, -0.003, -0.004])
+    npt.assert_array_almost_equal(records["loads"][:, first_axle, 1], recorded_loads)
+
+    # replay in a new model, the uvec model is not loaded
+    model = KratosMultiphysics.Model()
+    model_part = create_axle_model_parts(model)
+    replay_settings = create_uvec_settings("", "replay", uvec_path=TRACE_FILE)
+    controller = StemUvecController(replay_settings, model_part)
+    replayed_loads = run_uvec_steps(controller, model_part, controller.create_uvec_data(replay_settings["uvec_data"]))
+
+    npt.assert_array_almost_equal(replayed_loads, recorded_loads)
+
+    Path(TRACE_FILE).unlink()
@@ -0,0 +1,73 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+import KratosMultiphysics
+
+from KratosMultiphysics.StemApplication.vibration_metrics_output_process import VibrationMetricsOutputProcess
+
+
+def test_vibration_metrics_output_process():
+    """
+    This test checks the vibration metrics of a harmonic velocity of 10 Hz, which is the centre frequency of a
+    one-third octave band, against their analytical values.
+    """
+    model = KratosMultiphysics.Model()
+    model_part = model.CreateModelPart("json_model_part", 1)
+    model_part.AddNodalSolutionStepVariable(KratosMultiphysics.VELOCITY)
+    node = model_part.CreateNewNode(1, 0.0, 0.0, 0.0)
+    model_part.CreateNewNode(2, 1.0, 0.0, 0.0)
+
+    dt = 1e-3
+    model_part.ProcessInfo.SetValue(KratosMultiphysics.DELTA_TIME, dt)
+
+    output_file_name = "tests/test_data/test_vibration_metrics_output.json"
+    parameters = KratosMultiphysics.Parameters(f"""{{
+            "model_part_name": "json_model_part",
+            "output_file_name": "{output_file_name}",
+            "spectrum_window": 1.0,
+            "spectrum_overlap": 0.5,
+            "spectrum_frequency_range": [5.0, 20.0]
+            }}""")
+
+    process = VibrationMetricsOutputProcess(model, parameters)
+    process.ExecuteInitialize()
+    process.ExecuteBeforeSolutionLoop()
+
+    amplitude = 0.01
+    frequency = 10.0
+    for step in range(1, 3001):
+        time = step * dt
+        model_part.ProcessInfo.SetValue(KratosMultiphysics.TIME, time)
+        node.SetSolutionStepValue(KratosMultiphysics.VELOCITY,
+                                  [amplitude * np.sin(2 * np.pi * frequency * time), 0.0, 0.0])
+        process.ExecuteFinalizeSolutionStep()
+    process.ExecuteFinalize()
+
+    with open(output_file_name, 'r') as f:
+        data = json.load(f)
+    Path(output_file_name).unlink()
+
+    npt.assert_array_almost_equal(data["ONE_THIRD_OCTAVE_FREQUENCIES"], [5.012, 6.310, 7.943, 10.0, 12.589, 15.849,
+                                                                         19.953], decimal=3)
+
+    metrics = data["NODE_1"]
+    rms = amplitude / np.sqrt(2)
+    assert metrics["PPV_X"] == pytest.approx(amplitude, rel=1e-3)
+    assert metrics["PPV"] == pytest.approx(amplitude, rel=1e-3)
+    assert metrics["RMS_X"] == pytest.approx(rms, rel=1e-3)
+    # the running mean square with a time constant of 1 s has reached 1 - exp(-3) of its final value
+    assert metrics["MAX_RUNNING_RMS_X"] == pytest.approx(rms * np.sqrt(1 - np.exp(-3)), rel=1e-2)
+
+    # the KB filter weights 10 Hz with 1 / sqrt(1 + (5.6 / 10)^2)
+    assert metrics["VEFF_MAX_X"] == pytest.approx(rms / np.sqrt(1 + (5.6 / frequency) ** 2), rel=5e-2)
+
+    # all energy is within the 10 Hz band
+    npt.assert_allclose(metrics["ONE_THIRD_OCTAVE_X"], [0, 0, 0, rms, 0, 0, 0], rtol=1e-3, atol=1e-8)
+    npt.assert_allclose(metrics["ONE_THIRD_OCTAVE_Y"], np.zeros(7), atol=1e-12)
+
+    # the second node does not move
+    assert data["NODE_2"]["PPV"] == 0.0
+    assert data["NODE_2"]["VEFF_MAX_X"] == 0.0
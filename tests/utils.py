@@ -3,7 +3,9 @@ from typing import Union, Tuple, List
 from pathlib import Path
 
 import KratosMultiphysics as Kratos
-import KratosMultiphysics.StemApplication.geomechanics_analysis as analysis
+import KratosMultiphysics.StructuralMechanicsApplication as KSM
+
+UVEC_PATH = "tests/test_data/input_data_uvec_controller/sample_uvec.py"
 
 
 class Utils:
@@ -19,6 +21,10 @@ class Utils:
 
         """
 
+        # the analysis is only imported when stages are run, such that the model part factories of the unit tests
+        # can be imported without it
+        import KratosMultiphysics.StemApplication.geomechanics_analysis as analysis
+
         cwd = os.getcwd()
 
         # initialize model
@@ -102,3 +108,106 @@ def assert_floats_in_files_almost_equal(exact_file: Union[str, Path],
                 return False, error_message
 
     return True, ""
+
+
+def create_axle_model_parts(model: Kratos.Model, n_axles: int = 2, n_conditions: int = 4,
+                            uvec_model_part: str = "moving_load") -> Kratos.ModelPart:
+    """
+    Creates a model part with an axle sub model part per axle, each containing line conditions along the x-axis. The
+    load of each axle is located at the second condition. If the model part already exists, the axles are added to
+    the existing model part.
+
+    Args:
+        - model (Kratos.Model): the Kratos model
+        - n_axles (int): number of axles
+        - n_conditions (int): number of conditions per axle
+        - uvec_model_part (str): name of the moving load model part of which the axles are cloned
+
+    Returns:
+        - Kratos.ModelPart: the model part
+    """
+    if model.HasModelPart("porous_computational_model_part"):
+        model_part = model.GetModelPart("porous_computational_model_part")
+    else:
+        model_part = model.CreateModelPart("porous_computational_model_part")
+        model_part.ProcessInfo.SetValue(Kratos.DELTA_TIME, 0.1)
+        model_part.ProcessInfo.SetValue(Kratos.TIME, 0.1)
+        model_part.ProcessInfo.SetValue(Kratos.STEP, 1)
+    properties = model_part.GetProperties()[1]
+
+    for node_id in range(model_part.NumberOfNodes() + 1, n_conditions + 2):
+        model_part.CreateNewNode(node_id, float(node_id), 0.0, 0.0)
+
+    condition_id = model_part.NumberOfConditions() + 1
+    for axle_number in range(1, n_axles + 1):
+        axle = model_part.CreateSubModelPart(f"{uvec_model_part}_cloned_{axle_number}")
+        axle.AddNodes(list(range(1, n_conditions + 2)))
+        for index in range(n_conditions):
+            condition = axle.CreateNewCondition("LineLoadCondition2D2N", condition_id, [index + 1, index + 2],
+                                                properties)
+            if index == 1:
+                condition.SetValue(KSM.POINT_LOAD, [0.0, -1.0, 0.0])
+                condition.SetValue(Kratos.DISPLACEMENT, [0.0, -0.001 * axle_number, 0.0])
+            condition_id += 1
+
+    return model_part
+
+
+def create_uvec_settings(uvec_method: str, uvec_interface: str, uvec_path: str = UVEC_PATH,
+                         uvec_model_part: str = "moving_load") -> Kratos.Parameters:
+    """
+    Creates the uvec settings of the solver.
+
+    Args:
+        - uvec_method (str): name of the uvec function
+        - uvec_interface (str): interface between STEM and the uvec model
+        - uvec_path (str): path to the uvec model
+        - uvec_model_part (str): name of the moving load model part of the uvec model
+
+    Returns:
+        - Kratos.Parameters: the uvec settings
+    """
+    return Kratos.Parameters(f"""{{
+            "uvec_path": "{uvec_path}",
+            "uvec_method": "{uvec_method}",
+            "uvec_model_part": "{uvec_model_part}",
+            "uvec_interface": "{uvec_interface}",
+            "uvec_data": {{"dt": 0.0, "u": {{}}, "theta": {{}}, "loads": {{}}, "parameters": {{}}, "state": {{}}}}
+            }}""")
+
+
+def create_triangle_model_part(model: Kratos.Model) -> Kratos.ModelPart:
+    """
+    Creates a model part with two linear elastic triangle elements, where a displacement is prescribed on one node.
+
+    Args:
+        - model (Kratos.Model): the Kratos model
+
+    Returns:
+        - Kratos.ModelPart: the model part
+    """
+    model_part = model.CreateModelPart("json_model_part", 1)
+    model_part.ProcessInfo.SetValue(Kratos.DOMAIN_SIZE, 2)
+    model_part.ProcessInfo.SetValue(Kratos.DELTA_TIME, 0.1)
+    model_part.AddNodalSolutionStepVariable(Kratos.DISPLACEMENT)
+
+    properties = model_part.GetProperties()[1]
+    properties.SetValue(Kratos.YOUNG_MODULUS, 1e6)
+    properties.SetValue(Kratos.POISSON_RATIO, 0.3)
+    properties.SetValue(Kratos.THICKNESS, 1.0)
+    properties.SetValue(Kratos.DENSITY, 1.0)
+    properties.SetValue(Kratos.CONSTITUTIVE_LAW, KSM.LinearElasticPlaneStrain2DLaw())
+
+    model_part.CreateNewNode(1, 0.0, 0.0, 0.0)
+    model_part.CreateNewNode(2, 1.0, 0.0, 0.0)
+    model_part.CreateNewNode(3, 1.0, 1.0, 0.0)
+    model_part.CreateNewNode(4, 0.0, 1.0, 0.0)
+    model_part.CreateNewElement("SmallDisplacementElement2D3N", 1, [1, 2, 3], properties)
+    model_part.CreateNewElement("SmallDisplacementElement2D3N", 2, [1, 3, 4], properties)
+
+    for element in model_part.Elements:
+        element.Initialize(model_part.ProcessInfo)
+
+    model_part.GetNode(3).SetSolutionStepValue(Kratos.DISPLACEMENT, [0.01, 0.02, 0.0])
+
+    return model_part